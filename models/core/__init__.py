@@ -9,6 +9,7 @@ from . import (
     res_partner,
     souscription,
     souscription_campagne,
+    souscription_campagne_mesure,
     souscription_cheque_energie,
     souscription_chronologie,
     souscription_consentement,
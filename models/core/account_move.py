@@ -234,16 +234,19 @@ class AccountMove(models.Model):
         a_regenerer = self.filtered(
             lambda m: m.is_facture_energie and m.state == 'draft' and m._facture_de_la_source() == m
         )
-        for move in a_regenerer:
-            if move.periode_id:
-                move.periode_id._tamponner_provision()
-            move._recomposer_lignes_generees()
+        # En lot (vidange d'émission, #326) : chaque effet passe en UNE étape
+        # sur tout le recordset — tampon groupé, une passe de re-génération,
+        # une recherche FIFO des chèques pour tous les partenaires — dans
+        # l'ordre gravé ci-dessus, qui tient donc aussi entre les moves : tous
+        # les tampons précèdent toutes les re-générations.
+        a_regenerer.periode_id._tamponner_provision()
+        a_regenerer._recomposer_lignes_generees()
+        a_regenerer._retirer_des_recompositions()
 
         posted = super()._post(soft=soft)
         for move in posted.filtered(lambda m: m.regularisation_id):
             move.regularisation_id._solder_provisions()
-        for move in posted.filtered(lambda m: m.is_facture_energie):
-            self.env['souscription.cheque_energie'].imputer(move)
+        self.env['souscription.cheque_energie'].imputer(posted.filtered(lambda m: m.is_facture_energie))
         return posted
 
     def unlink(self):
@@ -265,8 +268,37 @@ class AccountMove(models.Model):
         Producteur de la clé de contexte `souscription_move_unlink` : carte
         complète dans la bannière « Régénération au fil de l'eau » ci-dessous."""
         self = self.with_context(souscription_move_unlink=True)
+        self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+            'facture supprimée', mois=self.periode_id.mapped('mois')
+        )
         return super().unlink()
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Une facture liée à une Période déplace son statut de facturation
+        (« à facturer » -> « facturée ») : mémo de la Campagne à oublier,
+        mois rouvert s'il était clôturé."""
+        moves = super().create(vals_list)
+        if any(vals.get('periode_id') for vals in vals_list):
+            self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+                'facture créée', mois=moves.periode_id.mapped('mois')
+            )
+        return moves
+
+    def write(self, vals):
+        """Postée/remise en brouillon/annulée (`state`) ou re-rattachée
+        (`periode_id`) : le statut de facturation de la Campagne bouge, son
+        mémo transactionnel est oublié et le mois rouvert s'il était
+        clôturé."""
+        if not {'state', 'periode_id'}.intersection(vals):
+            return super().write(vals)
+        mois_avant = self.periode_id.mapped('mois')
+        resultat = super().write(vals)
+        self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+            'facture modifiée', mois=mois_avant + self.periode_id.mapped('mois')
+        )
+        return resultat
+
     # === Régénération au fil de l'eau (#267, carte #364) ===
     #
     # Invariant : le brouillon = sa source à l'instant T + les lignes
@@ -283,6 +315,23 @@ class AccountMove(models.Model):
     #   (d) recalcul régul      -> `souscription.regularisation.action_recalculer`
     #   + filet final à l'émission : `_post()` ci-dessus (ordre : cf. sa docstring)
     #
+    # (a)-(d) ne recomposent pas sur-le-champ : ils PLANIFIENT
+    # (`_planifier_recomposition`) dans une file vidée par le precommit
+    # (`_vider_recompositions`) — énergies, TURPE et relevés d'une Période
+    # écrits dans le même lot recomposent le brouillon UNE fois. Seul
+    # `_post()` reste synchrone (le tampon doit précéder la re-génération,
+    # dans le même événement) et retire ses moves de la file.
+    #
+    # Portée de la déduplication : Odoo joue le precommit à chaque
+    # `cr.flush()`, donc à l'entrée ET à la sortie de tout `cr.savepoint()`
+    # — pas seulement au commit. La file ne déduplique donc qu'à
+    # l'intérieur d'une même portée de savepoint : un lot de pull
+    # (savepoint par lot) et une insertion F15 (savepoint par élément) qui
+    # touchent le même brouillon le recomposent une fois chacun. C'est
+    # voulu : la recomposition planifiée dans un savepoint s'exécute avant
+    # sa libération, et un échec l'annule avec lui (skip-and-report,
+    # ADR 0011) — au lieu de faire tomber le commit de tout le lot.
+    #
     # Clés de contexte (produite par -> consommée par : effet) :
     #   regularisation_tampon        `regularisation._solder_provisions` -> `periode.write` : lève le verrou #14
     #   souscription_tampon_emission `periode._tamponner_provision` -> `periode.write` : évite une double recomposition
@@ -303,7 +352,7 @@ class AccountMove(models.Model):
     # `regularisation._composer_lignes`) pose lui-même le flag de provenance
     # — ce point d'entrée ne fait qu'agréger, résolu par la source.
 
-    def _composer_lignes_generees(self):
+    def _composer_lignes_generees(self, grilles=None):
         """Compose les lignes GÉNÉRÉES de ce move, résolu par sa source.
 
         Source Période (mensuelle) : ses lignes propres (sections,
@@ -312,7 +361,7 @@ class AccountMove(models.Model):
         ``regime_prix_periode`` — la grille engagée, en lockstep avec la
         création, ADR 0032) + les Refacturations actuellement *à
         refacturer* de la Souscription (ADR 0009) — même règle qu'à la
-        création (`souscription._facturer_refacturations`) : une Refacturation
+        création (`souscription.creer_factures`) : une Refacturation
         entrée en file après la création du brouillon est donc rassemblée ici
         si ce move est régénéré à l'émission.
 
@@ -322,11 +371,18 @@ class AccountMove(models.Model):
 
         Vide si ni l'un ni l'autre (facture hors énergie) : n'est jamais
         appelée dans ce cas (cf. `_post`/`_recomposer_lignes_generees`, filtre
-        `is_facture_energie`)."""
+        `is_facture_energie`).
+
+        `grilles` : mémo `{(régime, date de début): grille}` partagé par une
+        passe de re-génération en lot, une résolution par clé."""
         self.ensure_one()
         if self.periode_id:
             periode = self.periode_id
-            grille = self.env['grille.prix'].get_grille_active(periode.date_debut, regime=periode.regime_prix_periode)
+            grilles = {} if grilles is None else grilles
+            cle = (periode.regime_prix_periode, periode.date_debut)
+            if cle not in grilles:
+                grilles[cle] = self.env['grille.prix'].get_grille_active(periode.date_debut, regime=cle[0])
+            grille = grilles[cle]
             lignes = periode._composer_lignes(grille)
             prestas = periode.souscription_id._refacturations_a_rassembler(self)
             return lignes + prestas._composer_lignes_groupees()
@@ -335,36 +391,153 @@ class AccountMove(models.Model):
         return []
 
     def _recomposer_lignes_generees(self):
-        """Recompose PRÉSERVANTE (#266) : supprime les lignes flaguées
-        existantes de CE move puis les remplace par une composition fraîche
-        depuis la source (`_composer_lignes_generees`) — toute ligne NON
-        flaguée (geste commercial en euros, ligne posée par un autre module :
-        arrondi, escompte…) survit intacte. La facture émise = la source à
-        l'instant T + les lignes manuelles (AC #266).
+        """Recompose PRÉSERVANTE (#266) : aligne les lignes flaguées
+        existantes de CE move sur une composition fraîche depuis la source
+        (`_composer_lignes_generees`) — toute ligne NON flaguée (geste
+        commercial en euros, ligne posée par un autre module : arrondi,
+        escompte…) survit intacte. La facture émise = la source à l'instant T
+        + les lignes manuelles (AC #266).
+
+        Par différence, pas par remplacement (`_commandes_lignes_generees`) :
+        une ligne existante appariée à une ligne fraîche n'est réécrite que
+        sur ses champs qui changent, les lignes manquantes sont créées, les
+        disparues supprimées — un brouillon dont une seule quantité bouge ne
+        relance pas le recalcul des taxes, totaux et écritures de toutes ses
+        lignes. Le résultat est le même qu'une recomposition complète.
 
         Source Période : rassemble aussi les Refacturations fraîches (voir
         `_composer_lignes_generees`) et pose leur lien (`facture_id`) —
         même geste que le chemin de création
-        (`souscription._facturer_refacturations`), rejoué ici. Ré-interroger
+        (`souscription.creer_factures`), rejoué ici. Ré-interroger
         la file *après* avoir recomposé les lignes est correct : composer et
         rassembler lisent la même file (`_refacturations_a_rassembler`), et
         rien ne la modifie entre les deux appels dans ce flux synchrone.
 
         Contexte `souscription_regenere_lignes` : lève la garde `ondelete`
-        (#266) pour la suppression, ici, des lignes flaguées qu'on remplace —
-        seule cette méthode (et `unlink()`, cascade) pose ce contexte.
+        (#266) pour la suppression, ici, des lignes flaguées disparues de la
+        source — seule cette méthode (et `unlink()`, cascade) pose ce
+        contexte.
 
         Mécanisme central de la régénération au fil de l'eau (#267) : les 5
         points d'entrée et le protocole de contexte sont cartographiés dans
         la bannière « Régénération au fil de l'eau », plus haut dans ce
-        fichier."""
+        fichier.
+
+        En lot (`_post()` d'un paquet) : une seule suppression des lignes
+        disparues de tous les moves, grilles résolues une fois par (régime,
+        date de début) ; l'écriture des commandes reste une par move
+        (commandes propres à chacun), et aucune pour un move inchangé."""
+        grilles = {}
+        a_supprimer = self.env['account.move.line']
+        commandes_par_move = []
+        for move in self:
+            commandes, disparues = move._commandes_lignes_generees(move._composer_lignes_generees(grilles))
+            commandes_par_move.append((move, commandes))
+            a_supprimer |= disparues
+        a_supprimer.with_context(souscription_regenere_lignes=True).unlink()
+        for move, commandes in commandes_par_move:
+            if commandes:
+                move.write({'invoice_line_ids': commandes})
+            if move.periode_id:
+                move.periode_id.souscription_id._refacturations_a_rassembler(move).facture_id = move
+
+    @staticmethod
+    def _cles_lignes_generees(valeurs):
+        """Clé stable de chaque ligne, dans l'ordre : `(type, section, produit)`
+        — la section est le libellé de la dernière section rencontrée (le
+        sien pour une section), le produit porte le cadran (un produit
+        d'énergie par cadran, `souscription.produit`)."""
+        cles, section = [], False
+        for vals in valeurs:
+            if vals.get('display_type') == 'line_section':
+                section = vals.get('name')
+            cles.append((vals.get('display_type') or 'product', section, vals.get('product_id') or False))
+        return cles
+
+    def _commandes_lignes_generees(self, composees):
+        """Commandes `invoice_line_ids` qui amènent les lignes flaguées de CE
+        move à `composees` (`[(0, 0, vals)]`), et les lignes disparues à
+        supprimer. Appariement par clé (`_cles_lignes_generees`), dans l'ordre
+        d'apparition pour les clés répétées (plusieurs Refacturations du même
+        produit, plusieurs notes d'une section) : `(1, id, changements)` si
+        quelque chose change, rien sinon, `(0, 0, vals)` pour une ligne
+        nouvelle.
+
+        L'ordre des lignes n'est pas réécrit : si l'appariement le
+        bouleverse (ligne nouvelle au milieu du document, lignes appariées
+        dans un autre ordre), repli sur la recomposition complète — toutes
+        les lignes flaguées supprimées, toutes recréées, comme avant."""
         self.ensure_one()
-        self.invoice_line_ids.filtered('souscription_ligne_generee').with_context(
-            souscription_regenere_lignes=True
-        ).unlink()
-        self.write({'invoice_line_ids': self._composer_lignes_generees()})
-        if self.periode_id:
-            self.periode_id.souscription_id._refacturations_a_rassembler(self).facture_id = self
+        existantes = self.invoice_line_ids.filtered('souscription_ligne_generee').sorted(lambda l: (l.sequence, l.id))
+        vals_composees = [vals for _cmd, _id, vals in composees]
+        vals_existantes = [
+            {'display_type': ligne.display_type, 'name': ligne.name, 'product_id': ligne.product_id.id}
+            for ligne in existantes
+        ]
+        disponibles = {}
+        for rang, (cle, ligne) in enumerate(zip(self._cles_lignes_generees(vals_existantes), existantes, strict=True)):
+            disponibles.setdefault(cle, []).append((rang, ligne))
+
+        commandes, dernier_rang, cree = [], -1, False
+        for cle, vals in zip(self._cles_lignes_generees(vals_composees), vals_composees, strict=True):
+            if not disponibles.get(cle):
+                commandes.append((0, 0, vals))
+                cree = True
+                continue
+            rang, ligne = disponibles[cle].pop(0)
+            if cree or rang < dernier_rang:
+                return composees, existantes
+            dernier_rang = rang
+            changements = {
+                nom: valeur
+                for nom, valeur in vals.items()
+                if ligne._fields[nom].convert_to_cache(valeur, ligne)
+                != ligne._fields[nom].convert_to_cache(ligne[nom], ligne)
+            }
+            if changements:
+                commandes.append((1, ligne.id, changements))
+        disparues = self.env['account.move.line'].concat(
+            *(ligne for reste in disponibles.values() for _r, ligne in reste)
+        )
+        return commandes, disparues
+
+    # --- File de recomposition (points d'entrée (a)-(d)) : un ensemble
+    # d'ids rangé dans `cr.precommit.data`, comme le mémo de la Campagne —
+    # vidé au commit comme au rollback, il ne survit jamais à la transaction
+    # qui l'a rempli ; vidé aussi à chaque frontière de savepoint (cf.
+    # « Portée de la déduplication » plus haut). ---
+
+    _CLE_RECOMPOSITION = 'souscriptions_odoo.account_move.a_recomposer'
+
+    def _planifier_recomposition(self):
+        """Met les brouillons de `self` en file : ils seront recomposés UNE
+        fois au prochain precommit — commit, ou entrée/sortie de savepoint —
+        quel que soit le nombre de points d'entrée qui les ont touchés d'ici
+        là. Un move déjà émis est ignoré (même filtre `state == 'draft'`
+        qu'avant la file)."""
+        brouillons = self.filtered(lambda m: m.state == 'draft')
+        if not brouillons:
+            return
+        donnees = self.env.cr.precommit.data
+        if self._CLE_RECOMPOSITION not in donnees:
+            self.env.cr.precommit.add(self.browse()._vider_recompositions)
+        donnees.setdefault(self._CLE_RECOMPOSITION, set()).update(brouillons.ids)
+
+    def _retirer_des_recompositions(self):
+        """Retire `self` de la file : `_post()` vient de le recomposer."""
+        self.env.cr.precommit.data.get(self._CLE_RECOMPOSITION, set()).difference_update(self.ids)
+
+    def _vider_recompositions(self):
+        """Hook de precommit : recompose en une passe les brouillons en
+        file, encore existants et encore brouillons à cet instant (un move
+        supprimé ou émis entre-temps est ignoré), puis flushe — le precommit
+        tourne après le flush du commit (ou du savepoint), ses écritures n'en
+        profitent pas."""
+        ids = self.env.cr.precommit.data.pop(self._CLE_RECOMPOSITION, set())
+        brouillons = self.browse(sorted(ids)).exists().filtered(lambda m: m.state == 'draft')
+        if brouillons:
+            brouillons._recomposer_lignes_generees()
+            self.env.flush_all()
 
     def _verifier_regularisation_emise_immuable(self):
         """Une facture de régularisation ÉMISE est immuable (grill #259) : le
@@ -452,6 +625,24 @@ class AccountMove(models.Model):
             return self.env.ref('souscriptions_odoo.mail_template_facture_energie')
         return super()._get_mail_template()
 
+    def _envoyer_par_campagne(self):
+        """Action de vidange d'« Envoyer factures » : la machinerie NATIVE
+        d'envoi (#314), appelée sur le paquet entier — le rendu PDF y est
+        groupé par rapport (un seul passage wkhtmltopdf pour toutes les
+        factures d'énergie du paquet), d'où l'intérêt du lot face à un envoi
+        facture par facture.
+
+        `allow_raising=True` : un échec LÈVE (`UserError`, texte natif) pour
+        que le harnais de vidange l'isole par dichotomie et le porte au
+        chatter de la facture fautive. Garde finale : une facture restée non
+        envoyée sans erreur native lève aussi — sinon elle serait reprise à
+        chaque passe, sans fin."""
+        self.env['account.move.send']._generate_and_send_invoices(self, allow_raising=True)
+        self.invalidate_recordset(['is_move_sent'])
+        non_envoyees = self.filtered(lambda move: not move.is_move_sent)
+        if non_envoyees:
+            raise UserError(_('Facture(s) non envoyée(s) : %s', ', '.join(non_envoyees.mapped('display_name'))))
+
     # === Encaissement une-clic pour les modes attestation-pure (#290, ADR 0033) ===
     #
     # `monnaie_locale` et `especes` n'ont **aucune** trace bancaire, jamais
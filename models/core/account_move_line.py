@@ -43,8 +43,8 @@ class AccountMoveLine(models.Model):
           `ondelete='cascade'`) reste le geste de correction documenté (#14) ;
         - `souscription_regenere_lignes` : posé par
           `account.move._recomposer_lignes_generees()` — la ré-génération
-          elle-même doit pouvoir supprimer les lignes flaguées qu'elle
-          remplace.
+          elle-même doit pouvoir supprimer les lignes flaguées disparues de
+          la source (ou toutes, quand elle recompose en entier).
 
         Une facture déjà **postée** n'a pas besoin de cette garde :
         l'immutabilité comptable (Odoo core) bloque déjà toute suppression de
@@ -33,15 +33,65 @@ répétaient à l'identique (un seul `_()`, un seul `from exc`). Chaque
 appelant garde son propre appel d'endpoint et sa propre structure ; seul le
 corps du mapping, strictement identique partout, vit ici (ADR 0024, cf.
 amendement).
+
+Cache des flux (opt-in, paramètre système `souscriptions.electricore_cache`) :
+dans une même campagne, le flux `meta_periodes` d'un mois est tiré par le
+pull de facturation puis par les `refresh()` de la Régularisation ; le
+bouton chronologie retire toute la frise à chaque clic. `client()` enveloppe
+alors le client (`ClientEnCache`) : les endpoints en flux
+(`_ENDPOINTS_EN_CACHE`) sont rejoués depuis une pièce jointe (JSONL gzip,
+clé = empreinte de l'endpoint, des paramètres et de l'ensemble de RSC),
+tant qu'elle a moins de `souscriptions.electricore_cache_ttl` secondes. Les
+objets rejoués sont les mêmes modèles typés du contrat
+(`model_validate_json`). Tout le reste (RPC, flux non listés) passe tel
+quel. Écriture et rejeu se font au fil du flux (fichier temporaire gzip) ;
+la lecture ne supprime jamais rien, les entrées périmées partent au cron
+de purge quotidien (`_cron_purger_cache`).
+
+Pool de clients (un par processus) : `client()` rend, pour une même base
+et une même configuration `(url, api_key)`, le MÊME `ElectricoreClient`
+d'un appel à l'autre — ses connexions HTTP keep-alive survivent à l'appel,
+plus de poignée de main TLS par résolution RSC, mois de refresh ou clic
+chronologie. Une entrée par base : un processus qui sert plusieurs bases
+aux réglages electricore différents garde un client pour chacune. Une
+configuration modifiée ne remplace que le client de SA base, au premier
+appel suivant.
+
+Politique de transport (`appeler_avec_reprise`, `ouvrir_flux_avec_reprise`) :
+chaque couture réseau y passe son appel. Un échec transitoire — ingestion
+en cours (verrou base côté electricore), coupure réseau — est retenté
+jusqu'à `_TENTATIVES` fois, après une attente exponentielle bornée et tirée
+au hasard (deux fils ne se recalent pas sur le même instant). Au-delà de
+`_SEUIL_DISJONCTEUR` échecs consécutifs dans le processus, le disjoncteur
+s'ouvre `_DUREE_DISJONCTEUR` secondes : plus aucun appel ne part
+(`DisjoncteurOuvert`, immédiat), le premier appel après ce délai sert de
+sonde. Seul l'appel lui-même est retenté — jamais un flux déjà entamé, dont
+les éléments ont pu être appliqués. Les crons propriétaires se
+re-déclenchent à la reprise (`replanifier_si_transitoire`) au lieu
+d'attendre leur filet quotidien. Aucun paramètre système n'est lu ici :
+la politique tourne aussi dans les fils de tirage, sans base.
 """
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import importlib
+import io
+import json
 import os
-from contextlib import contextmanager
+import random
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
 
-from odoo import _, models
+from odoo import _, api, fields, models
 from odoo.exceptions import UserError
+from odoo.tools import str2bool
+
+from .souscription_campagne_mesure import chronometrer_electricore
 
 try:
     from electricore_client import ContractVersionError, ElectricoreClient, IngestionEnCours
@@ -67,13 +117,43 @@ except ImportError:  # pragma: no cover - exercé par test_electricore_client_fa
         """Repli si `electricore_client` est absent : jamais levée en pratique."""
 
 
+try:
+    from httpx import TransportError as _ErreurTransportHttp
+except ImportError:  # pragma: no cover - httpx vient avec electricore_client
+    _ErreurTransportHttp = ConnectionError
+
+
+class DisjoncteurOuvert(Exception):
+    """Disjoncteur electricore ouvert : appel refusé sans partir sur le
+    réseau. `reste` : secondes avant la prochaine sonde."""
+
+    def __init__(self, echecs, reste):
+        super().__init__(f'{echecs} échecs consécutifs, reprise dans {round(reste)} s')
+        self.echecs = echecs
+        self.reste = reste
+
+
 @contextmanager
 def traduire_exceptions_electricore():
     """Traduit le vocabulaire d'exceptions electricore en UserError
     actionnables. La structure par appelant reste (ADR 0024) — chaque
-    endpoint garde son appel ; seul le corps identique du mapping vit ici."""
+    endpoint garde son appel ; seul le corps identique du mapping vit ici.
+
+    Point de passage commun des échanges electricore, c'est aussi là qu'ils
+    sont comptés pour le journal de performance de la Campagne
+    (`chronometrer_electricore`, sans effet hors mesure)."""
     try:
-        yield
+        with chronometrer_electricore():
+            yield
+    except DisjoncteurOuvert as exc:
+        raise UserError(
+            _(
+                'electricore indisponible (%(echecs)s échecs consécutifs) : réessayez plus tard, '
+                'dans %(minutes)s min au plus tôt.',
+                echecs=exc.echecs,
+                minutes=max(1, round(exc.reste / 60)),
+            )
+        ) from exc
     except IngestionEnCours as exc:
         raise UserError(_("L'ingestion electricore est en cours (verrou base) : réessayez plus tard.")) from exc
     except PreconditionNonRemplie as exc:
@@ -82,12 +162,171 @@ def traduire_exceptions_electricore():
         raise UserError(_('Contrat electricore obsolète : %s', exc)) from exc
 
 
+# --- Politique de transport (cf. docstring du module) ---
+
+_TENTATIVES = 3
+_DELAI_BASE = 1.0
+_DELAI_MAX = 8.0
+_SEUIL_DISJONCTEUR = 5
+_DUREE_DISJONCTEUR = 300
+# Re-déclenchement d'un cron après un échec transitoire, disjoncteur fermé.
+_DELAI_REPLANIFICATION = 15 * 60
+
+# Réseau seulement : connexion et délai dépassé. Pas `OSError` en bloc — une
+# erreur locale (fichier, permission) n'a rien à gagner d'un nouvel essai.
+_ERREURS_TRANSITOIRES = (IngestionEnCours, DisjoncteurOuvert, _ErreurTransportHttp, ConnectionError, TimeoutError)
+
+# État du processus, partagé par les fils de tirage — d'où le verrou.
+_DISJONCTEUR = {'echecs': 0, 'ouvert_jusqua': 0.0}
+_VERROU_DISJONCTEUR = threading.Lock()
+
+
+def _attendre(secondes):
+    time.sleep(secondes)
+
+
+def _verifier_disjoncteur():
+    with _VERROU_DISJONCTEUR:
+        reste = _DISJONCTEUR['ouvert_jusqua'] - time.monotonic()
+        if reste > 0:
+            raise DisjoncteurOuvert(_DISJONCTEUR['echecs'], reste)
+
+
+def _noter_echec():
+    """Compte un échec transitoire ; rend True si le disjoncteur s'ouvre
+    (ou se rouvre, sonde ratée)."""
+    with _VERROU_DISJONCTEUR:
+        _DISJONCTEUR['echecs'] += 1
+        if _DISJONCTEUR['echecs'] < _SEUIL_DISJONCTEUR:
+            return False
+        _DISJONCTEUR['ouvert_jusqua'] = time.monotonic() + _DUREE_DISJONCTEUR
+        return True
+
+
+def _noter_succes():
+    with _VERROU_DISJONCTEUR:
+        _DISJONCTEUR['echecs'] = 0
+        _DISJONCTEUR['ouvert_jusqua'] = 0.0
+
+
+def appeler_avec_reprise(appel):
+    """Exécute `appel()` — un appel electricore idempotent, sans argument —
+    sous la politique de transport : disjoncteur, puis jusqu'à `_TENTATIVES`
+    essais espacés d'une attente exponentielle bornée à gigue pleine. Toute
+    autre erreur (précondition, contrat) remonte au premier essai.
+
+    Raises:
+        DisjoncteurOuvert: disjoncteur déjà ouvert, ou ouvert par cet échec.
+    """
+    for tentative in range(_TENTATIVES):
+        _verifier_disjoncteur()
+        try:
+            resultat = appel()
+        except _ERREURS_TRANSITOIRES as exc:
+            if _noter_echec():
+                with _VERROU_DISJONCTEUR:
+                    echecs = _DISJONCTEUR['echecs']
+                raise DisjoncteurOuvert(echecs, _DUREE_DISJONCTEUR) from exc
+            if tentative + 1 == _TENTATIVES:
+                raise
+            _attendre(random.uniform(0, min(_DELAI_MAX, _DELAI_BASE * 2**tentative)))
+        else:
+            _noter_succes()
+            return resultat
+
+
+@contextmanager
+def ouvrir_flux_avec_reprise(ouvrir):
+    """Même contrat qu'un flux electricore : `ouvrir()` rend le context
+    manager du flux. Seule l'ouverture est retentée (`appeler_avec_reprise`) —
+    une erreur en cours de lecture remonte telle quelle."""
+    with ExitStack() as pile:
+        yield appeler_avec_reprise(lambda: pile.enter_context(ouvrir()))
+
+
+def est_transitoire(exc):
+    """`exc`, ou l'exception qu'elle traduit (`raise ... from`), relève de
+    la politique de transport."""
+    return isinstance(exc, _ERREURS_TRANSITOIRES) or isinstance(exc.__cause__, _ERREURS_TRANSITOIRES)
+
+
+# Endpoints en flux servis par le cache (les seuls appelés depuis le fil
+# principal : les tirages concurrents — `sorties`, `prestations` — ne
+# touchent jamais la base, donc jamais le cache).
+_ENDPOINTS_EN_CACHE = ('meta_periodes', 'chronologie')
+
+# Seuls les modèles de ces paquets sont reconstruits au rejeu : le chemin de
+# classe lu dans la pièce jointe n'importe jamais n'importe quoi.
+_MODULES_REJOUABLES = ('electricore_client',)
+
+# Compteurs du processus (chaque worker a les siens) — `statistiques_cache()`.
+_COMPTEURS_CACHE = {'hits': 0, 'misses': 0}
+_VERROU_COMPTEURS = threading.Lock()
+
+
+# Pool des clients construits, `{base: ((url, api_key), client)}` — partagé
+# par les fils du processus (tirages concurrents de l'amorçage), d'où le
+# verrou. Un client évincé n'est pas fermé ici : un fil peut encore s'en
+# servir, le ramasse-miettes s'en charge.
+_POOL_CLIENTS = {}
+_STATISTIQUES_POOL = {'construits': 0, 'reutilises': 0, 'invalidations': 0}
+_VERROU_POOL = threading.Lock()
+
+
+def _client_du_pool(base, url, api_key):
+    configuration = (url, api_key)
+    with _VERROU_POOL:
+        entree = _POOL_CLIENTS.get(base)
+        if entree is not None:
+            if entree[0] == configuration:
+                _STATISTIQUES_POOL['reutilises'] += 1
+                return entree[1]
+            # Paramètres système de CETTE base modifiés : son ancien client
+            # est mort, ceux des autres bases restent.
+            _STATISTIQUES_POOL['invalidations'] += 1
+        client = ElectricoreClient(url=url, api_key=api_key)
+        _POOL_CLIENTS[base] = (configuration, client)
+        _STATISTIQUES_POOL['construits'] += 1
+        return client
+
+
+def _compter(nature):
+    with _VERROU_COMPTEURS:
+        _COMPTEURS_CACHE[nature] += 1
+
+
+class ClientEnCache:
+    """Enveloppe d'un client electricore : les endpoints de
+    `_ENDPOINTS_EN_CACHE`, appelés par mots-clés, passent par le cache de la
+    fabrique ; tout autre attribut est celui du client."""
+
+    def __init__(self, client, fabrique):
+        self._client = client
+        self._fabrique = fabrique
+
+    def __getattr__(self, nom):
+        cible = getattr(self._client, nom)
+        if nom not in _ENDPOINTS_EN_CACHE:
+            return cible
+
+        def appel(*args, **params):
+            if args:
+                return cible(*args, **params)
+            return self._fabrique._flux_en_cache(nom, cible, params)
+
+        return appel
+
+
 class SouscriptionElectricoreClient(models.AbstractModel):
     _name = 'souscription.electricore.client'
     _description = 'Fabrique unique du client electricore (ADR 0024)'
 
+    _TTL_CACHE_DEFAUT = 6 * 3600
+
     def client(self):
-        """Construit un client electricore configuré.
+        """Rend le client electricore configuré — celui du pool du
+        processus pour cette base et cette configuration
+        (`_client_du_pool`).
 
         Acquis en tête de chaque action appelante (échec rapide et
         déterministe, ADR 0024 §5) : la construction n'ouvre aucune socket,
@@ -117,4 +356,155 @@ class SouscriptionElectricoreClient(models.AbstractModel):
                 'Configuration electricore manquante : renseignez les paramètres système '
                 "'souscriptions.electricore_url' et 'souscriptions.electricore_api_key'."
             )
-        return ElectricoreClient(url=url, api_key=api_key)
+        client = _client_du_pool(self.env.cr.dbname, url, api_key)
+        if str2bool(ICP.get_param('souscriptions.electricore_cache', 'False'), False):
+            return ClientEnCache(client, self)
+        return client
+
+    def replanifier_si_transitoire(self, cron, exc):
+        """Échec transitoire (`est_transitoire`) : re-déclenche `cron` à la
+        reprise — fin du disjoncteur s'il est ouvert, sinon dans
+        `_DELAI_REPLANIFICATION` secondes. Rend la date retenue, ou None si
+        l'échec n'est pas transitoire (le filet quotidien du cron suffit)."""
+        if not est_transitoire(exc):
+            return None
+        with _VERROU_DISJONCTEUR:
+            reste = _DISJONCTEUR['ouvert_jusqua'] - time.monotonic()
+        reprise = fields.Datetime.now() + timedelta(seconds=reste if reste > 0 else _DELAI_REPLANIFICATION)
+        cron._trigger(at=reprise)
+        return reprise
+
+    def statistiques_pool(self):
+        """Clients vivants et compteurs du pool du processus."""
+        with _VERROU_POOL:
+            return dict(_STATISTIQUES_POOL, clients=len(_POOL_CLIENTS))
+
+    # --- Cache des flux (cf. docstring du module) ---
+
+    def statistiques_cache(self):
+        """Compteurs hits/misses du processus, et entrées encore en base."""
+        with _VERROU_COMPTEURS:
+            statistiques = dict(_COMPTEURS_CACHE)
+        statistiques['entrees'] = self.env['ir.attachment'].sudo().search_count([('res_model', '=', self._name)])
+        return statistiques
+
+    def vider_cache(self, endpoint=None, perimees=False):
+        """Invalidation explicite : toutes les entrées, ou celles d'un
+        endpoint ; `perimees` : seulement celles au-delà du TTL (purge du
+        cron, `_cron_purger_cache`)."""
+        domaine = [('res_model', '=', self._name)]
+        if endpoint:
+            domaine.append(('description', '=', endpoint))
+        if perimees:
+            domaine.append(('create_date', '<', self._limite_cache()))
+        self.env['ir.attachment'].sudo().search(domaine).unlink()
+
+    @api.model
+    def _cron_purger_cache(self):
+        """Point d'entrée du cron de purge (`ir_cron_purge_cache_electricore`)
+        : la lecture du cache ne supprime rien — elle peut tourner dans une
+        transaction en lecture seule ou en parallèle d'une autre lecture de
+        la même entrée."""
+        self.vider_cache(perimees=True)
+
+    def _limite_cache(self):
+        """Date de création en deçà de laquelle une entrée est périmée."""
+        return fields.Datetime.now() - timedelta(seconds=self._ttl_cache())
+
+    def _ttl_cache(self):
+        try:
+            return int(
+                self.env['ir.config_parameter']
+                .sudo()
+                .get_param('souscriptions.electricore_cache_ttl', self._TTL_CACHE_DEFAUT)
+            )
+        except ValueError:
+            return self._TTL_CACHE_DEFAUT
+
+    @staticmethod
+    def _cle_cache(endpoint, params):
+        """Empreinte de l'appel : endpoint + paramètres, l'ensemble de RSC
+        trié (même lot, même clé, quel que soit l'ordre d'envoi)."""
+        normalises = {
+            nom: sorted(valeur) if isinstance(valeur, (list, tuple, set)) else valeur for nom, valeur in params.items()
+        }
+        charge = json.dumps({'endpoint': endpoint, **normalises}, sort_keys=True, default=str)
+        return f'{endpoint}-{hashlib.sha256(charge.encode()).hexdigest()}.jsonl.gz'
+
+    @contextmanager
+    def _flux_en_cache(self, endpoint, ouvrir, params):
+        """Même contrat qu'un flux electricore (context manager itérable).
+        Hit : rejeu de la pièce jointe. Miss : le flux réel passe au fil de
+        l'eau et n'est enregistré qu'une fois consommé jusqu'au bout sans
+        erreur — un flux interrompu ou non sérialisable n'est jamais mis en
+        cache. Chaque objet est compressé dans un fichier temporaire dès
+        qu'il passe : la mémoire d'un miss est celle de la pièce jointe
+        compressée, créée en fin de flux, jamais la liste des lignes."""
+        cle = self._cle_cache(endpoint, params)
+        entree = self._entree_cache(cle)
+        if entree:
+            _compter('hits')
+            yield self._rejouer(entree)
+            return
+        _compter('misses')
+        with tempfile.TemporaryFile() as tampon:
+            with gzip.GzipFile(fileobj=tampon, mode='wb') as compresse:
+                etat = {'fichier': compresse, 'serialisable': True, 'complet': False}
+                with ouvrir(**params) as stream:
+                    yield self._enregistrer_au_fil(stream, etat)
+            if etat['complet'] and etat['serialisable']:
+                tampon.seek(0)
+                self.env['ir.attachment'].sudo().create(
+                    {
+                        'name': cle,
+                        'description': endpoint,
+                        'res_model': self._name,
+                        'mimetype': 'application/gzip',
+                        'raw': tampon.read(),
+                    }
+                )
+
+    def _entree_cache(self, cle):
+        """Entrée la plus récente encore dans le TTL — lecture seule, les
+        périmées restent jusqu'à la purge (`_cron_purger_cache`)."""
+        return (
+            self.env['ir.attachment']
+            .sudo()
+            .search(
+                [('res_model', '=', self._name), ('name', '=', cle), ('create_date', '>=', self._limite_cache())],
+                order='id desc',
+                limit=1,
+            )
+        )
+
+    @staticmethod
+    def _enregistrer_au_fil(stream, etat):
+        for objet in stream:
+            if etat['serialisable']:
+                serialiser = getattr(objet, 'model_dump_json', None)
+                if serialiser is None:
+                    etat['serialisable'] = False
+                else:
+                    classe = type(objet)
+                    etat['fichier'].write(f'{classe.__module__}:{classe.__qualname__}\t{serialiser()}\n'.encode())
+            yield objet
+        etat['complet'] = True
+
+    def _rejouer(self, entree):
+        with gzip.GzipFile(fileobj=io.BytesIO(entree.raw)) as contenu:
+            for ligne in contenu:
+                ligne = ligne.decode().rstrip('\n')
+                if not ligne:
+                    continue
+                chemin, donnees = ligne.split('\t', 1)
+                yield self._classe_rejouable(chemin).model_validate_json(donnees)
+
+    @staticmethod
+    def _classe_rejouable(chemin):
+        module, _sep, nom = chemin.partition(':')
+        if not module.startswith(_MODULES_REJOUABLES):
+            raise UserError(_('Cache electricore : type %s non rejouable.', chemin))
+        objet = importlib.import_module(module)
+        for partie in nom.split('.'):
+            objet = getattr(objet, partie)
+        return objet
@@ -20,7 +20,11 @@ from odoo import models
 # `ContractVersionError` n'est plus attrapée ici (le mapping vit dans
 # `traduire_exceptions_electricore()`, #360) mais reste importée : couture de
 # test — `test_rsc_service.py` construit `service_module.ContractVersionError(...)`.
-from .electricore_client_fabrique import ContractVersionError, traduire_exceptions_electricore  # noqa: F401
+from .electricore_client_fabrique import (  # noqa: F401
+    ContractVersionError,
+    appeler_avec_reprise,
+    traduire_exceptions_electricore,
+)
 
 
 class SouscriptionRscService(models.AbstractModel):
@@ -56,5 +60,9 @@ class SouscriptionRscService(models.AbstractModel):
         """Point de transport unique : acquiert le client via la fabrique
         (`souscription.electricore.client`, ADR 0024) et appelle
         `resoudre_rsc`. Seul endroit qui parle réseau — c'est la couture
-        patchée en tests (réponses en boîte, rien d'autre n'est mocké)."""
-        return self.env['souscription.electricore.client'].client().resoudre_rsc(ids)
+        patchée en tests (réponses en boîte, rien d'autre n'est mocké).
+        Appel batch idempotent, retenté sous la politique de transport de la
+        fabrique — le client, lui, est acquis une fois (échec de
+        configuration jamais retenté)."""
+        client = self.env['souscription.electricore.client'].client()
+        return appeler_avec_reprise(lambda: client.resoudre_rsc(ids))
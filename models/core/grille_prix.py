@@ -1,6 +1,9 @@
+from bisect import bisect_right
+
 from dateutil.relativedelta import relativedelta
 from odoo import api, fields, models
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import frozendict, ormcache
 
 # Puissance de référence (kVA) du tarif d'abonnement affine : base à 3 kVA,
 # coefficient appliqué au-delà (ADR 0018).
@@ -90,22 +93,75 @@ class GrillePrix(models.Model):
         if date_facture is None:
             date_facture = fields.Date.today()
 
-        grille = self.search(
-            [
-                ('regime_prix', '=', regime),
-                ('date_debut', '<=', date_facture),
-            ],
-            order='date_debut desc',
-            limit=1,
-        )
+        debuts, ids = self._timeline(regime)
+        rang = bisect_right(debuts, fields.Date.to_date(date_facture)) - 1
 
-        if not grille:
+        if rang < 0:
             raise UserError(
                 f'Aucune grille de prix ({regime}) ne couvre la date {date_facture}. '
                 f'Vérifiez la couverture des grilles (trou de période ?).'
             )
 
-        return grille
+        return self.browse(ids[rang])
+
+    # --- Index en mémoire du processus : une campagne de facturation résout
+    # une grille et ses prix pour chaque Période composée, chaque
+    # re-génération, chaque mois de Régularisation — des lectures pures, les
+    # grilles ne bougeant qu'au fil des saisies du·de la gestionnaire. Mis en
+    # cache (`ormcache`) et invalidés par toute création/écriture/suppression
+    # d'une grille ou d'une ligne (`_invalider_index`) : `registry.clear_cache`
+    # signale l'invalidation aux autres workers au commit. Valeurs immuables,
+    # jamais d'enregistrement (le cache survit à l'environnement). ---
+
+    @api.model
+    @ormcache('regime')
+    def _timeline(self, regime):
+        """`(dates de début triées, ids)` des grilles ACTIVES du régime —
+        support de la recherche dichotomique de `get_grille_active`. Une
+        grille inactive (brouillon dupliqué) reste hors timeline, quel que
+        soit le contexte de l'appelant."""
+        grilles = (
+            self.sudo()
+            .with_context(active_test=True)
+            .search([('regime_prix', '=', regime)], order='date_debut asc, id asc')
+        )
+        return tuple(grilles.mapped('date_debut')), tuple(grilles.ids)
+
+    @ormcache('self.id')
+    def _tables_prix(self):
+        """Tables de prix figées de la grille : `({product_id: prix_interne},
+        {product_id: (prix_base_3kva, coef_kva)})` — énergies et toutes
+        lignes d'un côté, abonnements affines (ADR 0018) de l'autre."""
+        lignes = self.sudo().ligne_ids
+        prix = frozendict({ligne.product_id.id: ligne.prix_interne for ligne in lignes if ligne.product_id})
+        abonnements = frozendict(
+            {
+                ligne.product_id.id: (ligne.prix_base_3kva, ligne.coef_kva)
+                for ligne in lignes
+                if ligne.type_produit == 'abonnement'
+            }
+        )
+        return prix, abonnements
+
+    @api.model
+    def _invalider_index(self):
+        self.env.registry.clear_cache()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        grilles = super().create(vals_list)
+        self._invalider_index()
+        return grilles
+
+    def write(self, vals):
+        resultat = super().write(vals)
+        self._invalider_index()
+        return resultat
+
+    def unlink(self):
+        resultat = super().unlink()
+        self._invalider_index()
+        return resultat
 
     @api.constrains('date_debut')
     def _check_date_debut_premier_du_mois(self):
@@ -195,7 +251,7 @@ class GrillePrix(models.Model):
         """{product_id: prix_interne} pour toute la grille — interne, servi via
         ``composants()`` (ADR 0029)."""
         self.ensure_one()
-        return {ligne.product_id.id: ligne.prix_interne for ligne in self.ligne_ids if ligne.product_id}
+        return self._tables_prix()[0]
 
     def _get_prix_abonnement(self, puissance_kva, tarif_solidaire=False):
         """Prix d'abonnement journalier (€/jour) pour une puissance — interne.
@@ -212,13 +268,13 @@ class GrillePrix(models.Model):
 
         product = self.env['souscription.produit'].produit_abonnement(tarif_solidaire)
 
-        ligne_abo = self.ligne_ids.filtered(lambda l: l.product_id == product and l.type_produit == 'abonnement')
-        if not ligne_abo:
+        tarif = self._tables_prix()[1].get(product.id)
+        if tarif is None:
             type_abo = 'solidaire' if tarif_solidaire else 'standard'
             raise UserError(f"Aucun tarif d'abonnement {type_abo} dans la grille {self.name}.")
 
-        ligne = ligne_abo[0]
-        prix_annuel = ligne.prix_base_3kva + ligne.coef_kva * (float(puissance_kva) - PUISSANCE_BASE_KVA)
+        prix_base_3kva, coef_kva = tarif
+        prix_annuel = prix_base_3kva + coef_kva * (float(puissance_kva) - PUISSANCE_BASE_KVA)
         return prix_annuel / JOURS_PAR_AN
 
     def dupliquer_cette_grille(self):
@@ -329,6 +385,22 @@ class GrillePrixLigne(models.Model):
                 # Énergies : prix interne = prix saisi.
                 ligne.prix_interne = ligne.prix_unitaire or 0.0
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        lignes = super().create(vals_list)
+        self.env['grille.prix']._invalider_index()
+        return lignes
+
+    def write(self, vals):
+        resultat = super().write(vals)
+        self.env['grille.prix']._invalider_index()
+        return resultat
+
+    def unlink(self):
+        resultat = super().unlink()
+        self.env['grille.prix']._invalider_index()
+        return resultat
+
     _unique_produit_grille = models.Constraint(
         'UNIQUE(grille_id, product_id)',
         "Un produit ne peut apparaître qu'une seule fois par grille.",
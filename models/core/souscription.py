@@ -306,17 +306,21 @@ class Souscription(models.Model):
         distinguer de `etat == 'en_service'`, un instantané vivant
         (aujourd'hui), qui sur-compte les Souscriptions entrées après `M` et
         sous-compte celles résiliées depuis (ADR 0025)."""
+        return self.search(self._domaine_perimetre(mois))
+
+    @api.model
+    def _domaine_perimetre(self, mois):
+        """Domaine du Périmètre de campagne du mois (`souscriptions_concernees`),
+        composable — la vidange y ajoute son propre critère."""
         premier_jour = fields.Date.to_date(mois).replace(day=1)
         dernier_jour = premier_jour + relativedelta(day=31)
-        return self.search(
-            [
-                ('ref_situation_contractuelle', '!=', False),
-                ('date_debut', '<=', dernier_jour),
-                '|',
-                ('date_fin', '=', False),
-                ('date_fin', '>=', premier_jour),
-            ]
-        )
+        return [
+            ('ref_situation_contractuelle', '!=', False),
+            ('date_debut', '<=', dernier_jour),
+            '|',
+            ('date_fin', '=', False),
+            ('date_fin', '>=', premier_jour),
+        ]
 
     @api.model_create_multi
     def create(self, vals_list):
@@ -334,7 +338,11 @@ class Souscription(models.Model):
             # antidatant la grâce du poll #89).
             if vals.get('id_affaire') and not vals.get('id_affaire_date_saisie'):
                 vals['id_affaire_date_saisie'] = fields.Date.context_today(self)
-        return super().create(vals_list)
+        souscriptions = super().create(vals_list)
+        self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+            'souscription créée', depuis=souscriptions._debut_perimetre()
+        )
+        return souscriptions
 
     @api.model
     def naitre_depuis_demande(self, demande):
@@ -544,14 +552,71 @@ class Souscription(models.Model):
             {s.id: s.ref_situation_contractuelle for s in self} if 'ref_situation_contractuelle' in vals else None
         )
 
+        perimetre_avant = self._etat_perimetre() if self._CHAMPS_PERIMETRE.intersection(vals) else None
         res = super().write(vals)
 
+        # Le Périmètre de campagne (`souscriptions_concernees`) lit ces
+        # champs : mémo de la partition de la Campagne à oublier, mois clos
+        # dont le Périmètre bouge réellement à rouvrir.
+        if perimetre_avant is not None:
+            self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+                'Périmètre modifié', depuis=self._debut_perimetre_modifie(perimetre_avant)
+            )
+
         if rsc_avant is not None:
             nouvellement_resolues = self.filtered(lambda s: s.ref_situation_contractuelle and not rsc_avant.get(s.id))
             nouvellement_resolues._avancer_demande_valide_sge()
 
         return res
 
+    def unlink(self):
+        self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+            'souscription supprimée', depuis=self._debut_perimetre()
+        )
+        return super().unlink()
+
+    # Champs lus par le Périmètre de campagne (`souscriptions_concernees`) —
+    # `active` compris : la recherche du Périmètre ignore les archivées.
+    _CHAMPS_PERIMETRE = frozenset({'ref_situation_contractuelle', 'date_debut', 'date_fin', 'active'})
+
+    def _debut_perimetre(self):
+        """Premier mois que ces Souscriptions peuvent faire bouger dans un
+        Périmètre de campagne : la plus petite de leurs dates propres
+        (début ou fin de service) — tout mois à partir de là peut changer de
+        Périmètre quand l'une d'elles est créée, modifiée ou supprimée. Une
+        Souscription sans RSC n'est dans aucun Périmètre : ignorée. `False`
+        si aucune date."""
+        dates = [d for s in self.filtered('ref_situation_contractuelle') for d in (s.date_debut, s.date_fin) if d]
+        return min(dates) if dates else False
+
+    def _etat_perimetre(self):
+        """`{id: (dans un Périmètre, date_debut, date_fin)}` — l'état lu par
+        `_debut_perimetre_modifie`, pris avant l'écriture."""
+        return {s.id: (bool(s.ref_situation_contractuelle and s.active), s.date_debut, s.date_fin) for s in self}
+
+    def _debut_perimetre_modifie(self, avant):
+        """Premier mois dont le Périmètre a réellement bougé entre `avant`
+        (`_etat_perimetre`) et maintenant — pas tout l'intervalle de service :
+        une `date_fin` déplacée ne touche que les mois à partir de la plus
+        petite des deux fins (la vide ne compte pas), de même pour
+        `date_debut`. Entrée dans ou sortie de tout Périmètre (RSC acquise ou
+        perdue, archivage) : tout l'intervalle, avant comme après. `False` si
+        rien ne bouge."""
+        dates = []
+        for souscription in self:
+            dedans_avant, debut_avant, fin_avant = avant[souscription.id]
+            dedans, debut, fin = souscription._etat_perimetre()[souscription.id]
+            if not dedans_avant and not dedans:
+                continue
+            if dedans_avant != dedans:
+                dates += [debut_avant, fin_avant, debut, fin]
+                continue
+            for ancienne, nouvelle in ((debut_avant, debut), (fin_avant, fin)):
+                if ancienne != nouvelle:
+                    dates += [ancienne, nouvelle]
+        dates = [d for d in dates if d]
+        return min(dates) if dates else False
+
     def _avancer_demande_valide_sge(self):
         """Auto-move (#90, reciblé #100 ADR 0022 §3 — pas de RSC sans C15
         d'effectivité, RSC résolue ≡ validé sur SGE) : la demande liée avance
@@ -614,7 +679,10 @@ class Souscription(models.Model):
 
     # --- Pull des sorties C15 (#246, ADR 0031 décisions 1-2) ---
 
-    def _pull_sorties_c15_donnees(self):
+    def _perimetre_sorties_c15(self):
+        return self.search([('etat', '!=', 'resiliee'), ('ref_situation_contractuelle', '!=', False)])
+
+    def _pull_sorties_c15_donnees(self, tirage=None):
         """Méthode-données du pull des sorties C15 (#341, ADR 0036 décision
         13) : scope (toutes les Souscriptions non résiliées à RSC résolue,
         quelle que soit la sélection de la liste — même indépendance au
@@ -630,9 +698,10 @@ class Souscription(models.Model):
             `action_tirer_sorties_c15` (toast) et par tout appelant non-UI
             (automate d'amorçage, tests). `erreurs` porte des triplets
             `(libellé, res_model, res_id)` (#366) — les trois autres listes
-            restent des libellés simples."""
-        perimetre = self.search([('etat', '!=', 'resiliee'), ('ref_situation_contractuelle', '!=', False)])
-        return self.env['souscription.pull.meta.periodes.service'].pull_sorties(perimetre)
+            restent des libellés simples. `tirage` : cf. `pull_sorties`."""
+        return self.env['souscription.pull.meta.periodes.service'].pull_sorties(
+            self._perimetre_sorties_c15(), tirage=tirage
+        )
 
     def _toast_sorties_c15(self, ecrites, corrigees, inchangees, erreurs):
         """Toast du pull des sorties C15 (#341) — extrait de
@@ -681,14 +750,19 @@ class Souscription(models.Model):
         renseigné, non archivées — indépendamment de l'existence d'une
         demande, donc les Souscriptions saisies à la main sont couvertes.
         Un seul appel batch. Échec réseau/service : skip silencieux total
-        (aucun état modifié, aucune activité), nouvel essai au poll suivant."""
+        (aucun état modifié, aucune activité), nouvel essai au poll suivant —
+        avancé à la reprise electricore si l'échec est transitoire (verrou
+        d'ingestion, réseau, disjoncteur : `replanifier_si_transitoire`)."""
         cibles = self.search([('etat', '=', 'en_instance'), ('id_affaire', '!=', False), ('active', '=', True)])
         if not cibles:
             return
         try:
             cibles._resoudre_rsc()
-        except Exception:
+        except Exception as exc:
             _logger.warning('Poll RSC : échec réseau/service, nouvel essai au poll suivant.', exc_info=True)
+            self.env['souscription.electricore.client'].replanifier_si_transitoire(
+                self.env.ref('souscriptions_odoo.cron_poll_affaires_enedis'), exc
+            )
             return
         cibles._appliquer_alertes_rsc()
 
@@ -889,10 +963,13 @@ class Souscription(models.Model):
         (l'émission — le geste qui poste et impute le chèque énergie,
         #265 — reste un pas distinct, cf. ``account.move._post``).
 
-        Orchestrateur : pour chaque souscription, boucle sur ses périodes sans
-        facture (garde anti-doublon) et délègue la création à la période
-        (``periode._creer_facture``). La composition des lignes et la création du
-        ``account.move`` vivent désormais sur la Période (ADR 0006).
+        Orchestrateur : rassemble, pour toutes les souscriptions, les périodes
+        sans facture (garde anti-doublon) et délègue la création à la Période,
+        en lot (``periode._creer_factures_lot`` : un seul ``account.move.create``
+        pour tout le recordset — un paquet de vidange entier, #327). La
+        composition des lignes et la création du ``account.move`` vivent sur
+        la Période (ADR 0006) ; ``periode._creer_facture`` reste le chemin
+        unitaire.
 
         Une Période d'ouverture (#107) est déjà facturée côté legacy
         (``facture_legacy_ref``) même si elle n'a pas de ``facture_id`` (pas de
@@ -901,27 +978,39 @@ class Souscription(models.Model):
         """
         _logger.info(f'Créer factures appelé pour {len(self)} souscriptions')
 
+        # En lot (vidange #327, un paquet de souscriptions) : toutes les
+        # périodes à facturer partent dans UN `_creer_factures_lot`. Les
+        # prestations en attente sont rassemblées sur la première facture
+        # de chaque souscription (ADR 0009), posées directement dans le
+        # create ; leur flag (`facture_id`) les retire ensuite de la file.
+        a_facturer = self.env['souscription.periode']
+        prestas_par_periode = {}
         for souscription in self:
             if not souscription.partner_id:
                 _logger.warning(f'Souscription {souscription.name} sans partenaire, ignorée')
                 continue
+            periodes = souscription.periode_ids.filtered(lambda p: not p.facture_id and not p.facture_legacy_ref)
+            if not periodes:
+                continue
+            a_facturer |= periodes
+            prestas = souscription._refacturations_a_rassembler()
+            if prestas:
+                prestas_par_periode[periodes[0].id] = prestas
+
+        try:
+            factures = a_facturer._creer_factures_lot(
+                {periode_id: prestas._composer_lignes_groupees() for periode_id, prestas in prestas_par_periode.items()}
+            )
+        except UserError:
+            raise
+        except Exception as e:
+            _logger.error(f'Erreur création factures pour {len(a_facturer)} périodes: {e}')
+            raise UserError(f'Erreur création factures : {e}') from e
 
-            premiere_facture = self.env['account.move']
-            a_facturer = souscription.periode_ids.filtered(lambda p: not p.facture_id and not p.facture_legacy_ref)
-            for periode in a_facturer:
-                try:
-                    facture = periode._creer_facture()
-                    premiere_facture = premiere_facture or facture
-                    _logger.info(f'Facture {facture.name} créée pour période {periode.mois_annee}')
-                except Exception as e:
-                    _logger.error(f'Erreur création facture pour période {periode.mois_annee}: {e}')
-                    raise UserError(f'Erreur création facture pour {periode.mois_annee}: {e}')
-
-            # Rassemble les prestations en attente sur la première facture émise
-            # ce run, puis les flague (ADR 0009). Le flag les retire de la file,
-            # donc les périodes suivantes ne les re-facturent pas.
-            if premiere_facture:
-                souscription._facturer_refacturations(premiere_facture)
+        for periode, facture in zip(a_facturer, factures, strict=True):
+            _logger.info(f'Facture {facture.name} créée pour période {periode.mois_annee}')
+            if periode.id in prestas_par_periode:
+                prestas_par_periode[periode.id].facture_id = facture
 
     def _refacturations_a_rassembler(self, facture=None):
         """Prestations *à refacturer* de cette Souscription pour `facture` :
@@ -931,8 +1020,9 @@ class Souscription(models.Model):
         Cette seconde branche est ce qui rend la méthode sûre à ré-appeler à
         la re-génération de l'émission (#266, `account.move._composer_lignes_generees`) :
         une presta déjà rassemblée sur CE move par le chemin de création
-        (`_facturer_refacturations`) ne doit pas disparaître de la file
-        seulement parce qu'elle porte déjà `facture_id` — sinon la
+        (`creer_factures`, lignes posées dans `periode._creer_factures_lot`)
+        ne doit pas disparaître de la file seulement parce qu'elle porte déjà
+        `facture_id` — sinon la
         re-génération supprimerait sa ligne (flaguée) sans la recomposer.
         Sans `facture` (défaut, chemin de création : le move n'existe pas
         encore), seules les prestas jamais rassemblées comptent — comportement
@@ -942,17 +1032,6 @@ class Souscription(models.Model):
             lambda p: not p.en_attente and (not p.facture_id or p.facture_id == facture)
         )
 
-    def _facturer_refacturations(self, facture):
-        """Ajoute les prestations *à refacturer* comme lignes de `facture` et
-        pose leur `facture_id`. Responsabilité de la Souscription, pas de la
-        Période (ADR 0009)."""
-        self.ensure_one()
-        prestas = self._refacturations_a_rassembler(facture)
-        if not prestas:
-            return
-        facture.write({'invoice_line_ids': prestas._composer_lignes_groupees()})
-        prestas.facture_id = facture
-
     @api.model
     def ajouter_periodes_mensuelles(self):
         """
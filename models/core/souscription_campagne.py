@@ -19,14 +19,25 @@ test_campagne_catalogue.py`) verrouille ce contrat : prérequis existants, ordre
 topologique, méthodes présentes, clés inconnues refusées.
 """
 
+import hashlib
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
 
+import psycopg2
 from babel.dates import format_date
 from dateutil.relativedelta import relativedelta
 from markupsafe import Markup, escape
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError
-from odoo.tools import is_html_empty
+from odoo.tools import SQL, config, is_html_empty, str2bool
+
+from .electricore_client_fabrique import est_transitoire
+from .souscription_campagne_mesure import chronometrer_unite, fermer_chrono, ouvrir_chrono
+
+_logger = logging.getLogger(__name__)
 
 # Catalogue des étapes (#156, ADR 0025 §1 ; #342, ADR 0036 décision 9) : le DAG
 # est déclaré en code, pas de modèle de configuration ni de moteur de workflow.
@@ -171,6 +182,7 @@ ETAPES_CAMPAGNE = {
         'drill_down': '_drill_down_factures_du_mois',
         'vidange': {
             'liste_travail': '_souscriptions_a_facturer_du_mois',
+            'domaine_travail': '_domaine_souscriptions_a_facturer',
             'action': 'creer_factures',
             'ok': '_souscriptions_facturees_ou_emises_du_mois',
             'message_echec': 'Création de facture impossible',
@@ -209,6 +221,7 @@ ETAPES_CAMPAGNE = {
         'drill_down': '_drill_down_factures_du_mois',
         'vidange': {
             'liste_travail': '_factures_brouillon_du_mois',
+            'domaine_travail': '_domaine_factures_brouillon',
             'action': 'action_post',
             'ok': '_factures_postees_du_mois',
             'message_echec': 'Émission impossible',
@@ -262,6 +275,14 @@ ETAPES_CAMPAGNE = {
     # fusionnées (une adresse mail invalide ne doit jamais pouvoir faire
     # échouer, ni a fortiori faire rollback, le gel comptable d'un lot
     # entier, cf. #268).
+    #
+    # Tâche de fond, troisième client du harnais de vidange (après
+    # `emettre_factures`/`creer_factures`) : rendre et envoyer tout le mois
+    # dans la requête HTTP dépassait son délai. Le bouton pose l'intention,
+    # le cron dédié envoie par paquets (rendu PDF groupé par paquet, cf.
+    # `account.move._envoyer_par_campagne`) ; `echecs_au_journal` porte en
+    # plus la liste des factures restées non envoyées, avec lien, au
+    # journal de la Campagne.
     'envoyer_factures': {
         'label': 'Envoyer factures',
         'type': 'derive',
@@ -271,6 +292,15 @@ ETAPES_CAMPAGNE = {
         'reste_a_faire': '_factures_a_envoyer_du_mois',
         'action': 'action_envoyer_factures',
         'drill_down': '_drill_down_factures_du_mois',
+        'vidange': {
+            'liste_travail': '_factures_a_envoyer_du_mois',
+            'domaine_travail': '_domaine_factures_a_envoyer',
+            'action': '_envoyer_par_campagne',
+            'ok': '_factures_envoyees_du_mois',
+            'message_echec': 'Envoi impossible',
+            'libelle_reussite': 'Envoyées',
+            'echecs_au_journal': True,
+        },
     },
     'regulariser_clotures': {
         'label': 'Régulariser les clôtures',
@@ -379,6 +409,19 @@ class SouscriptionCampagneFacturation(models.Model):
 
     note_ids = fields.One2many('souscription.campagne.note', 'campagne_id', string='Notes')
 
+    # Journal de performance (panneau « Performance ») : une mesure par
+    # pull, paquet de vidange ou action d'étape — cf. `Etape._mesurer`.
+    mesure_ids = fields.One2many('souscription.campagne.mesure', 'campagne_id', string='Mesures')
+
+    # Curseur du pull méta-périodes repris (amorçage en cron) : dernière RSC
+    # d'une tranche committée, mois tiré, nombre de tranches committées,
+    # empreinte du périmètre de RSC tiré. Technique, remis à zéro au bout du
+    # pull — cf. `_pull_meta_periodes_donnees`.
+    pull_meta_curseur_rsc = fields.Char(readonly=True, copy=False)
+    pull_meta_curseur_mois = fields.Date(readonly=True, copy=False)
+    pull_meta_curseur_lot = fields.Integer(readonly=True, copy=False)
+    pull_meta_curseur_perimetre = fields.Char(readonly=True, copy=False)
+
     # Lettre du mois (#313, ADR 0034) : TOUT l'éditorial du mail de facture —
     # dates du mois, evergreen (tarif solidaire, permanences, bénévoles),
     # rappels — jamais un encart. Reportée depuis la campagne précédente à la
@@ -408,6 +451,20 @@ class SouscriptionCampagneFacturation(models.Model):
         string='Total émis TTC', compute='_compute_stats_bandeau', currency_field='currency_id'
     )
 
+    # --- Clôture de campagne : une fois toutes les étapes faites, le mois est
+    # fermé et ses chiffres (bandeau, décompte des factures, reste-à-faire de
+    # chaque étape) sont FIGÉS dans un instantané persisté — la liste des
+    # campagnes (l'historique) et la fiche d'un mois clos ne rejouent plus la
+    # partition à chaque lecture. Seule entorse assumée au « tout dérivé »
+    # d'ADR 0025 : un instantané, jamais une source de vérité — il est jeté
+    # dès qu'une écriture tardive touche le mois (réouverture automatique,
+    # cf. `_signaler_changement_facturation`) ou sur demande explicite
+    # (`action_rouvrir`). ---
+    cloturee = fields.Boolean(string='Clôturée', readonly=True, copy=False)
+    cloturee_le = fields.Datetime(string='Clôturée le', readonly=True, copy=False)
+    cloturee_par_id = fields.Many2one('res.users', string='Clôturée par', readonly=True, copy=False)
+    instantane_cloture = fields.Json(string='Instantané de clôture', readonly=True, copy=False)
+
     # Colonne « Étapes faites (X/Y) » de la liste des campagnes (#301) :
     # lecture de l'historique sans ouvrir chaque mois — Char plutôt que deux
     # Integer, plus simple à afficher tel quel dans la liste.
@@ -549,6 +606,76 @@ class SouscriptionCampagneFacturation(models.Model):
     # compteurs reste-à-faire, tous recalculés à la volée depuis
     # souscription.periode / account.move (ADR 0025 §2). ---
 
+    # --- Mémo transactionnel de la partition (bandeau, matrice, drill-downs) :
+    # un seul rendu de la Campagne relit la partition des buckets et les
+    # factures du mois une fois par étape dérivée, par tuile, par compteur —
+    # mémorisés, jamais persistés (ADR 0025 §2). Rangés dans
+    # `cr.precommit.data`, que le curseur vide à CHAQUE `cr.flush()` : au
+    # commit, mais aussi à l'entrée et à la sortie de tout savepoint, et au
+    # rollback d'un savepoint (`precommit.clear()`). Le mémo ne vaut donc
+    # que d'une frontière de savepoint à la suivante — un rendu, un compute,
+    # une action de drill-down — et jamais d'une unité à l'autre d'un paquet
+    # de vidange. Sans coût : la vidange ne lit pas la partition par unité
+    # (elle compte et réserve sur `_domaine_de_travail`, cf.
+    # `_reserver_paquet`), seule `_notifier_fin` relit les buckets, une fois
+    # en fin de vidange. Invalidé explicitement par les écritures qui
+    # déplacent un statut (Période, état/lien d'une facture, legacy ref,
+    # Périmètre de la Souscription), cf. `_invalider_memo_facturation`. ---
+
+    _CLE_MEMO_FACTURATION = 'souscriptions_odoo.campagne.memo_facturation'
+
+    def _memo_facturation(self, nature, calcul):
+        """Rend le mémo `nature` de la campagne jusqu'au prochain flush du
+        curseur (cf. bloc ci-dessus), en le calculant via `calcul()` (liste
+        d'ids ou dict d'ids) au premier appel. Clé par environnement (`uid`, `su`) : les règles d'accès d'un
+        autre utilisateur peuvent voir un autre Périmètre."""
+        self.ensure_one()
+        memo = self.env.cr.precommit.data.setdefault(self._CLE_MEMO_FACTURATION, {})
+        cle = (nature, self.id, self.env.uid, self.env.su)
+        if cle not in memo:
+            memo[cle] = calcul()
+        return memo[cle]
+
+    @api.model
+    def _invalider_memo_facturation(self):
+        """Oublie tout le mémo de la transaction — appelé par les écritures
+        qui peuvent changer un statut de facturation ou le Périmètre. Grain
+        volontairement grossier (tout le mémo, toutes campagnes) : une
+        invalidation coûte un `dict.pop`, recalculer coûte deux requêtes."""
+        self.env.cr.precommit.data.pop(self._CLE_MEMO_FACTURATION, None)
+
+    @api.model
+    def _signaler_changement_facturation(self, motif, mois=(), depuis=None):
+        """Point unique des écritures qui peuvent déplacer un statut de
+        facturation ou le Périmètre (Période, facture, Souscription) : oublie
+        le mémo de la transaction, puis rouvre les campagnes CLÔTURÉES dont le
+        mois est touché — `mois` (dates quelconques du mois, `False` ignoré)
+        et/ou tout mois à partir de `depuis` (un Périmètre qui bouge touche
+        tous les mois suivants). Un mois clos dont l'instantané serait
+        périmé ne doit jamais s'afficher : la réouverture est le seul filet,
+        et elle ne coûte qu'une recherche sur les campagnes closes."""
+        self._invalider_memo_facturation()
+        premiers = {fields.Date.to_date(m).replace(day=1) for m in mois if m}
+        if not premiers and not depuis:
+            return
+        domaine = [('cloturee', '=', True)]
+        if premiers and depuis:
+            domaine += [
+                '|',
+                ('mois', 'in', sorted(premiers)),
+                ('mois', '>=', fields.Date.to_date(depuis).replace(day=1)),
+            ]
+        elif premiers:
+            domaine += [('mois', 'in', sorted(premiers))]
+        else:
+            domaine += [('mois', '>=', fields.Date.to_date(depuis).replace(day=1))]
+        # sudo : l'écriture tardive vient de qui a le droit de toucher la
+        # Période/la facture, pas forcément la Campagne — la réouverture
+        # reste signée par cet·te utilisateur·rice (même uid).
+        campagnes = self.sudo().search(domaine)
+        if campagnes:
+            campagnes._rouvrir(_('Réouverture automatique : %s.', motif))
+
     def _souscriptions_facturables(self):
         """Souscriptions concernées par la campagne : le Périmètre de
         campagne du mois (CONTEXT.md « Périmètre de campagne ») — recouvrement
@@ -561,7 +688,9 @@ class SouscriptionCampagneFacturation(models.Model):
         """Statut de facturation dérivé de `(souscription, mois de la
         campagne)` — à tirer / à facturer / facturée / émise (#157). Aucun
         champ stocké : rejoué à chaque appel depuis
-        `souscription.periode.mois`/`facture_id`/`facture_state`.
+        `souscription.periode.mois`/`facture_id`/`facture_state`, via le
+        classement ensembliste (`_statuts_facturation`) restreint à une seule
+        souscription — une seule règle, jamais deux lectures qui divergent.
 
         ponytail: vocabulaire PRD tel quel (à tirer/à facturer/facturée/
         émise) — l'alignement avec le vocabulaire prod sale_order.invoice_status
@@ -569,26 +698,54 @@ class SouscriptionCampagneFacturation(models.Model):
         follow-up possible si besoin de convergence de vocabulaire un jour.
         """
         self.ensure_one()
-        periode = self.env['souscription.periode'].search(
-            [
-                ('souscription_id', '=', souscription.id),
-                ('mois', '=', self.mois),
-                ('type_periode', '=', 'mensuelle'),
-            ],
-            limit=1,
+        return self._statuts_facturation(souscription)[souscription.id]
+
+    def _statuts_facturation(self, souscriptions):
+        """Classe `souscriptions` par statut de facturation du mois de la
+        campagne en UNE requête SQL (LEFT JOIN période mensuelle du mois ->
+        facture), au lieu d'une recherche de Période par souscription :
+        rend `{souscription_id: statut}`, une entrée par souscription.
+
+        Même règle que l'ancien classement unitaire, dans le même ordre :
+        pas de Période -> à tirer ; facture legacy (#107, ADR 0023 décision
+        3 — Période d'ouverture backfillée, facture émise dans l'ancien
+        système, `facture_id` restera vide, ADR 0004) -> émise, statut
+        terminal (sinon comptée « à facturer » à vie, cf. #284) ; pas de
+        facture -> à facturer ; facture postée -> émise, sinon facturée.
+
+        Le SQL lit les colonnes stockées : flush préalable des champs lus
+        (dont `facture_id`, compute stocké — le flush le recalcule) pour ne
+        jamais classer sur un état périmé du cache ORM."""
+        self.ensure_one()
+        if not souscriptions:
+            return {}
+        self.env['souscription.periode'].flush_model(
+            ['souscription_id', 'mois', 'type_periode', 'facture_id', 'facture_legacy_ref']
+        )
+        self.env['account.move'].flush_model(['state'])
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT s.id,
+                       CASE
+                           WHEN p.id IS NULL THEN 'a_tirer'
+                           WHEN COALESCE(p.facture_legacy_ref, '') != '' THEN 'emise'
+                           WHEN p.facture_id IS NULL THEN 'a_facturer'
+                           WHEN m.state = 'posted' THEN 'emise'
+                           ELSE 'facturee'
+                       END
+                  FROM unnest(%(ids)s::int[]) AS s(id)
+             LEFT JOIN souscription_periode p
+                    ON p.souscription_id = s.id
+                   AND p.mois = %(mois)s
+                   AND p.type_periode = 'mensuelle'
+             LEFT JOIN account_move m ON m.id = p.facture_id
+                """,
+                ids=list(souscriptions.ids),
+                mois=self.mois,
+            )
         )
-        if not periode:
-            return 'a_tirer'
-        # Période d'ouverture (#107, ADR 0023 décision 3) : facture legacy déjà
-        # créée ET émise dans l'ancien système (Odoo 17), sans account.move ici
-        # (`facture_id` restera vide, ADR 0004). Statut terminal — sinon elle
-        # reste comptée « à facturer » à vie, comme `creer_factures()` le sait
-        # déjà côté action (#284) mais le compteur dérivé l'ignorait.
-        if periode.facture_legacy_ref:
-            return 'emise'
-        if not periode.facture_id:
-            return 'a_facturer'
-        return 'emise' if periode.facture_state == 'posted' else 'facturee'
+        return dict(self.env.cr.fetchall())
 
     # Statuts de facturation, dans l'ordre du cycle (#157). Le reste-à-faire
     # d'une étape dérivée = toutes les souscriptions pas encore parvenues au
@@ -606,26 +763,37 @@ class SouscriptionCampagneFacturation(models.Model):
         `_CIBLE_PAR_ETAPE_DERIVEE`). Feed aussi bien le compteur affiché
         (`nb_reste_a_faire`) que le drill-down.
 
-        ponytail: une requête par souscription facturable (échelle facturiste —
-        dizaines/centaines, pas un flux temps réel) ; upgrade en une seule
-        requête SQL groupée si ça devient lent un jour."""
+        Union des buckets exacts amont (`_souscriptions_par_bucket`) : coût
+        constant en requêtes, quelle que soit la taille du Périmètre."""
         self.ensure_one()
         cible = ETAPES_CAMPAGNE.get(code, {}).get('cible_statut')
         if not cible:
             return self.env['souscription.souscription']
-        pas_encore = set(self._STATUTS_ORDONNES[: self._STATUTS_ORDONNES.index(cible)])
-        cibles = self._souscriptions_facturables()
-        return cibles.filtered(lambda s: self._statut_facturation(s) in pas_encore)
+        buckets = self._souscriptions_par_bucket()
+        reste = self.env['souscription.souscription']
+        for statut in self._STATUTS_ORDONNES[: self._STATUTS_ORDONNES.index(cible)]:
+            reste |= buckets[statut]
+        return reste
 
     def _factures_du_mois(self):
-        """Factures (account.move) des périodes du mois de la campagne."""
+        """Factures (account.move) des périodes du mois de la campagne —
+        mémorisées pour la transaction (cf. `_memo_facturation`)."""
         self.ensure_one()
-        periodes = self.env['souscription.periode'].search([('mois', '=', self.mois), ('facture_id', '!=', False)])
-        return periodes.facture_id
 
-    @api.depends('mois')
+        def calcul():
+            periodes = self.env['souscription.periode'].search([('mois', '=', self.mois), ('facture_id', '!=', False)])
+            return periodes.facture_id.ids
+
+        return self.env['account.move'].browse(self._memo_facturation('factures', calcul))
+
+    @api.depends('mois', 'cloturee')
     def _compute_stats_factures(self):
         for campagne in self:
+            if campagne.cloturee and campagne.instantane_cloture:
+                bandeau = campagne.instantane_cloture['bandeau']
+                campagne.nb_factures_creees = bandeau['nb_factures_creees']
+                campagne.nb_factures_emises = bandeau['nb_factures_emises']
+                continue
             factures = campagne._factures_du_mois()
             campagne.nb_factures_creees = len(factures)
             campagne.nb_factures_emises = len(factures.filtered(lambda f: f.state == 'posted'))
@@ -647,21 +815,32 @@ class SouscriptionCampagneFacturation(models.Model):
         facturation (#301) — une souscription dans exactement un bucket,
         contrairement au reste-à-faire cumulatif (#157, `_reste_a_faire`).
 
-        ponytail: une requête par souscription facturable, même échelle que
-        `_reste_a_faire` — upgrade en une seule requête groupée si ça devient
-        lent un jour."""
+        Deux requêtes en tout, indépendamment de la taille du Périmètre : le
+        Périmètre lui-même (`_souscriptions_facturables`) puis son classement
+        ensembliste (`_statuts_facturation`). L'ordre du Périmètre est
+        conservé dans chaque bucket. Mémorisé pour la transaction (cf.
+        `_memo_facturation`) : les étapes dérivées, les tuiles et les
+        drill-downs d'un même rendu ne repaient pas ces deux requêtes."""
         self.ensure_one()
-        buckets = {statut: self.env['souscription.souscription'] for statut in self._STATUTS_ORDONNES}
-        for souscription in self._souscriptions_facturables():
-            buckets[self._statut_facturation(souscription)] |= souscription
-        return buckets
+
+        def calcul():
+            perimetre = self._souscriptions_facturables()
+            statuts = self._statuts_facturation(perimetre)
+            ids_par_statut = {statut: [] for statut in self._STATUTS_ORDONNES}
+            for souscription_id in perimetre.ids:
+                ids_par_statut[statuts[souscription_id]].append(souscription_id)
+            return ids_par_statut
+
+        Souscription = self.env['souscription.souscription']
+        ids_par_statut = self._memo_facturation('buckets', calcul)
+        return {statut: Souscription.browse(ids) for statut, ids in ids_par_statut.items()}
 
     # --- Listes de travail de la vidange (#342, ADR 0036 décision 9 — clé
     # `vidange.liste_travail`/`vidange.ok` du catalogue) : nommées par la
     # Campagne, lues génériquement par `SouscriptionCampagneEtape` (liste
     # complète, non limitée — l'appelant tranche `[:limit]`). Remplacent les
     # anciennes branches `if self.code == 'creer_factures'` de
-    # `_liste_de_travail`/`_compter_liste_de_travail`/`_notifier_fin`. ---
+    # `_liste_de_travail`/`_notifier_fin`. ---
 
     def _souscriptions_a_facturer_du_mois(self):
         """Travail restant pour « Créer factures » : le bucket EXACT « à
@@ -702,9 +881,56 @@ class SouscriptionCampagneFacturation(models.Model):
         self.ensure_one()
         return self._factures_du_mois().filtered(lambda f: f.state == 'posted' and not f.is_move_sent)
 
-    @api.depends('mois')
+    # --- Mêmes listes de travail, en domaine sur l'état courant (clé
+    # `vidange.domaine_travail`) : `(modèle, domaine)` que la vidange
+    # sélectionne et verrouille en une requête (`_reserver_paquet`), sans
+    # reclasser tout le mois à chaque paquet. ---
+
+    def _domaine_souscriptions_a_facturer(self):
+        """Bucket « à facturer » : du Périmètre, avec une Période mensuelle du
+        mois sans facture ni facture legacy (cf. `_statuts_facturation`)."""
+        self.ensure_one()
+        Souscription = self.env['souscription.souscription']
+        return Souscription, Souscription._domaine_perimetre(self.mois) + [
+            (
+                'periode_ids',
+                'any',
+                [
+                    ('mois', '=', self.mois),
+                    ('type_periode', '=', 'mensuelle'),
+                    ('facture_id', '=', False),
+                    ('facture_legacy_ref', 'in', [False, '']),
+                ],
+            )
+        ]
+
+    def _domaine_factures_du_mois(self):
+        self.ensure_one()
+        return [('move_type', '=', 'out_invoice'), ('periode_id.mois', '=', self.mois)]
+
+    def _domaine_factures_brouillon(self):
+        return self.env['account.move'], self._domaine_factures_du_mois() + [('state', '=', 'draft')]
+
+    def _domaine_factures_a_envoyer(self):
+        return self.env['account.move'], self._domaine_factures_du_mois() + [
+            ('state', '=', 'posted'),
+            ('is_move_sent', '=', False),
+        ]
+
+    def _factures_envoyees_du_mois(self):
+        """Réussites d'« Envoyer factures » pour la notification de fin : les
+        factures postées du mois déjà envoyées."""
+        self.ensure_one()
+        return self._factures_du_mois().filtered(lambda f: f.state == 'posted' and f.is_move_sent)
+
+    @api.depends('mois', 'cloturee')
     def _compute_stats_bandeau(self):
         for campagne in self:
+            if campagne.cloturee and campagne.instantane_cloture:
+                bandeau = campagne.instantane_cloture['bandeau']
+                for nom_champ in campagne._CHAMPS_BANDEAU_FIGES:
+                    campagne[nom_champ] = bandeau[nom_champ]
+                continue
             buckets = campagne._souscriptions_par_bucket()
             campagne.nb_a_tirer = len(buckets['a_tirer'])
             campagne.nb_a_facturer = len(buckets['a_facturer'])
@@ -714,6 +940,104 @@ class SouscriptionCampagneFacturation(models.Model):
             factures_emises = campagne._factures_du_mois().filtered(lambda f: f.state == 'posted')
             campagne.total_emis_ttc = sum(factures_emises.mapped('amount_total'))
 
+    # --- Clôture de campagne (cf. les champs `cloturee`/`instantane_cloture`) ---
+
+    # Chiffres du bandeau figés à la clôture (`_compute_stats_bandeau`), plus
+    # le décompte des factures de la liste des campagnes
+    # (`_compute_stats_factures`).
+    _CHAMPS_BANDEAU_FIGES = (
+        'nb_perimetre',
+        'nb_a_tirer',
+        'nb_a_facturer',
+        'nb_facturees_brouillon',
+        'nb_emises_bucket',
+        'total_emis_ttc',
+    )
+
+    def _instantane_a_figer(self):
+        """Chiffres vivants à figer : bandeau, décompte des factures et
+        reste-à-faire par étape (code -> nombre). Relus à frais (cache ORM
+        invalidé) : jamais un compteur calculé avant la dernière écriture."""
+        self.ensure_one()
+        self.invalidate_recordset(list(self._CHAMPS_BANDEAU_FIGES) + ['nb_factures_creees', 'nb_factures_emises'])
+        self.etape_ids.invalidate_recordset(['nb_reste_a_faire', 'fait'])
+        bandeau = {nom_champ: self[nom_champ] for nom_champ in self._CHAMPS_BANDEAU_FIGES}
+        bandeau.update(nb_factures_creees=self.nb_factures_creees, nb_factures_emises=self.nb_factures_emises)
+        return {
+            'bandeau': bandeau,
+            'etapes': {etape.code: etape.nb_reste_a_faire for etape in self.etape_ids},
+        }
+
+    def _etapes_non_faites(self):
+        self.ensure_one()
+        self.etape_ids.invalidate_recordset(['nb_reste_a_faire', 'fait'])
+        return self.etape_ids.filtered(lambda e: not e.fait)
+
+    def _cloturer(self):
+        """Fige l'instantané et ferme le mois, trace au journal de campagne
+        (#366) sous l'identité courante — même idiome que les fins de
+        passe."""
+        self.ensure_one()
+        instantane = self._instantane_a_figer()
+        self.write(
+            {
+                'cloturee': True,
+                'cloturee_le': fields.Datetime.now(),
+                'cloturee_par_id': self.env.user.id,
+                'instantane_cloture': instantane,
+            }
+        )
+        bandeau = instantane['bandeau']
+        self._poster_recap_journal(
+            _('Clôture de la campagne'),
+            [
+                _('Périmètre : %s', bandeau['nb_perimetre']),
+                _('Émises : %s', bandeau['nb_emises_bucket']),
+                _('Total émis TTC : %s', bandeau['total_emis_ttc']),
+            ],
+        )
+
+    def _cloturer_si_terminee(self):
+        """Clôture automatique : toute campagne ouverte dont TOUTES les étapes
+        sont faites est close sur-le-champ. Appelée en fin de geste (bouton
+        d'étape, validation d'une porte, fin de vidange) — jamais depuis un
+        compute."""
+        for campagne in self.filtered(lambda c: not c.cloturee):
+            if not campagne._etapes_non_faites():
+                campagne._cloturer()
+
+    def _rouvrir(self, motif):
+        """Jette l'instantané : les chiffres redeviennent dérivés à la volée.
+        `motif` est tracé au journal de campagne."""
+        for campagne in self.filtered('cloturee'):
+            campagne.write(
+                {'cloturee': False, 'cloturee_le': False, 'cloturee_par_id': False, 'instantane_cloture': False}
+            )
+            campagne._poster_recap_journal(_('Réouverture de la campagne'), [motif])
+
+    def action_cloturer(self):
+        """Bouton « Clôturer » : même règle que la clôture automatique, mais
+        dit pourquoi quand le mois ne peut pas encore être fermé (ex. un
+        prélèvement encore dû, que rien ne vient re-tester tout seul)."""
+        self.ensure_one()
+        if self.cloturee:
+            return True
+        non_faites = self._etapes_non_faites()
+        if non_faites:
+            raise UserError(
+                _(
+                    'Impossible de clôturer la campagne : étapes pas encore faites — %s.',
+                    ', '.join(ETAPES_CAMPAGNE[code]['label'] for code in non_faites.mapped('code')),
+                )
+            )
+        self._cloturer()
+        return True
+
+    def action_rouvrir(self):
+        self.ensure_one()
+        self._rouvrir(_('Réouverture manuelle.'))
+        return True
+
     # --- Drill-down des tuiles du bandeau (#301) : chaque tuile ouvre la
     # liste filtrée exacte qu'elle affiche — un helper générique par nature de
     # cible (souscriptions / factures), aucune logique de bucket dupliquée
@@ -892,7 +1216,7 @@ class SouscriptionCampagneFacturation(models.Model):
         rendre le MÊME toast que le bouton autonome (`_toast_sorties_c15`,
         extrait pour ne pas dupliquer son formatage)."""
         self.ensure_one()
-        ecrites, corrigees, inchangees, erreurs = self._pull_sorties_c15_donnees()
+        ecrites, corrigees, inchangees, erreurs = self._executer_donnees('pull_sorties_c15')
         self._poster_recap_journal(
             ETAPES_CAMPAGNE['pull_sorties_c15']['label'],
             [
@@ -926,6 +1250,7 @@ class SouscriptionCampagneFacturation(models.Model):
         self.ensure_one()
         cibles = self.env['souscription.souscription'].search([('etat', '=', 'en_attente_cloture')])
         emises, ignorees, erreurs = [], [], []
+        regularisations = self.env['souscription.regularisation']
         for souscription in cibles:
             periode_cloture = souscription._periode_cloture()
             if not periode_cloture or not (periode_cloture.facture_id or periode_cloture.facture_legacy_ref):
@@ -933,8 +1258,19 @@ class SouscriptionCampagneFacturation(models.Model):
                 continue
             try:
                 with self.env.cr.savepoint():
-                    regularisation = souscription._regularisation_brouillon()
-                    regularisation._recalculer()
+                    regularisations |= souscription._regularisation_brouillon()
+            except Exception as exc:
+                erreurs.append(f'{souscription.name} : {exc}')
+        # Recalcul en lot : un flux de rafraîchissement par mois pour toute
+        # la file, plus un par (souscription, mois).
+        echecs = dict(regularisations._recalculer_en_lot())
+        for regularisation in regularisations:
+            souscription = regularisation.souscription_id
+            if regularisation in echecs:
+                erreurs.append(f'{souscription.name} : {echecs[regularisation]}')
+                continue
+            try:
+                with self.env.cr.savepoint():
                     if not regularisation.ligne_ids:
                         ignorees.append(souscription.name)
                         continue
@@ -972,7 +1308,7 @@ class SouscriptionCampagneFacturation(models.Model):
             },
         }
 
-    def _pull_meta_periodes_donnees(self):
+    def _pull_meta_periodes_donnees(self, reprise=False):
         """Méthode-données du pull des méta-périodes (#341, ADR 0036 décision
         13) : cible le Périmètre de campagne (#175) pour `self.mois` — aucun
         mois re-proposé, le scope est déjà celle de la campagne — et délègue
@@ -986,10 +1322,61 @@ class SouscriptionCampagneFacturation(models.Model):
             gabarit que les deux autres pulls (sorties C15, sync F15) —
             consommé par le bouton `action_pull_meta_periodes` (toast) et par
             tout appelant non-UI (automate d'amorçage, tests). `erreurs`
-            porte des triplets `(libellé, res_model, res_id)` (#366)."""
+            porte des triplets `(libellé, res_model, res_id)` (#366).
+
+        `reprise` (automate d'amorçage seulement — jamais le bouton, qui ne
+        committe pas en cours de requête) : pull par tranches, chacune
+        committée avec le curseur de la Campagne (`_avancer_curseur_pull_meta`)
+        ; un worker tué en route reprend, au passage suivant du cron, après
+        la dernière RSC committée. Curseur remis à zéro au bout du pull.
+
+        Le curseur est un rang dans l'ordre des RSC : il ne vaut que pour le
+        périmètre qui l'a posé. Si le périmètre de RSC a changé depuis (une
+        RSC résolue entre la panne et la reprise, triée avant le curseur,
+        serait sinon sautée pour le mois), la reprise repart du début — sans
+        risque, le pull est gardé par l'empreinte des Périodes."""
         self.ensure_one()
         cibles = self._souscriptions_facturables()
-        return self.env['souscription.pull.meta.periodes.service'].pull(cibles, self.mois)
+        Service = self.env['souscription.pull.meta.periodes.service']
+        if not reprise:
+            return Service.pull(cibles, self.mois)
+        perimetre = self._empreinte_perimetre_pull_meta(Service._par_rsc(cibles))
+        if self.pull_meta_curseur_rsc and (
+            self.pull_meta_curseur_mois != self.mois or self.pull_meta_curseur_perimetre != perimetre
+        ):
+            self._ecrire_curseur_pull_meta(False, 0)
+        resultat = Service.pull(
+            cibles,
+            self.mois,
+            apres_rsc=self.pull_meta_curseur_rsc or None,
+            progression=partial(self._avancer_curseur_pull_meta, perimetre),
+        )
+        self._ecrire_curseur_pull_meta(False, 0)
+        return resultat
+
+    @staticmethod
+    def _empreinte_perimetre_pull_meta(rscs):
+        """Empreinte de l'ensemble des RSC tirées (ordre indifférent)."""
+        return hashlib.sha256('\n'.join(sorted(rscs)).encode()).hexdigest()
+
+    def _avancer_curseur_pull_meta(self, perimetre, derniere_rsc, nb_metas):
+        """Tranche appliquée : avance le curseur et committe avec elle
+        (API de progression `ir.cron`, même protocole que la vidange) — puis
+        vide le cache, pour que la mémoire ne suive pas la taille du
+        portefeuille."""
+        self._ecrire_curseur_pull_meta(derniere_rsc, self.pull_meta_curseur_lot + 1, perimetre)
+        self.env['ir.cron']._commit_progress(nb_metas)
+        self.env.invalidate_all()
+
+    def _ecrire_curseur_pull_meta(self, rsc, lot, perimetre=False):
+        self.sudo().write(
+            {
+                'pull_meta_curseur_rsc': rsc,
+                'pull_meta_curseur_mois': self.mois if rsc else False,
+                'pull_meta_curseur_lot': lot,
+                'pull_meta_curseur_perimetre': perimetre if rsc else False,
+            }
+        )
 
     def action_pull_meta_periodes(self):
         """Lance le tirage en un clic (#176), sans fenêtre intermédiaire :
@@ -1001,7 +1388,7 @@ class SouscriptionCampagneFacturation(models.Model):
         erreur vers la souscription fautive (#366) — le toast reste la
         seule trace éphémère, le journal la trace durable."""
         self.ensure_one()
-        creees, rafraichies, inchangees, conservees, erreurs = self._pull_meta_periodes_donnees()
+        creees, rafraichies, inchangees, conservees, erreurs = self._executer_donnees('pull_meta_periodes')
         # Symétrie avec l'automate d'amorçage (#343, grill 19/07) : `demande`
         # marque « déjà tiré » sur cette étape 'derive' (elle ne pilote pas
         # « fait », dérivé du backlog) — c'est elle qui fait sortir la
@@ -1042,7 +1429,7 @@ class SouscriptionCampagneFacturation(models.Model):
         (#366) avant de rendre le MÊME toast que le bouton autonome
         (`_toast_sync_f15`, extrait pour ne pas dupliquer son formatage)."""
         self.ensure_one()
-        creees, ignorees, erreurs = self._sync_f15_donnees()
+        creees, ignorees, erreurs = self._executer_donnees('sync_f15')
         self._poster_recap_journal(
             ETAPES_CAMPAGNE['sync_f15']['label'],
             [_('Créées : %s', len(creees)), _('Ignorées : %s', len(ignorees)), _('Erreurs : %s', len(erreurs))],
@@ -1058,18 +1445,39 @@ class SouscriptionCampagneFacturation(models.Model):
     # uniformément par le futur automate — aucune nouvelle couture réseau,
     # délégation pure aux méthodes-données durables (#341) déjà couvertes. ---
 
-    def _pull_sorties_c15_donnees(self):
+    def _pull_sorties_c15_donnees(self, tirage=None):
         """Vue Campagne de la méthode-données du pull des sorties C15 (#341)
         — même délégation que `action_pull_sorties_c15` ci-dessus, sans le
-        toast."""
+        toast. `tirage` : phase réseau déjà lancée (amorçage concurrent)."""
         self.ensure_one()
-        return self.env['souscription.souscription']._pull_sorties_c15_donnees()
+        return self.env['souscription.souscription']._pull_sorties_c15_donnees(tirage=tirage)
 
-    def _sync_f15_donnees(self):
+    def _sync_f15_donnees(self, reprise=False):
         """Vue Campagne de la méthode-données de la sync F15 (#341) — même
-        délégation que `action_sync_f15` ci-dessus, sans le toast."""
+        délégation que `action_sync_f15` ci-dessus, sans le toast. `reprise`
+        (automate seulement) : chaque lot de RSC inséré est committé
+        (`_avancer_sync_f15`)."""
+        self.ensure_one()
+        return self.env['souscription.refacturation']._synchroniser_depuis_electricore_donnees(
+            progression=self._avancer_sync_f15 if reprise else None
+        )
+
+    def _avancer_sync_f15(self, nb_lignes):
+        """Lot F15 inséré : committe (API de progression `ir.cron`) et vide
+        le cache, comme `_avancer_curseur_pull_meta`."""
+        self.env['ir.cron']._commit_progress(nb_lignes)
+        self.env.invalidate_all()
+
+    def _executer_donnees(self, code, **kwargs):
+        """Exécute la méthode-données de l'étape d'amorçage `code` sous
+        mesure (journal de performance) — unités = toutes les lignes du
+        gabarit rendu, erreurs comprises. Partagée par les boutons et
+        l'automate d'amorçage ; une levée (transport) n'enregistre rien."""
         self.ensure_one()
-        return self.env['souscription.refacturation']._synchroniser_depuis_electricore_donnees()
+        with self._etape(code)._mesurer('pull') as chrono:
+            resultat = getattr(self, ETAPES_CAMPAGNE[code]['amorcage'])(**kwargs)
+            chrono.nb_unites = sum(len(lot) for lot in resultat)
+        return resultat
 
     # --- Amorçage automatique à la création (#343, ADR 0036 décisions 3-8) ---
     #
@@ -1088,24 +1496,123 @@ class SouscriptionCampagneFacturation(models.Model):
     # de la souscription fautive, DANS le service (#341/#360) — la méthode-
     # données réussit quand même (tuple avec des erreurs dedans), `demande`
     # est donc posée normalement (décision 8a).
+    #
+    # Amorçage concurrent (paramètre système `souscriptions.amorcage_
+    # concurrent`, défaut désactivé) : l'essentiel d'une passe à froid est
+    # de l'attente réseau electricore. La phase RÉSEAU des racines dont le
+    # transport est un appel en bloc — sorties C15 (`_appeler_sorties`) —
+    # part dès le début de la passe dans un pool de fils (`_lancer_tirages`),
+    # sans accès base (périmètres résolus avant, dans le fil principal). La
+    # phase BASE reste celle d'avant : séquentielle, dans un ordre
+    # topologique, sous l'identité du créateur, chaque méthode-données
+    # consommant son `tirage` au lieu d'appeler le réseau. La sync F15 n'a
+    # pas de tirage en bloc : elle tire en flux, lot par lot, avec sa propre
+    # fenêtre de tirages concurrents (`souscription.refacturation.
+    # _tirer_lots_en_ordre`, `souscriptions.f15_concurrence`) — un tirage en
+    # bloc garderait tout l'historique en mémoire et l'insérerait en une
+    # transaction. Racine indépendante, elle passe EN TÊTE de la phase base
+    # (`_ordre_amorcage`) : son flux et ses insertions tournent dans le fil
+    # principal pendant que les sorties C15 sont en vol, et l'ordre doux
+    # « sorties C15 -> méta-périodes » tient toujours (le pull méta, en
+    # flux, attend le tirage des sorties).
+    _TIRAGES_CONCURRENTS = {
+        'pull_sorties_c15': '_tirer_sorties_c15',
+    }
+
+    # Pulls committés par tranches sous l'automate, repris si le worker est
+    # tué en route — au curseur (`_pull_meta_periodes_donnees`) ou par
+    # l'insert-si-absente (`_sync_f15_donnees`).
+    _PULLS_REPRIS = ('pull_meta_periodes', 'sync_f15')
+
+    def _amorcage_concurrent(self):
+        return str2bool(
+            self.env['ir.config_parameter'].sudo().get_param('souscriptions.amorcage_concurrent', 'False'), False
+        )
+
+    def _lancer_tirages(self, executeur, codes):
+        """Lance dans `executeur` la phase réseau des étapes `codes` qui en
+        ont une détachable ; rend `{code: Future}`. Une fabrique client en
+        échec (configuration) n'est pas lancée : l'étape retombe sur son
+        chemin direct, qui rapportera la même erreur à son tour."""
+        tirages = {}
+        for code in codes:
+            methode = self._TIRAGES_CONCURRENTS.get(code)
+            if not methode:
+                continue
+            try:
+                tirage = getattr(self, methode)(executeur)
+            except UserError:
+                continue
+            if tirage is not None:
+                tirages[code] = tirage
+        return tirages
+
+    def _tirer_sorties_c15(self, executeur):
+        service = self.env['souscription.pull.meta.periodes.service']
+        rscs = list(service._par_rsc(self.env['souscription.souscription']._perimetre_sorties_c15()))
+        if not rscs:
+            return None
+        client = self.env['souscription.electricore.client'].client()
+        return executeur.submit(service._appeler_sorties, client, rscs)
+
+    @staticmethod
+    def _ordre_amorcage(tirages):
+        """Ordre de la phase base quand des `tirages` sont en vol : d'abord
+        les étapes qui n'attendent aucun tirage, ni directement ni par un
+        prérequis ; ensuite celles qui en attendent un. Chaque groupe garde
+        l'ordre du catalogue — l'ordre reste topologique."""
+        en_attente = set(tirages)
+        for code in CODES_AMORCAGE:
+            if en_attente.intersection(ETAPES_CAMPAGNE[code]['prerequis']):
+                en_attente.add(code)
+        return [code for code in CODES_AMORCAGE if code not in en_attente] + [
+            code for code in CODES_AMORCAGE if code in en_attente
+        ]
 
     def _amorcer(self):
         """Passe séquentielle d'amorçage pour CETTE campagne (#343). Committe
         après chaque étape réussie (API de progression `ir.cron`, ADR 0035) :
-        un échec à l'étape suivante ne perd pas le succès déjà acquis."""
+        un échec à l'étape suivante ne perd pas le succès déjà acquis.
+        Phase réseau des racines en parallèle si l'amorçage concurrent est
+        activé (cf. bloc de commentaire ci-dessus)."""
         self.ensure_one()
+        if not self._amorcage_concurrent():
+            self._amorcer_etapes({})
+            return
+        codes = [code for code in CODES_AMORCAGE if self._etape(code).etat_prerequis == 'prete']
+        codes = [code for code in codes if not self._etape(code).fait]
+        with ThreadPoolExecutor(max_workers=len(self._TIRAGES_CONCURRENTS)) as executeur:
+            self._amorcer_etapes(self._lancer_tirages(executeur, codes))
+
+    def _amorcer_etapes(self, tirages):
+        """Phase base de la passe, dans l'ordre du catalogue ; `tirages` :
+        phases réseau déjà lancées, par code d'étape (vide en séquentiel) —
+        les étapes qui ne les attendent pas passent alors en tête
+        (`_ordre_amorcage`), pendant que ces tirages sont en vol.
+
+        Un échec transitoire (ingestion en cours, réseau, disjoncteur ouvert —
+        politique de transport de la fabrique) re-déclenche le cron
+        d'amorçage à la reprise, une fois par passe : l'étape restée « à
+        lancer » est retentée dans le quart d'heure, plus le lendemain. Seul
+        le premier échec TRANSITOIRE compte : un échec définitif rencontré
+        avant ne le masque pas."""
         cron = self.env['ir.cron']
         mesures = []
-        for code in CODES_AMORCAGE:
+        echec_transitoire = None
+        for code in self._ordre_amorcage(tirages):
             etape = self._etape(code)
             if etape.etat_prerequis != 'prete' or etape.fait:
                 continue
-            methode = ETAPES_CAMPAGNE[code]['amorcage']
+            kwargs = {'tirage': tirages[code]} if code in tirages else {}
+            if code in self._PULLS_REPRIS:
+                kwargs['reprise'] = True
             debut = time.monotonic()
             try:
-                resultat = getattr(self, methode)()
+                resultat = self._executer_donnees(code, **kwargs)
             except UserError as exc:
                 mesures.append((ETAPES_CAMPAGNE[code]['label'], None, None, time.monotonic() - debut, str(exc)))
+                if not echec_transitoire and est_transitoire(exc):
+                    echec_transitoire = exc
                 continue
             duree = time.monotonic() - debut
             etape.write({'demande': True})
@@ -1116,6 +1623,10 @@ class SouscriptionCampagneFacturation(models.Model):
             # (grill 19/07 sur la revue de #343).
             nb_total = sum(len(lot) for lot in resultat[:-1])
             mesures.append((ETAPES_CAMPAGNE[code]['label'], nb_total, nb_erreurs, duree, None))
+        if echec_transitoire:
+            self.env['souscription.electricore.client'].replanifier_si_transitoire(
+                self.env.ref('souscriptions_odoo.ir_cron_amorcage_campagne'), echec_transitoire
+            )
         self._notifier_fin_amorcage(mesures)
 
     @api.model
@@ -1127,7 +1638,9 @@ class SouscriptionCampagneFacturation(models.Model):
         boucle pas (décision 4) : une campagne par appel, aucun
         re-déclenchement — le filet de sécurité quotidien du cron
         (`interval_type`, même idiome que la vidange, ADR 0035) suffit à
-        rattraper une campagne encore en attente.
+        rattraper une campagne encore en attente. Seule exception : un échec
+        transport transitoire re-déclenche le cron à la reprise
+        (`_amorcer_etapes`).
 
         Limite assumée (grill 19/07) : une campagne antérieure à #343 dont le
         pull méta fut tiré à la main garde `demande=False` à jamais (la
@@ -1228,8 +1741,7 @@ class SouscriptionCampagneFacturation(models.Model):
         fait l'idempotence — rien n'est ajouté ici, comme pour l'émission."""
         self.ensure_one()
         self._verifier_gate('creer_factures')
-        self._etape('creer_factures').write({'demande': True})
-        self.env.ref('souscriptions_odoo.ir_cron_vidange_creer_factures')._trigger()
+        self._etape('creer_factures')._declencher_vidange()
 
     def action_emettre_factures(self):
         """Gated sur créer factures + gestes commerciaux (#158) : pose
@@ -1252,43 +1764,35 @@ class SouscriptionCampagneFacturation(models.Model):
         progression ajouté (esprit ADR 0025)."""
         self.ensure_one()
         self._verifier_gate('emettre_factures')
-        self._etape('emettre_factures').write({'demande': True})
-        self.env.ref('souscriptions_odoo.ir_cron_vidange_emettre_factures')._trigger()
+        self._etape('emettre_factures')._declencher_vidange()
 
     def action_envoyer_factures(self):
-        """Gated sur émettre factures + mot du mois (#314) : délègue à la
-        machinerie NATIVE d'envoi (`account.move.send._generate_and_send_invoices`)
-        plutôt que de la réimplémenter — PDF, formats e-invoicing (Factur-X),
-        pièces jointes, partenaires sans email, archivage au chatter : rien de
-        tout ça n'est à écrire ici.
-
-        `allow_raising=False` : un échec d'envoi remonte sur le chatter de LA
-        facture fautive (native, ``_hook_if_errors``) sans faire échouer les
-        autres ni remonter d'exception ici — c'est cette isolation native,
-        déjà éprouvée par `emettre_factures`/#268 pour le POST comptable, qui
-        justifie que les deux étapes restent distinctes (poster = gel
-        comptable, ADR 0032 ; envoyer = communication).
-
-        Idempotent par construction, sans état de retry dédié : le
-        reste-à-faire (`_factures_a_envoyer_du_mois`, `is_move_sent=False`)
+        """Gated sur émettre factures + mot du mois (#314) : pose l'intention
+        et déclenche le cron de vidange, comme créer/émettre — rendre et
+        envoyer tout le mois dans la requête HTTP dépassait son délai. La
+        vidange délègue, paquet par paquet, à la machinerie NATIVE d'envoi
+        (`account.move._envoyer_par_campagne`, sur
+        `account.move.send._generate_and_send_invoices`) plutôt que de la
+        réimplémenter — PDF, formats e-invoicing (Factur-X), pièces jointes,
+        partenaires sans email, archivage au chatter : rien de tout ça n'est
+        à écrire ici.
+
+        Un échec d'envoi est isolé par le harnais (dichotomie sous
+        savepoint) et porté au chatter de LA facture fautive, sans empêcher
+        les autres de partir — cette isolation, déjà éprouvée par
+        `emettre_factures`/#268 pour le POST comptable, justifie que les deux
+        étapes restent distinctes (poster = gel comptable, ADR 0032 ;
+        envoyer = communication).
+
+        Idempotent par construction, sans état de retry dédié : la liste de
+        travail (`_factures_a_envoyer_du_mois`, `is_move_sent=False`)
         exclut déjà les factures parties — un reclic ne reprend QUE les
-        échecs, jamais de doublon sur celles déjà envoyées. Poste le
-        récapitulatif au journal de la Campagne (#366) — comptes seuls,
-        comme « régulariser les clôtures » : le chatter de la facture fautive
-        dit déjà pourquoi, le drill-down dit déjà lesquelles."""
+        échecs, jamais de doublon sur celles déjà envoyées. La fin de
+        vidange poste le récapitulatif au journal de la Campagne (#366),
+        avec un lien par facture restée non envoyée (`echecs_au_journal`)."""
         self.ensure_one()
         self._verifier_gate('envoyer_factures')
-        a_envoyer = self._factures_a_envoyer_du_mois()
-        if not a_envoyer:
-            return
-        nb_avant = len(a_envoyer)
-        self.env['account.move.send']._generate_and_send_invoices(a_envoyer, allow_raising=False)
-        a_envoyer.invalidate_recordset(['is_move_sent'])
-        nb_echecs = len(self._factures_a_envoyer_du_mois())
-        self._poster_recap_journal(
-            ETAPES_CAMPAGNE['envoyer_factures']['label'],
-            [_('Envoyées : %s', nb_avant - nb_echecs), _('Échecs : %s', nb_echecs)],
-        )
+        self._etape('envoyer_factures')._declencher_vidange()
 
     # action_preparer_prelevements (#186) : déclarée plus haut, aux côtés du
     # domaine partagé avec le signal dérivé « fait ».
@@ -1362,6 +1866,13 @@ class SouscriptionCampagneEtape(models.Model):
         ),
     )
 
+    # Coût mesuré d'une unité de vidange (secondes, moyenne mobile
+    # exponentielle, cf. `_mesurer_cout_unitaire`) — dimensionne le paquet
+    # suivant (`_taille_paquet`). Réglage de performance, jamais affiché en
+    # matrice ; une nouvelle campagne repart du dernier coût connu de la
+    # même étape (`_cout_unitaire_reference`).
+    cout_unitaire = fields.Float(string='Coût unitaire (s)', readonly=True, digits=(16, 4))
+
     etat_prerequis = fields.Selection(
         [('prete', 'Prête'), ('bloquee', 'Bloquée')],
         string='Prérequis',
@@ -1387,6 +1898,24 @@ class SouscriptionCampagneEtape(models.Model):
     def _selection_code(self):
         return [(code, info['label']) for code, info in ETAPES_CAMPAGNE.items()]
 
+    @contextmanager
+    def _mesurer(self, nature):
+        """Chronomètre le bloc et l'inscrit au journal de performance
+        (`souscription.campagne.mesure`) — seulement s'il aboutit : un bloc
+        qui lève n'a pas de mesure. La durée est celle du bloc, pas d'une
+        transaction : un pull repris committe ses tranches en route
+        (`_PULLS_REPRIS`), la mesure couvre alors toutes ces transactions —
+        et un échec après un commit laisse les tranches committées, sans
+        mesure pour elles. Rend le `Chrono` courant, où l'appelant pose
+        `nb_unites`."""
+        self.ensure_one()
+        chrono, jeton = ouvrir_chrono(self.env.cr)
+        try:
+            yield chrono
+        finally:
+            fermer_chrono(chrono, jeton)
+        self.env['souscription.campagne.mesure']._enregistrer(self, nature, chrono)
+
     @api.depends('code')
     def _compute_type_etape(self):
         for etape in self:
@@ -1405,9 +1934,17 @@ class SouscriptionCampagneEtape(models.Model):
         if vals.get('demande'):
             vals = dict(vals)
             vals.setdefault('demande_par_id', self.env.user.id)
-        return super().write(vals)
+        resultat = super().write(vals)
+        # Une porte dé-validée rouvre son mois clos ; validée, elle peut être
+        # la dernière étape qui manquait à la clôture.
+        if 'valide' in vals:
+            if vals['valide']:
+                self.campagne_id._cloturer_si_terminee()
+            else:
+                self.campagne_id._rouvrir(_('Réouverture automatique : porte dé-validée.'))
+        return resultat
 
-    @api.depends('type_etape', 'code', 'campagne_id.mois')
+    @api.depends('type_etape', 'code', 'campagne_id.mois', 'campagne_id.cloturee')
     def _compute_nb_reste_a_faire(self):
         """#157 : lit la stratégie de reste-à-faire au catalogue (#342) —
         `reste_a_faire` (méthode dédiée, ex. « Préparer les prélèvements »,
@@ -1416,8 +1953,13 @@ class SouscriptionCampagneEtape(models.Model):
         l'autre : pas de signal dérivé (portes, actions sans backlog), reste
         à 0. Recompté à chaque lecture (pas de relation ORM déclarée vers
         période/facture, donc pas d'invalidation de cache automatique
-        inter-modèles, ADR 0025)."""
+        inter-modèles, ADR 0025). Campagne clôturée : le compteur figé de
+        son instantané, sans rien rejouer."""
         for etape in self:
+            campagne = etape.campagne_id
+            if campagne.cloturee and campagne.instantane_cloture:
+                etape.nb_reste_a_faire = campagne.instantane_cloture['etapes'].get(etape.code, 0)
+                continue
             info = ETAPES_CAMPAGNE.get(etape.code, {})
             methode = info.get('reste_a_faire')
             if methode and etape.campagne_id:
@@ -1549,7 +2091,13 @@ class SouscriptionCampagneEtape(models.Model):
             raise UserError(
                 _("Pas d'action pour l'étape « %s ».", ETAPES_CAMPAGNE.get(self.code, {}).get('label', self.code))
             )
-        resultat = getattr(self.campagne_id, methode)()
+        # Les pulls se mesurent eux-mêmes (`_executer_donnees`), les vidanges
+        # par paquet : ne reste à chronométrer ici que l'action d'un bloc.
+        if self.code in CODES_AMORCAGE or 'vidange' in ETAPES_CAMPAGNE[self.code]:
+            resultat = getattr(self.campagne_id, methode)()
+        else:
+            with self._mesurer('action'):
+                resultat = getattr(self.campagne_id, methode)()
         # Étape 'action' réussie (pas d'exception) = « pull effectué » pour la
         # campagne : débloque sa vérif (cf. champ `demande`). Pour
         # « émettre factures » (type 'derive'), c'est
@@ -1557,6 +2105,7 @@ class SouscriptionCampagneEtape(models.Model):
         # branche ne la concerne pas (#326).
         if self.type_etape == 'action':
             self.demande = True
+        self.campagne_id._cloturer_si_terminee()
         return resultat
 
     # --- Vidange en tâche de fond (#326/#327, ADR 0035 ; générique #342, ADR
@@ -1583,13 +2132,147 @@ class SouscriptionCampagneEtape(models.Model):
     # Réglage de performance pur — aucun test ne s'y accroche. Réutilisée
     # telle quelle pour la création (81 s / 810 factures mesurés, ADR 0035 —
     # même ordre de grandeur par facture).
+    #
+    # Depuis le paquet adaptatif, 50 n'est plus que la taille de DÉPART,
+    # tant qu'aucun coût n'a été mesuré pour l'étape : une régularisation
+    # riche en lignes et une mensuelle simple diffèrent d'un ordre de
+    # grandeur. Chaque paquet tenté en lot mesure son coût unitaire
+    # (`_mesurer_cout_unitaire`, moyenne mobile `_LISSAGE_COUT_UNITAIRE`),
+    # et le paquet suivant est dimensionné pour remplir la fraction
+    # `souscriptions.vidange_fraction_budget` (paramètre système, défaut
+    # 0.6 ≈ la marge historique de 44 s sur 120 s) du budget temps d'une
+    # passe : `limit_time_real_cron` (à défaut `limit_time_real`) réparti
+    # sur les `_PASSES_PAR_JOB` passes minimales d'une exécution du job —
+    # miroir de `MIN_RUNS_PER_JOB` (natif, `ir.cron`). Moins de commits sur
+    # du travail bon marché, plus de timeout sur du travail cher.
     _TAILLE_PAQUET_VIDANGE = 50
+    _TAILLE_PAQUET_VIDANGE_MAX = 500
+    _PASSES_PAR_JOB = 10
+    _LISSAGE_COUT_UNITAIRE = 0.3
+    _FRACTION_BUDGET_DEFAUT = 0.6
+
+    # Vidange à plusieurs workers : chaque étape en tâche de fond a son cron
+    # historique (`ir_cron_vidange_<code>`) et des crons de renfort
+    # (`ir_cron_vidange_<code>_renfort_<n>`, même point d'entrée, même code) —
+    # `ir.cron` ne lance jamais deux fois le même enregistrement en
+    # parallèle, d'où un enregistrement par worker. Nombre de workers
+    # déclenchés par le bouton : paramètre système
+    # `souscriptions.vidange_workers` (défaut 1 = le seul cron historique,
+    # comportement d'avant ; plafonné au nombre de crons livrés). Les workers
+    # se partagent la liste de travail par verrou de ligne `FOR NO KEY UPDATE
+    # SKIP LOCKED` (`_reserver_paquet`) : chacun prend les unités que personne ne
+    # tient, jamais deux fois la même.
+    _NB_WORKERS_VIDANGE_MAX = 3
+
+    def _crons_vidange(self):
+        """Crons à déclencher pour vidanger CETTE étape : le cron historique,
+        puis autant de renforts que le paramètre système le demande."""
+        self.ensure_one()
+        try:
+            nb_workers = int(self.env['ir.config_parameter'].sudo().get_param('souscriptions.vidange_workers', 1))
+        except ValueError:
+            nb_workers = 1
+        nb_workers = max(1, min(nb_workers, self._NB_WORKERS_VIDANGE_MAX))
+        xmlids = [f'souscriptions_odoo.ir_cron_vidange_{self.code}'] + [
+            f'souscriptions_odoo.ir_cron_vidange_{self.code}_renfort_{rang}' for rang in range(2, nb_workers + 1)
+        ]
+        crons = self.env['ir.cron']
+        for xmlid in xmlids:
+            crons |= self.env.ref(xmlid, raise_if_not_found=False) or self.env['ir.cron']
+        return crons
+
+    def _declencher_vidange(self):
+        """Pose l'intention (`demande`, avec son auteur) et déclenche les
+        workers de l'étape — `_trigger()` ne fait que planifier (ligne
+        `ir.cron.trigger`), le bouton rend la main immédiatement."""
+        self.ensure_one()
+        self.write({'demande': True})
+        for cron in self._crons_vidange():
+            cron._trigger()
+
+    @api.model
+    def _budget_par_passe(self):
+        """Secondes qu'une passe (un paquet) peut consommer : la fraction
+        configurée du budget temps du worker, répartie sur les passes d'une
+        exécution du job."""
+        try:
+            fraction = float(
+                self.env['ir.config_parameter']
+                .sudo()
+                .get_param('souscriptions.vidange_fraction_budget', self._FRACTION_BUDGET_DEFAUT)
+            )
+        except ValueError:
+            fraction = self._FRACTION_BUDGET_DEFAUT
+        fraction = min(max(fraction, 0.05), 0.95)
+        limite = config.get('limit_time_real_cron') or -1
+        if limite <= 0:
+            limite = config.get('limit_time_real') or 120
+        return fraction * limite / self._PASSES_PAR_JOB
+
+    def _cout_unitaire_reference(self):
+        """Coût unitaire de l'étape, à défaut le dernier mesuré pour le même
+        code d'étape (campagnes précédentes) ; 0 si jamais mesuré."""
+        self.ensure_one()
+        if self.cout_unitaire:
+            return self.cout_unitaire
+        precedente = self.sudo().search(
+            [('code', '=', self.code), ('cout_unitaire', '>', 0), ('id', '!=', self.id)], order='id desc', limit=1
+        )
+        return precedente.cout_unitaire
+
+    def _taille_paquet(self):
+        self.ensure_one()
+        cout = self._cout_unitaire_reference()
+        if not cout:
+            return self._TAILLE_PAQUET_VIDANGE
+        return max(1, min(int(self._budget_par_passe() / cout), self._TAILLE_PAQUET_VIDANGE_MAX))
+
+    def _mesurer_cout_unitaire(self, nb_unites, duree):
+        """Intègre la mesure d'un paquet à la moyenne mobile de l'étape.
+        Échantillon perdu plutôt que paquet perdu : sous savepoint, et un
+        conflit de sérialisation avec un autre worker qui vient d'écrire la
+        même ligne (vidange à plusieurs workers) est simplement ignoré."""
+        self.ensure_one()
+        if not nb_unites:
+            return
+        echantillon = duree / nb_unites
+        precedent = self._cout_unitaire_reference()
+        if precedent:
+            echantillon = self._LISSAGE_COUT_UNITAIRE * echantillon + (1 - self._LISSAGE_COUT_UNITAIRE) * precedent
+        try:
+            with self.env.cr.savepoint():
+                self.sudo().write({'cout_unitaire': echantillon})
+        except psycopg2.OperationalError:
+            _logger.info('Vidange %s : mesure du coût unitaire ignorée (ligne tenue par un autre worker)', self.code)
+
+    @api.model
+    def _reserver(self, unites, limit=None):
+        """Verrouille, parmi `unites` (dans leur ordre), au plus `limit`
+        lignes qu'aucune autre transaction ne tient déjà — `FOR NO KEY UPDATE
+        SKIP LOCKED`, le verrou que prend l'ORM natif pour ses propres
+        réservations (`try_lock_for_update`), avec en plus l'ordre et la
+        limite pour réserver un PAQUET dans une liste plus longue. Le verrou
+        tombe au prochain commit (`_commit_progress`) : le travail réservé
+        doit donc être fait, ou re-réservé, dans la même transaction."""
+        if not unites:
+            return unites
+        self.env.cr.execute(
+            SQL(
+                'SELECT id FROM %s WHERE id = ANY(%s) ORDER BY array_position(%s, id) %s FOR NO KEY UPDATE SKIP LOCKED',
+                SQL.identifier(unites._table),
+                list(unites.ids),
+                list(unites.ids),
+                SQL('LIMIT %s', limit) if limit else SQL(),
+            )
+        )
+        reserves = {ligne[0] for ligne in self.env.cr.fetchall()}
+        return unites.filtered(lambda u: u.id in reserves)
 
     def _strategie_vidange(self):
         self.ensure_one()
         return ETAPES_CAMPAGNE[self.code]['vidange']
 
-    def _liste_de_travail(self, limit):
+    def _liste_de_travail(self, limit=None):
         """Prochain paquet de travail du mois de la campagne — distinct de
         `_reste_a_faire` (ADR 0035 décision 4) : celui-ci répond « combien de
         souscriptions restent, pour la porte du DAG », celui-là « quelles
@@ -1598,15 +2281,38 @@ class SouscriptionCampagneEtape(models.Model):
         (#342) — brouillons du mois à émettre, ou souscriptions du mois
         encore à facturer (bucket EXACT « à facturer », #301 — pas le
         reste-à-faire cumulatif : une souscription encore « à tirer », sans
-        Période, n'est pas du travail pour CETTE étape)."""
+        Période, n'est pas du travail pour CETTE étape). Lue par le
+        récapitulatif de fin ; la vidange, elle, réserve son paquet sur le
+        domaine équivalent (`_reserver_paquet`)."""
         self.ensure_one()
         methode = self._strategie_vidange()['liste_travail']
-        return getattr(self.campagne_id, methode)()[:limit]
+        travail = getattr(self.campagne_id, methode)()
+        return travail[:limit] if limit else travail
 
-    def _compter_liste_de_travail(self):
+    def _domaine_de_travail(self):
+        """`(modèle, domaine)` de la liste de travail sur l'état courant —
+        méthode de Campagne nommée par `vidange.domaine_travail`."""
         self.ensure_one()
-        methode = self._strategie_vidange()['liste_travail']
-        return len(getattr(self.campagne_id, methode)())
+        methode = self._strategie_vidange()['domaine_travail']
+        return getattr(self.campagne_id, methode)()
+
+    def _reserver_paquet(self, limit=None, parmi=None):
+        """Sélectionne ET verrouille le prochain paquet en UNE requête sur
+        l'état courant (`_domaine_de_travail`) : au plus `limit` unités
+        encore à traiter, qu'aucune autre transaction ne tient — même verrou
+        que `_reserver`. Une unité qu'un autre worker vient de committer ne
+        répond plus au domaine : jamais re-réservée. `parmi` restreint aux
+        unités d'un paquet déjà tenté (re-réservation après rollback)."""
+        self.ensure_one()
+        modele, domaine = self._domaine_de_travail()
+        if parmi is not None:
+            domaine = domaine + [('id', 'in', parmi.ids)]
+        self.env.flush_all()
+        requete = modele._search(domaine, order='id', limit=limit)
+        self.env.cr.execute(
+            SQL('%s FOR NO KEY UPDATE OF %s SKIP LOCKED', requete.select(), SQL.identifier(modele._table))
+        )
+        return modele.browse([ligne[0] for ligne in self.env.cr.fetchall()])
 
     def _traiter_le_paquet(self, travail):
         """Tentative en lot : `vidange.action` (#342) est le nom d'UNE
@@ -1623,8 +2329,8 @@ class SouscriptionCampagneEtape(models.Model):
 
     def _traiter_une_unite(self, unite):
         """Repli unitaire (#268/#327) : la MÊME action (`vidange.action`)
-        tentée sur UNE unité du paquet, sous savepoint individuel — cf.
-        `_vidanger_un_paquet`. Le type de `unite` varie avec l'étape (une
+        tentée sur UNE unité du paquet, sous savepoint individuel — feuille
+        de la dichotomie `_bissecter`. Le type de `unite` varie avec l'étape (une
         facture pour l'émission, une souscription pour la création) ; c'est
         pour ça que le chatter de l'échec (`_message_echec`) atterrit
         naturellement sur le bon enregistrement : la facture pour l'émission,
@@ -1647,8 +2353,9 @@ class SouscriptionCampagneEtape(models.Model):
 
         Isolation d'erreur par unité (#268/#327) : tente le lot entier ; si
         une grille incapable de prixer (`UserError`, ADR 0029) ou toute
-        autre donnée manquante sur UNE unité fait échouer le lot, réessaie
-        unité par unité sous savepoint individuel, cause au chatter de
+        autre donnée manquante sur UNE unité fait échouer le lot, l'isole par
+        dichotomie (`_bissecter` : moitiés retentées sous savepoint, seules
+        celles en échec redécoupées, jusqu'à l'unité), cause au chatter de
         l'unité fautive — une facture pour l'émission, une SOUSCRIPTION pour
         la création, qui n'a pas encore de facture à ce stade (idiome natif,
         `account.move._autopost_draft_entries`).
@@ -1657,53 +2364,112 @@ class SouscriptionCampagneEtape(models.Model):
         qui n'a RIEN traité (zéro succès) retombe l'intention — sinon une
         Grille de prix manquante ferait retourner le cron en boucle serrée
         sur un travail qui ne peut pas aboutir avant qu'un humain n'ait
-        corrigé la donnée en cause."""
+        corrigé la donnée en cause.
+
+        Plusieurs workers (`_crons_vidange`) : chacun sélectionne et réserve
+        son paquet en une requête (`_reserver_paquet`, SKIP LOCKED, sur l'état
+        courant — jamais la liste complète du mois), un worker qui ne trouve
+        plus rien de libre rend la main sans retomber l'intention, et la fin
+        n'est notifiée qu'une fois (`_conclure`)."""
         self.ensure_one()
         cron = self.env['ir.cron']
-        travail = self._liste_de_travail(limit=self._TAILLE_PAQUET_VIDANGE)
-        restants = len(travail) if len(travail) < self._TAILLE_PAQUET_VIDANGE else self._compter_liste_de_travail()
-        cron._commit_progress(remaining=restants)
+        modele, domaine = self._domaine_de_travail()
+        restant = modele.search_count(domaine)
+        cron._commit_progress(remaining=restant)
 
-        if not travail:
-            self.demande = False
-            self._notifier_fin()
+        if not restant:
+            self._conclure()
             return
 
-        # Verrou avant traitement (comme le natif) : évite qu'un deuxième
-        # worker ne reprenne les mêmes unités en parallèle.
-        travail.try_lock_for_update()
+        # Réservation APRÈS le commit de progression (qui relâcherait les
+        # verrous) : les unités que tient déjà un autre worker sont sautées.
+        travail = self._reserver_paquet(limit=self._taille_paquet())
+        if not travail:
+            # Tout le reste est en cours chez d'autres workers : ce n'est pas
+            # une passe « sans progrès » — l'intention reste levée, le
+            # worker qui finit conclura. Zéro traité : `_run_job` arrête CE
+            # worker-ci (FULLY_DONE), sans boucler sur des verrous tenus.
+            return
 
         try:
-            traites = self._traiter_le_paquet(travail)
+            with self._mesurer('paquet') as chrono:
+                traites = chrono.nb_unites = self._traiter_le_paquet(travail)
+            self._mesurer_cout_unitaire(traites, chrono.duree)
             cron._commit_progress(traites)
-            if not self._compter_liste_de_travail():
-                self.demande = False
-                self._notifier_fin()
+            # Compte du début de passe, pas de reclassement : s'il reste du
+            # travail (ou qu'un autre worker l'a fini entre-temps), la passe
+            # suivante le verra et conclura.
+            if traites >= restant:
+                self._conclure()
             return
         except UserError:
             self.env.cr.rollback()
 
-        aucun_progres = True
-        for unite in travail:
-            try:
-                with self.env.cr.savepoint():
-                    self._traiter_une_unite(unite)
-                aucun_progres = False
-                cron._commit_progress(1)
-            except UserError as exc:
-                unite.message_post(body=self._message_echec(exc))
-                # Commite l'échec SANS décrémenter `remaining` (#383) : un
-                # `finally: cron._commit_progress(1)` inconditionnel comptait
-                # aussi l'échec comme « traité » — `remaining` natif tombait
-                # à 0 dès qu'un lot mixte était tenté une fois, `ir.cron.
-                # _run_job` concluait FULLY_DONE et ne rappelait plus la
-                # vidange, empêchant la passe terminale (règle « pas de
-                # progrès » ci-dessous) de tourner dans le MÊME job.
-                cron._commit_progress()
-
-        if aucun_progres:
-            self.demande = False
-            self._notifier_fin()
+        # Le rollback a relâché les verrous du paquet : re-réserver, sans ce
+        # qu'un autre worker aurait traité entre-temps.
+        travail = self._reserver_paquet(parmi=travail)
+        if not travail:
+            return
+        with self._mesurer('paquet') as chrono:
+            chrono.nb_unites = len(travail)
+            traites, echecs = self._bissecter(travail) if len(travail) > 1 else self._tenter(travail)
+        for unite, exc in echecs:
+            unite.message_post(body=self._message_echec(exc))
+        # Un seul commit pour le paquet ; les échecs ne décrémentent PAS
+        # `remaining` (#383) : compter l'échec comme « traité » faisait
+        # tomber `remaining` natif à 0 dès qu'un lot mixte était tenté une
+        # fois, `ir.cron._run_job` concluait FULLY_DONE et ne rappelait plus
+        # la vidange, empêchant la passe terminale (règle « pas de progrès »
+        # ci-dessous) de tourner dans le MÊME job.
+        cron._commit_progress(traites)
+
+        if not traites:
+            self._conclure()
+
+    def _tenter(self, travail):
+        """Tente `travail` sous savepoint — l'action unitaire pour une seule
+        unité, l'action en lot sinon ; en cas d'échec, le coupe en deux et
+        recommence sur chaque moitié (`_bissecter`). Retourne le nombre
+        d'unités traitées et les `(unite, exception)` des échecs isolés."""
+        try:
+            with chronometrer_unite() if len(travail) == 1 else nullcontext(), self.env.cr.savepoint():
+                if len(travail) == 1:
+                    self._traiter_une_unite(travail)
+                else:
+                    self._traiter_le_paquet(travail)
+            return len(travail), []
+        except UserError as exc:
+            if len(travail) == 1:
+                return 0, [(travail, exc)]
+        return self._bissecter(travail)
+
+    def _bissecter(self, travail):
+        """Isolation par dichotomie d'un paquet qui a échoué en lot : chaque
+        moitié est retentée sous son propre savepoint, seules les moitiés en
+        échec sont redécoupées — k unités fautives parmi n coûtent
+        O(k log n) tentatives au lieu des n du repli unité par unité."""
+        milieu = len(travail) // 2
+        traites, echecs = 0, []
+        for moitie in (travail[:milieu], travail[milieu:]):
+            traites_moitie, echecs_moitie = self._tenter(moitie)
+            traites += traites_moitie
+            echecs += echecs_moitie
+        return traites, echecs
+
+    def _conclure(self):
+        """Retombe l'intention et notifie la fin — UNE fois, quel que soit le
+        nombre de workers qui constatent en même temps qu'il n'y a plus rien
+        à faire : verrou de la ligne d'étape (SKIP LOCKED, l'autre worker
+        passe son tour) et relecture de `demande` (un worker qui a déjà
+        conclu et commité l'a retombée)."""
+        self.ensure_one()
+        if not self._reserver(self):
+            return
+        self.invalidate_recordset(['demande'])
+        if not self.demande:
+            return
+        self.demande = False
+        self._notifier_fin()
 
     def _notifier_fin(self):
         """Notification de fin (#326, généralisée #327 ; générique #342) :
@@ -1712,7 +2478,7 @@ class SouscriptionCampagneEtape(models.Model):
         dit POURQUOI (posé ci-dessus). Émise par `bus.bus._sendone` (natif,
         `simple_notification`) chez le·la demandeur·se — zéro JS.
 
-        `nb_echecs` = `_compter_liste_de_travail()` (même liste que la
+        `nb_echecs` = la liste de travail restante (même liste que la
         vidange : le travail restant EST l'échec restant) ; `nb_ok` = la
         méthode de Campagne nommée par `vidange.ok` (#342) — les factures du
         mois postées pour l'émission, les souscriptions du mois déjà
@@ -1724,16 +2490,24 @@ class SouscriptionCampagneEtape(models.Model):
         la même identité que le reste de la vidange (`with_user
         (demande_par_id)`, posé par l'appelant), sans lien HTML (le
         drill-down et le chatter de l'unité fautive suffisent déjà, ADR
-        0036 décision 8a)."""
+        0036 décision 8a) — sauf pour une stratégie qui le demande
+        (`vidange.echecs_au_journal`, l'envoi : une facture non partie se
+        rattrape à la main, le lien y mène directement)."""
         self.ensure_one()
         strategie = self._strategie_vidange()
         nb_ok = len(getattr(self.campagne_id, strategie['ok'])())
-        nb_echecs = self._compter_liste_de_travail()
+        restant = self._liste_de_travail()
+        nb_echecs = len(restant)
         libelle_ok = strategie['libelle_reussite']
+        erreurs = None
+        if strategie.get('echecs_au_journal'):
+            erreurs = [(unite.display_name, unite._name, unite.id) for unite in restant]
         self.campagne_id._poster_recap_journal(
             ETAPES_CAMPAGNE[self.code]['label'],
             [_('%s : %s', libelle_ok, nb_ok), _('Échecs : %s', nb_echecs)],
+            erreurs=erreurs,
         )
+        self.campagne_id._cloturer_si_terminee()
         demandeur = self.demande_par_id
         if not demandeur:
             return
@@ -0,0 +1,231 @@
+"""Journal de performance des étapes de campagne.
+
+Une *Mesure* par passage chronométré d'une étape : un pull (méta-périodes,
+sorties C15, sync F15), un paquet de vidange (créer/émettre factures), une
+action (régulariser, prélèvements, envoi). Elle porte le débit (unités, durée
+murale, p50/p95 par unité), le nombre de requêtes SQL et le trafic electricore
+(appels, octets estimés, latence) — de quoi voir une régression d'un mois sur l'autre
+avant qu'elle ne touche la limite de temps du cron.
+
+La collecte passe par un `Chrono` courant (`ContextVar`, un par thread/tâche) :
+la Campagne l'ouvre autour du travail (`souscription.campagne.etape._mesurer`),
+le transport electricore et les boucles par unité y notent leurs échantillons
+(`chronometrer_electricore`, `noter_octets_electricore`, `chronometrer_unite`,
+`chronometrer_lot`) sans
+rien savoir de la Campagne — hors mesure, ces fonctions ne font rien.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from odoo import api, fields, models
+
+_CHRONO_COURANT = ContextVar('souscriptions_chrono_courant', default=None)
+
+# Un objet electricore sur `_PAS_ECHANTILLON_OCTETS` est sérialisé pour
+# estimer le trafic (`noter_octets_electricore`) : la sérialisation de chaque
+# objet reçu pesait sur la durée et la latence qu'elle devait mesurer.
+_PAS_ECHANTILLON_OCTETS = 50
+
+
+class Chrono:
+    """Accumulateur d'une mesure en cours — objet Python nu, jamais stocké."""
+
+    def __init__(self, cr):
+        self._cr = cr
+        self._debut = time.monotonic()
+        self._requetes_debut = getattr(cr, 'sql_log_count', 0)
+        self.nb_unites = 0
+        self.durees_unitaires = []
+        self.appels_electricore = 0
+        self.objets_electricore = 0
+        self.octets_echantillons = 0
+        self.nb_echantillons = 0
+        self.octets_electricore = 0
+        self.latence_electricore = 0.0
+        self.duree = 0.0
+        self.nb_requetes = 0
+
+    def arreter(self):
+        self.duree = time.monotonic() - self._debut
+        self.nb_requetes = getattr(self._cr, 'sql_log_count', 0) - self._requetes_debut
+        if self.nb_echantillons:
+            self.octets_electricore = round(self.octets_echantillons * self.objets_electricore / self.nb_echantillons)
+
+    def percentiles(self):
+        """`(p50, p95)` par unité, en secondes — rang le plus proche sur les
+        durées notées une à une ; à défaut (unités traitées en lot), la durée
+        moyenne pour les deux."""
+        if self.durees_unitaires:
+            durees = sorted(self.durees_unitaires)
+            return tuple(durees[min(len(durees) - 1, int(rang * len(durees)))] for rang in (0.5, 0.95))
+        if self.nb_unites:
+            moyenne = self.duree / self.nb_unites
+            return moyenne, moyenne
+        return 0.0, 0.0
+
+
+def ouvrir_chrono(cr):
+    """Ouvre un `Chrono` courant ; rend le jeton de `fermer_chrono`."""
+    chrono = Chrono(cr)
+    return chrono, _CHRONO_COURANT.set(chrono)
+
+
+def fermer_chrono(chrono, jeton):
+    chrono.arreter()
+    _CHRONO_COURANT.reset(jeton)
+
+
+@contextmanager
+def chronometrer_unite():
+    """Note la durée d'UNE unité de travail (base des p50/p95)."""
+    chrono = _CHRONO_COURANT.get()
+    if chrono is None:
+        yield
+        return
+    debut = time.monotonic()
+    try:
+        yield
+    finally:
+        chrono.durees_unitaires.append(time.monotonic() - debut)
+
+
+@contextmanager
+def chronometrer_lot(nb_unites):
+    """Note la durée d'un lot de `nb_unites` unités traitées ensemble : autant
+    d'échantillons que d'unités, chacun la durée moyenne du lot."""
+    chrono = _CHRONO_COURANT.get()
+    if chrono is None or not nb_unites:
+        yield
+        return
+    debut = time.monotonic()
+    try:
+        yield
+    finally:
+        chrono.durees_unitaires.extend([(time.monotonic() - debut) / nb_unites] * nb_unites)
+
+
+@contextmanager
+def chronometrer_electricore():
+    """Compte un échange electricore et sa latence. Un flux JSONL est
+    consommé au fil de l'eau, le travail par élément DANS le bloc : la
+    latence est la durée du bloc moins les durées unitaires notées pendant
+    (`chronometrer_unite`) — le temps passé à attendre le serveur, pas la base."""
+    chrono = _CHRONO_COURANT.get()
+    if chrono is None:
+        yield
+        return
+    debut, rang = time.monotonic(), len(chrono.durees_unitaires)
+    try:
+        yield
+    finally:
+        travail = sum(chrono.durees_unitaires[rang:])
+        chrono.appels_electricore += 1
+        chrono.latence_electricore += max(0.0, time.monotonic() - debut - travail)
+
+
+def noter_octets_electricore(objet):
+    """Compte un objet reçu d'electricore (modèle typé du contrat ou dict)
+    et, un sur `_PAS_ECHANTILLON_OCTETS` (le premier compris), sa taille
+    sérialisée — le trafic est estimé à l'arrêt (taille moyenne de
+    l'échantillon × objets reçus). Le client du contrat n'expose pas son
+    transport : la taille des réponses n'est pas lisible ici (ADR 0024 §4).
+    Hors mesure, ne fait rien."""
+    chrono = _CHRONO_COURANT.get()
+    if chrono is None:
+        return
+    chrono.objets_electricore += 1
+    if (chrono.objets_electricore - 1) % _PAS_ECHANTILLON_OCTETS:
+        return
+    serialiser = getattr(objet, 'model_dump_json', None)
+    chrono.octets_echantillons += len((serialiser() if serialiser else str(objet)).encode())
+    chrono.nb_echantillons += 1
+
+
+class SouscriptionCampagneMesure(models.Model):
+    _name = 'souscription.campagne.mesure'
+    _description = "Mesure de performance d'une étape de campagne"
+    _order = 'date desc, id desc'
+
+    etape_id = fields.Many2one('souscription.campagne.etape', required=True, ondelete='cascade', index=True)
+    campagne_id = fields.Many2one(related='etape_id.campagne_id', store=True, index=True)
+    code = fields.Selection(related='etape_id.code', store=True, string='Étape')
+    nature = fields.Selection(
+        [('pull', 'Pull'), ('paquet', 'Paquet de vidange'), ('action', 'Action')], required=True, string='Nature'
+    )
+    date = fields.Datetime(default=fields.Datetime.now, required=True, string='Date')
+
+    nb_unites = fields.Integer(string='Unités')
+    duree = fields.Float(string='Durée (s)', digits=(16, 3))
+    debit = fields.Float(string='Débit (u/s)', compute='_compute_debit', store=True, digits=(16, 2))
+    p50_ms = fields.Float(string='p50 (ms)', digits=(16, 1))
+    p95_ms = fields.Float(string='p95 (ms)', digits=(16, 1))
+    nb_requetes = fields.Integer(string='Requêtes SQL')
+    appels_electricore = fields.Integer(string='Appels electricore')
+    octets_electricore = fields.Integer(
+        string='Octets electricore', help='Estimés par échantillonnage des objets reçus.'
+    )
+    latence_electricore = fields.Float(string='Latence electricore (s)', digits=(16, 3))
+
+    # Régression d'un mois sur l'autre : coût unitaire de cette mesure
+    # rapporté au coût unitaire moyen de la même étape/nature sur la
+    # campagne précédente. Lecture seule, non stockée — le panneau de la
+    # Campagne le colore au-delà de +20 %.
+    variation_pct = fields.Float(string='Vs mois préc. (%)', compute='_compute_variation_pct', digits=(16, 1))
+
+    @api.depends('nb_unites', 'duree')
+    def _compute_debit(self):
+        for mesure in self:
+            mesure.debit = mesure.nb_unites / mesure.duree if mesure.duree else 0.0
+
+    @api.depends('nb_unites', 'duree', 'code', 'nature', 'campagne_id.mois')
+    def _compute_variation_pct(self):
+        references = {}
+        for mesure in self:
+            mesure.variation_pct = 0.0
+            if not mesure.nb_unites or not mesure.campagne_id:
+                continue
+            cle = (mesure.campagne_id.mois, mesure.code, mesure.nature)
+            if cle not in references:
+                references[cle] = mesure._cout_unitaire_mois_precedent()
+            reference = references[cle]
+            if reference:
+                mesure.variation_pct = 100.0 * (mesure.duree / mesure.nb_unites - reference) / reference
+
+    def _cout_unitaire_mois_precedent(self):
+        self.ensure_one()
+        precedente = self.env['souscription.campagne.facturation'].search(
+            [('mois', '<', self.campagne_id.mois)], order='mois desc', limit=1
+        )
+        if not precedente:
+            return 0.0
+        groupes = self._read_group(
+            [
+                ('campagne_id', '=', precedente.id),
+                ('code', '=', self.code),
+                ('nature', '=', self.nature),
+                ('nb_unites', '>', 0),
+            ],
+            aggregates=['nb_unites:sum', 'duree:sum'],
+        )
+        nb_unites, duree = groupes[0]
+        return duree / nb_unites if nb_unites else 0.0
+
+    @api.model
+    def _enregistrer(self, etape, nature, chrono):
+        p50, p95 = chrono.percentiles()
+        return self.sudo().create(
+            {
+                'etape_id': etape.id,
+                'nature': nature,
+                'nb_unites': chrono.nb_unites,
+                'duree': chrono.duree,
+                'p50_ms': p50 * 1000,
+                'p95_ms': p95 * 1000,
+                'nb_requetes': chrono.nb_requetes,
+                'appels_electricore': chrono.appels_electricore,
+                'octets_electricore': chrono.octets_electricore,
+                'latence_electricore': chrono.latence_electricore,
+            }
+        )
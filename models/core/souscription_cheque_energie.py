@@ -278,32 +278,42 @@ class SouscriptionChequeEnergie(models.Model):
         cette méthode n'appelle jamais ``action_post()`` elle-même, c'est la
         responsabilité de l'appelant (``_post()``) de ne l'invoquer qu'une
         fois ``facture`` réellement postée.
+
+        En lot : ``facture`` peut être un recordset (l'émission d'un paquet,
+        `account.move._post()`) — UNE recherche des chèques validés pour
+        tous les partenaires du lot, puis le même FIFO facture par facture,
+        dans l'ordre du recordset. Le solde est relu à chaque facture : deux
+        factures d'un même usager·ère dans le lot se partagent ses chèques
+        exactement comme deux appels successifs.
         """
-        facture.ensure_one()
-        cheques = self.search([('partner_id', '=', facture.partner_id.id), ('state', '=', 'valide')]).sorted(
-            'date_expiration'
-        )
-        cheques = cheques.filtered(lambda c: c.solde > 0.0)
         consommes = self.browse()
-        if not cheques:
+        if not facture:
             return consommes
+        cheques_par_partenaire = {}
+        for cheque in self.search([('partner_id', 'in', facture.partner_id.ids), ('state', '=', 'valide')]).sorted(
+            'date_expiration'
+        ):
+            cheques_par_partenaire.setdefault(cheque.partner_id.id, self.browse())
+            cheques_par_partenaire[cheque.partner_id.id] |= cheque
 
         compte_tiers = ('asset_receivable', 'liability_payable')
-        for cheque in cheques:
-            if facture.currency_id.is_zero(facture.amount_residual):
-                break
-            # `_seek_for_lines()` (natif) plutôt qu'un filtre par account_type
-            # brut : le compte « à recevoir de l'État » est lui-même typé
-            # asset_receivable (#170 FIX 4), donc un filtre account_type seul
-            # matcherait aussi la ligne de liquidité du paiement — on veut
-            # uniquement la ligne contrepartie tiers (411 usager·ère).
-            _liquidite, contrepartie, ecart = cheque.payment_id._seek_for_lines()
-            ligne_paiement = (contrepartie + ecart).filtered(lambda l: l.account_id.reconcile and not l.reconciled)
-            ligne_facture = facture.line_ids.filtered(
-                lambda l: l.account_id.account_type in compte_tiers and not l.reconciled
-            )
-            if not ligne_paiement or not ligne_facture:
-                continue
-            (ligne_paiement + ligne_facture).reconcile()
-            consommes += cheque
+        for une_facture in facture:
+            cheques = cheques_par_partenaire.get(une_facture.partner_id.id, self.browse())
+            for cheque in cheques.filtered(lambda c: c.solde > 0.0):
+                if une_facture.currency_id.is_zero(une_facture.amount_residual):
+                    break
+                # `_seek_for_lines()` (natif) plutôt qu'un filtre par account_type
+                # brut : le compte « à recevoir de l'État » est lui-même typé
+                # asset_receivable (#170 FIX 4), donc un filtre account_type seul
+                # matcherait aussi la ligne de liquidité du paiement — on veut
+                # uniquement la ligne contrepartie tiers (411 usager·ère).
+                _liquidite, contrepartie, ecart = cheque.payment_id._seek_for_lines()
+                ligne_paiement = (contrepartie + ecart).filtered(lambda l: l.account_id.reconcile and not l.reconciled)
+                ligne_facture = une_facture.line_ids.filtered(
+                    lambda l: l.account_id.account_type in compte_tiers and not l.reconciled
+                )
+                if not ligne_paiement or not ligne_facture:
+                    continue
+                (ligne_paiement + ligne_facture).reconcile()
+                consommes |= cheque
         return consommes
@@ -28,6 +28,7 @@ from .electricore_client_fabrique import (  # noqa: F401
     ContractVersionError,
     IngestionEnCours,
     PreconditionNonRemplie,
+    ouvrir_flux_avec_reprise,
     traduire_exceptions_electricore,
 )
 
@@ -210,8 +211,9 @@ class Souscription(models.Model):
         """Point de transport unique : ouvre le flux `chronologie` (context
         manager) au grain RSC. Seul endroit qui parle réseau — c'est la
         couture patchée en tests (réponses en boîte, rien d'autre n'est
-        mocké)."""
-        return client.chronologie(rsc=rsc)
+        mocké). Ouverture retentée sous la politique de transport de la
+        fabrique."""
+        return ouvrir_flux_avec_reprise(lambda: client.chronologie(rsc=rsc))
 
     def _action_chronologie(self):
         """Vue liste transitoire domainée sur `self`, group-by `type_ligne`,
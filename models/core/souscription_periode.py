@@ -329,7 +329,11 @@ class SouscriptionPeriode(models.Model):
                     vals.setdefault('provision_hp_kwh', provisions['hp'])
                     vals.setdefault('provision_hc_kwh', provisions['hc'])
 
-        return super().create(vals_list)
+        periodes = super().create(vals_list)
+        self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+            'période créée', mois=periodes.mapped('mois')
+        )
+        return periodes
 
     # Champs **facturés**, gelés : dès qu'une Facture qui référence la période
     # est **émise** (postée), les réécrire désaccorderait la facture de la
@@ -415,6 +419,14 @@ class SouscriptionPeriode(models.Model):
         self.ensure_one()
         return bool(self.facture_legacy_ref or self.facture_id.state == 'posted')
 
+    # Champs lus par le statut de facturation de la Campagne
+    # (`_statuts_facturation`) : les réécrire invalide son mémo
+    # transactionnel et rouvre le mois s'il était clôturé. `facture_id` n'y figure pas — compute stocké, il bouge
+    # avec `account.move.periode_id`, invalidé côté facture.
+    _CHAMPS_STATUT_FACTURATION = frozenset(
+        {'souscription_id', 'date_debut', 'mois', 'type_periode', 'facture_legacy_ref'}
+    )
+
     def write(self, vals):
         """Verrou de facturation (#14, amendé #267) : la période est le
         brouillon de travail éditable *avant* et *pendant* la fenêtre
@@ -435,9 +447,11 @@ class SouscriptionPeriode(models.Model):
 
         Régénération au fil de l'eau (#267, point d'entrée (b)) : une édition
         RÉUSSIE d'un champ facturable — la Période est donc dans sa fenêtre
-        brouillon, avec ou sans brouillon de Facture lié — recompose les
-        lignes générées de ce brouillon, pour que le·la facturiste voie tout
-        de suite l'effet de sa correction. Le MESURÉ composé
+        brouillon, avec ou sans brouillon de Facture lié — planifie la
+        recomposition des lignes générées de ce brouillon
+        (`account.move._planifier_recomposition`, une fois par portée de
+        savepoint, au precommit), pour que le·la facturiste voie l'effet de sa
+        correction dès la fin de son geste. Le MESURÉ composé
         (`_CHAMPS_MESURE_COMPOSES`) déclenche la même recomposition sans être
         verrouillé (suivi de review #271) : un non-lissé non tamponné facture
         le mesuré en direct (`_quantite_facturee`) et les notes TURPE lisent
@@ -446,7 +460,7 @@ class SouscriptionPeriode(models.Model):
         `souscription_tampon_emission` (posé uniquement par
         `_tamponner_provision`) : la re-génération de `account.move._post()`
         suit immédiatement le tampon dans le même événement d'émission,
-        inutile de la déclencher deux fois.
+        inutile de la planifier en plus.
 
         Point d'entrée (b), et consommateur des deux clés de contexte
         ci-dessus : carte complète dans la bannière « Régénération au fil de
@@ -459,14 +473,23 @@ class SouscriptionPeriode(models.Model):
                         f'Période {periode.mois_annee} : facture émise, modification interdite. '
                         'Corrigez par un avoir ou par une régularisation.'
                     )
+        mois_avant = self.mapped('mois') if self._CHAMPS_STATUT_FACTURATION.intersection(vals) else None
         resultat = super().write(vals)
+        if mois_avant is not None:
+            self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+                'période modifiée', mois=mois_avant + self.mapped('mois')
+            )
         champs_recomposes = champs_geles or self._CHAMPS_MESURE_COMPOSES.intersection(vals)
         if champs_recomposes and not self.env.context.get('souscription_tampon_emission'):
-            for periode in self:
-                if periode.facture_id.state == 'draft':
-                    periode.facture_id._recomposer_lignes_generees()
+            self.facture_id._planifier_recomposition()
         return resultat
 
+    def unlink(self):
+        self.env['souscription.campagne.facturation']._signaler_changement_facturation(
+            'période supprimée', mois=self.mapped('mois')
+        )
+        return super().unlink()
+
     # Mapping cadran réseau → colonne d'index, source unique pour le justificatif
     # PDF (#55), portail (#57) et formulaire backend (#138) — ADR 0015 (amendé
     # #138). Point d'extension nommé pour Tempo/EJP (hors périmètre).
@@ -793,7 +816,16 @@ class SouscriptionPeriode(models.Model):
         Une période `qualite='incalculable'` est créée quand même, énergies
         nulles (le brouillon facturable reste la règle, CONTEXT.md).
         """
-        vals = {
+        return self._amorcer_depuis_metas([(souscription, meta)])
+
+    def _amorcer_depuis_metas(self, couples):
+        """`_amorcer_depuis_meta` pour un lot de couples `(souscription,
+        meta)` : un seul `create(vals_list)` — rend les Périodes dans l'ordre
+        des couples (consommé par le pull par lots du service, #235)."""
+        return self.create([self._vals_amorcage_depuis_meta(souscription, meta) for souscription, meta in couples])
+
+    def _vals_amorcage_depuis_meta(self, souscription, meta):
+        return {
             'souscription_id': souscription.id,
             'date_debut': fields.Date.to_date(meta.debut),
             'date_fin': fields.Date.to_date(meta.fin),
@@ -801,7 +833,6 @@ class SouscriptionPeriode(models.Model):
             **self._vals_atterrissage_v3(meta),
             'releve_ids': [(0, 0, self._releve_vals_depuis_objet(releve)) for releve in (meta.releves_utilises or [])],
         }
-        return self.create(vals)
 
     def _releve_vals_depuis_objet(self, releve):
         """Mappe un `ObjetReleve` (contrat v3) vers les vals d'un
@@ -861,8 +892,9 @@ class SouscriptionPeriode(models.Model):
         même sur une Période émise — c'est précisément ce qui réalise « le
         mesuré vivant » d'ADR 0030.
 
-        Relevés : remplacés **en bloc** (`releve_ids`, le re-pull promis par
-        ADR 0015) **seulement si la Période n'est pas encore émise**
+        Relevés : rapprochés par `releve_externe_id` (`_commandes_releves`,
+        le re-pull promis par ADR 0015) **seulement si la Période n'est pas
+        encore émise**
         (`_est_facturee_emise`, #267) — pendant la fenêtre brouillon, le
         re-pull rafraîchit les relevés comme le reste du mesuré ; une fois
         émise, le relevé-justificatif reste figé (verrou propre de
@@ -870,7 +902,7 @@ class SouscriptionPeriode(models.Model):
         absent des vals, donc intact.
 
         Régénération au fil de l'eau (#267, point d'entrée (a)) : le `write()`
-        du mesuré déclenche lui-même la recomposition d'un brouillon lié
+        du mesuré planifie lui-même la recomposition d'un brouillon lié
         (`_CHAMPS_MESURE_COMPOSES`, suivi de review #271) — les vals
         d'atterrissage portent toujours les énergies/TURPE, un seul mécanisme
         suffit, plus d'appel explicite ici. Carte complète des 5 points
@@ -879,11 +911,44 @@ class SouscriptionPeriode(models.Model):
         self.ensure_one()
         vals = self._vals_atterrissage_v3(meta)
         if not self._est_facturee_emise():
-            vals['releve_ids'] = [(5, 0, 0)] + [
-                (0, 0, self._releve_vals_depuis_objet(releve)) for releve in (meta.releves_utilises or [])
-            ]
+            commandes = self._commandes_releves(meta.releves_utilises or [])
+            if commandes:
+                vals['releve_ids'] = commandes
         self.write(vals)
 
+    def _commandes_releves(self, releves):
+        """Commandes `releve_ids` qui amènent les relevés de la Période à
+        `releves` (`ObjetReleve` du contrat v3), rapprochés par
+        `releve_externe_id` : identique (à la forme de cache près) -> aucune
+        commande ; modifié -> mis à jour sur place, champs changés seuls ; nouveau -> créé ; disparu du
+        flux -> supprimé. Un re-pull sans changement de relevé ne touche donc
+        aucune ligne de `souscription.releve` (ni verrou, ni contrainte, ni
+        recomposition). Relevé sans identifiant, ou identifiant en double :
+        créé, jamais rapproché."""
+        existants = {r.releve_externe_id: r for r in self.releve_ids if r.releve_externe_id}
+        commandes, gardes = [], set()
+        for releve in releves:
+            vals = self._releve_vals_depuis_objet(releve)
+            existant = existants.get(vals['releve_externe_id'])
+            if existant is None or existant.id in gardes:
+                commandes.append((0, 0, vals))
+                continue
+            gardes.add(existant.id)
+            # Comparées sous leur forme de cache (même normalisation que
+            # `account.move._commandes_lignes_generees`) : un index flottant
+            # sur un champ Integer, un None sur un champ vide ne sont pas
+            # des modifications.
+            modifies = {
+                champ: valeur
+                for champ, valeur in vals.items()
+                if existant._fields[champ].convert_to_cache(valeur, existant)
+                != existant._fields[champ].convert_to_cache(existant[champ], existant)
+            }
+            if modifies:
+                commandes.append((1, existant.id, modifies))
+        commandes += [(2, r.id) for r in self.releve_ids if r.id not in gardes]
+        return commandes
+
     def _est_periode_cloture(self):
         """Cette Période est-elle la Période de clôture de sa Souscription —
         celle qui contient `date_fin` (dernier jour servi, ADR 0031 décision
@@ -950,24 +1015,26 @@ class SouscriptionPeriode(models.Model):
         — la future « régularisation des réels » d'un non-lissé rééditée par
         Enedis emprunte le même mécanisme.
 
+        En lot (émission d'un paquet, `account.move._post()`) : accepte un
+        recordset — les Périodes éligibles sont regroupées par valeurs
+        tamponnées identiques, un ``write()`` par groupe ; l'ORM flushe le
+        tout en une seule passe.
+
         Producteur de la clé de contexte `souscription_tampon_emission` :
         carte complète dans la bannière « Régénération au fil de l'eau » de
         `account_move.py`.
         """
-        self.ensure_one()
-        if not self._a_tamponner():
-            return
-        if self._est_facturee_emise():
-            # Le facturé gelé (ADR 0030) : une Période déjà émise garde sa
-            # provision scellée — même condition que le verrou de write().
-            return
-        self.with_context(souscription_tampon_emission=True).write(
-            {
-                'provision_hp_kwh': self.energie_hp_kwh,
-                'provision_hc_kwh': self.energie_hc_kwh,
-                'provision_base_kwh': self.energie_base_kwh,
-            }
-        )
+        # Le facturé gelé (ADR 0030) : une Période déjà émise garde sa
+        # provision scellée — même condition que le verrou de write().
+        a_tamponner = self.filtered(lambda p: p._a_tamponner() and not p._est_facturee_emise())
+        par_valeurs = {}
+        for periode in a_tamponner:
+            cle = (periode.energie_hp_kwh, periode.energie_hc_kwh, periode.energie_base_kwh)
+            par_valeurs.setdefault(cle, []).append(periode.id)
+        for (hp, hc, base), ids in par_valeurs.items():
+            self.browse(ids).with_context(souscription_tampon_emission=True).write(
+                {'provision_hp_kwh': hp, 'provision_hc_kwh': hc, 'provision_base_kwh': base}
+            )
 
     # Underscore délibéré : ferme la porte RPC externe, même idiome que
     # `sale.order._create_invoices` (décision du grill, amende la revue d'architecture).
@@ -992,12 +1059,54 @@ class SouscriptionPeriode(models.Model):
         """
         self.ensure_one()
         grille = self.env['grille.prix'].get_grille_active(self.date_debut, regime=self.regime_prix_periode)
-        return self.env['account.move'].create(
-            {
-                'move_type': 'out_invoice',
-                'partner_id': self.souscription_id.partner_id.id,
-                'invoice_date': self.date_fin,
-                'periode_id': self.id,
-                'invoice_line_ids': self._composer_lignes(grille),
-            }
-        )
+        return self.env['account.move'].create(self._valeurs_facture(grille))
+
+    def _valeurs_facture(self, grille, lignes_supplementaires=()):
+        """Valeurs du ``account.move`` brouillon de cette période — partagées
+        par la création unitaire (``_creer_facture``) et en lot
+        (``_creer_factures_lot``). ``lignes_supplementaires`` (commandes
+        ``(0, 0, vals)``) s'ajoutent après les lignes de la période : les
+        prestations rassemblées à la création (ADR 0009)."""
+        self.ensure_one()
+        return {
+            'move_type': 'out_invoice',
+            'partner_id': self.souscription_id.partner_id.id,
+            'invoice_date': self.date_fin,
+            'periode_id': self.id,
+            'invoice_line_ids': self._composer_lignes(grille) + list(lignes_supplementaires),
+        }
+
+    def _creer_factures_lot(self, lignes_supplementaires=None):
+        """Crée, en brouillon, les factures de CES périodes en UN seul
+        ``account.move.create(vals_list)`` — même résultat que
+        ``_creer_facture`` période par période, sans son coût fixe par
+        facture : la grille est résolue une fois par (régime, date de début)
+        — un changement de grille tombe toujours un 1er du mois, la clé
+        désigne donc une seule grille —, les lignes composées en une passe,
+        et l'ORM crée tous les moves (et leurs lignes) d'un coup.
+
+        ``lignes_supplementaires`` : ``{periode_id: [(0, 0, vals), ...]}``,
+        lignes ajoutées à la facture de la période dite (les prestations
+        rassemblées, cf. ``souscription.creer_factures``) — posées dans le
+        create plutôt que par un ``write`` par facture après coup.
+
+        Une composition en échec lève ``UserError`` nommant la période
+        fautive, comme la création unitaire : la vidange (#327) isole alors
+        la souscription en cause par dichotomie. Retourne les factures dans
+        l'ordre de ``self``."""
+        lignes_supplementaires = lignes_supplementaires or {}
+        grilles = {}
+        vals_list = []
+        for periode in self:
+            cle = (periode.regime_prix_periode, periode.date_debut)
+            try:
+                if cle not in grilles:
+                    grilles[cle] = self.env['grille.prix'].get_grille_active(
+                        periode.date_debut, regime=periode.regime_prix_periode
+                    )
+                vals_list.append(periode._valeurs_facture(grilles[cle], lignes_supplementaires.get(periode.id, ())))
+            except Exception as e:
+                raise UserError(f'Erreur création facture pour {periode.mois_annee}: {e}') from e
+        if not vals_list:
+            return self.env['account.move']
+        return self.env['account.move'].create(vals_list)
@@ -42,9 +42,10 @@ Deux scopes partagent cette politique (ADR 0030 conséquences) :
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import partial
 
 from dateutil.relativedelta import relativedelta
-from odoo import fields, models
+from odoo import api, fields, models
 
 # Exceptions du mapping electricore : la traduction en UserError vit dans
 # `traduire_exceptions_electricore()` (#360). Les trois noms d'exception
@@ -53,8 +54,11 @@ from .electricore_client_fabrique import (  # noqa: F401
     ContractVersionError,
     IngestionEnCours,
     PreconditionNonRemplie,
+    appeler_avec_reprise,
+    ouvrir_flux_avec_reprise,
     traduire_exceptions_electricore,
 )
+from .souscription_campagne_mesure import chronometrer_lot, chronometrer_unite, noter_octets_electricore
 
 # Verdicts electricore jugés fiables pour écraser le mesuré stocké (ADR 0030
 # décision 1) — les termes du glossaire electricore, accents compris
@@ -66,7 +70,19 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
     _name = 'souscription.pull.meta.periodes.service'
     _description = "Pull unifié des méta-périodes electricore, gardé par l'empreinte (ADR 0030, #235)"
 
-    def pull(self, souscriptions, mois):
+    # Métas appliquées par lot : un savepoint et un `create(vals_list)` par
+    # lot au lieu d'un par meta — repli élément par élément seulement si le
+    # lot échoue (`_appliquer_lot`). Surchargeable par le paramètre système
+    # `souscriptions.pull_meta_taille_lot`.
+    _TAILLE_LOT_DEFAUT = 200
+
+    # Pull repris (`pull(..., progression=...)`) : RSC par appel de flux —
+    # une tranche appliquée est committée par l'appelant avec son curseur,
+    # verrous et cache bornés quelle que soit la taille du portefeuille.
+    # Surchargeable par `souscriptions.pull_meta_taille_tranche`.
+    _TAILLE_TRANCHE_DEFAUT = 1000
+
+    def pull(self, souscriptions, mois, apres_rsc=None, progression=None):
         """Scope **facturation** (#233/#235) : un mois, crée les Périodes
         manquantes (create-missing) et rafraîchit les existantes selon la
         politique gardée par l'empreinte (docstring du module).
@@ -87,10 +103,20 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
             emballées en toast (#158/#176). `erreurs` porte des triplets
             `(libellé, res_model, res_id)` (#366) — les quatre autres
             listes restent des libellés simples.
+
+        Reprise (amorçage en cron) : avec `progression`, le pull part par
+        tranches de RSC triées et appelle `progression(derniere_rsc,
+        nb_metas)` après chacune — l'appelant y persiste son curseur et
+        committe (`_commit_progress`). Un worker tué en route ne perd que la
+        tranche en cours : rappelé avec `apres_rsc` (le curseur), le pull
+        reprend à la RSC suivante. Les listes rendues ne couvrent alors que
+        les tranches de CET appel.
         """
-        return self._pull_un_mois(souscriptions, mois, creer_manquantes=True)
+        return self._pull_un_mois(
+            souscriptions, mois, creer_manquantes=True, apres_rsc=apres_rsc, progression=progression
+        )
 
-    def refresh(self, souscriptions, mois_debut, mois_fin):
+    def refresh(self, souscriptions, mois_debut, mois_fin, cles_conservees=None):
         """Scope **refresh** (#235 AC6) : rafraîchit, gardé par l'empreinte,
         les Périodes déjà amorcées sur la plage `[mois_debut, mois_fin]`
         (bornes incluses, tronquées au 1er du mois) — ne crée **jamais** de
@@ -103,6 +129,12 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
         fois — le coût est proportionnel au nombre de mois de la plage, pas
         au nombre de souscriptions.
 
+        `cles_conservees` (ensemble, complété en place) : reçoit les
+        `(souscription_id, mois)` des Périodes conservées — la même
+        information que la liste `conservees`, mais par couple, sans
+        relire de libellé (consommé par la Régularisation en lot,
+        `souscription.regularisation._rafraichir_mesure`).
+
         Returns:
             Même forme à cinq listes que `pull()` (`creees` toujours vide).
         """
@@ -111,7 +143,9 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
         creees, rafraichies, inchangees, conservees, erreurs = [], [], [], [], []
         mois_courant = debut
         while mois_courant <= fin:
-            c, r, i, cons, e = self._pull_un_mois(souscriptions, mois_courant, creer_manquantes=False)
+            c, r, i, cons, e = self._pull_un_mois(
+                souscriptions, mois_courant, creer_manquantes=False, cles_conservees=cles_conservees
+            )
             creees += c
             rafraichies += r
             inchangees += i
@@ -126,18 +160,66 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
         `debut` normalisé et `_mois_suivant` lui-même)."""
         return mois + relativedelta(months=1)
 
-    def _pull_un_mois(self, souscriptions, mois, *, creer_manquantes):
+    def _pull_un_mois(
+        self, souscriptions, mois, *, creer_manquantes, apres_rsc=None, progression=None, cles_conservees=None
+    ):
         """Un seul appel de flux `meta_periodes` pour `mois`, appliqué selon
         la politique gardée par l'empreinte à toutes les souscriptions à RSC
-        de `souscriptions` — brique partagée par `pull()` et `refresh()`."""
+        de `souscriptions` — brique partagée par `pull()` et `refresh()`.
+
+        Avec `progression` (pull repris par tranches, cf. `pull()`), les RSC
+        triées — moins celles jusqu'à `apres_rsc` incluse, déjà appliquées —
+        partent par tranches de `souscriptions.pull_meta_taille_tranche`,
+        un appel de flux chacune, et `progression(derniere_rsc, nb_metas)`
+        est appelée après chaque tranche appliquée."""
         client = self.env['souscription.electricore.client'].client()
         Periode = self.env['souscription.periode']
-        par_rsc = {s.ref_situation_contractuelle: s for s in souscriptions if s.ref_situation_contractuelle}
+        par_rsc = self._par_rsc(souscriptions)
 
-        creees, rafraichies, inchangees, conservees, erreurs = [], [], [], [], []
+        resultats = ([], [], [], [], [])
         if not par_rsc:
-            return creees, rafraichies, inchangees, conservees, erreurs
+            return resultats
+        if cles_conservees is None:
+            cles_conservees = set()
 
+        if progression is None:
+            tranches = [list(par_rsc)]
+        else:
+            rscs = sorted(rsc for rsc in par_rsc if apres_rsc is None or rsc > apres_rsc)
+            taille = self._parametre_taille('souscriptions.pull_meta_taille_tranche', self._TAILLE_TRANCHE_DEFAUT)
+            tranches = [rscs[debut : debut + taille] for debut in range(0, len(rscs), taille)]
+        for tranche in tranches:
+            avant = sum(len(liste) for liste in resultats)
+            self._pull_une_tranche(
+                client,
+                Periode,
+                {rsc: par_rsc[rsc] for rsc in tranche},
+                mois,
+                creer_manquantes,
+                *resultats,
+                cles_conservees=cles_conservees,
+            )
+            if progression is not None:
+                progression(tranche[-1], sum(len(liste) for liste in resultats) - avant)
+        return resultats
+
+    def _pull_une_tranche(
+        self,
+        client,
+        Periode,
+        par_rsc,
+        mois,
+        creer_manquantes,
+        creees,
+        rafraichies,
+        inchangees,
+        conservees,
+        erreurs,
+        *,
+        cles_conservees,
+    ):
+        """Un appel de flux sur les RSC de `par_rsc`, appliqué par lots ;
+        complète les cinq listes du pull (et `cles_conservees`) en place."""
         # `mois_cle_requete` : le mois demandé au serveur — sert à construire
         # `mois_str` et, en repli, à chercher les Périodes déjà amorcées dont
         # la RSC n'est pas revenue dans le lot (aucune `meta` disponible pour
@@ -149,16 +231,121 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
         mois_cle_requete = fields.Date.to_date(mois).replace(day=1)
         mois_str = fields.Date.to_string(mois_cle_requete)
         rsc_traitees = set()
+        # Index des Périodes mensuelles du mois, en UNE requête avant le
+        # flux — plus une recherche par meta (N+1 : 5 000 RSC, 5 000
+        # requêtes). Tenu à jour des créations au fil du flux.
+        index = self._indexer_periodes(Periode, par_rsc.values(), mois_cle_requete)
+        appliquer_lot = partial(
+            self._appliquer_lot,
+            Periode,
+            mois_str=mois_str,
+            index=index,
+            mois_indexe=mois_cle_requete,
+            creer_manquantes=creer_manquantes,
+            creees=creees,
+            rafraichies=rafraichies,
+            inchangees=inchangees,
+            conservees=conservees,
+            erreurs=erreurs,
+            cles_conservees=cles_conservees,
+        )
+        taille_lot = self._parametre_taille('souscriptions.pull_meta_taille_lot', self._TAILLE_LOT_DEFAUT)
+        lot = []
 
         with (
             traduire_exceptions_electricore(),
             self._ouvrir_flux(client, mois_str, list(par_rsc)) as stream,
         ):
             for meta in stream:
+                noter_octets_electricore(meta)
                 souscription = par_rsc.get(meta.ref_situation_contractuelle)
                 if souscription is None:
                     continue  # RSC hors du filtre demandé, ignorée silencieusement
                 rsc_traitees.add(meta.ref_situation_contractuelle)
+                lot.append((souscription, meta))
+                if len(lot) >= taille_lot:
+                    appliquer_lot(lot)
+                    lot = []
+            if lot:
+                appliquer_lot(lot)
+
+        # Mois absent du flux (ADR 0030 décision 1) : une Période déjà
+        # amorcée dont la RSC n'est pas revenue dans ce lot est conservée et
+        # signalée — « je ne sais pas » n'écrase pas « je savais ».
+        for rsc in par_rsc:
+            periode = index.get((par_rsc[rsc].id, mois_cle_requete))
+            if rsc not in rsc_traitees and periode:
+                conservees.append(f'{periode.souscription_id.name} ({periode.mois_annee}) : mois absent du flux')
+                cles_conservees.add((par_rsc[rsc].id, mois_cle_requete))
+
+    @api.model
+    def _parametre_taille(self, cle, defaut):
+        try:
+            taille = int(self.env['ir.config_parameter'].sudo().get_param(cle, defaut))
+        except ValueError:
+            taille = defaut
+        return max(1, taille)
+
+    def _appliquer_lot(
+        self,
+        Periode,
+        lot,
+        *,
+        mois_str,
+        index,
+        mois_indexe,
+        creer_manquantes,
+        creees,
+        rafraichies,
+        inchangees,
+        conservees,
+        erreurs,
+        cles_conservees,
+    ):
+        """Applique un lot de couples `(souscription, meta)` sous UN
+        savepoint : les Périodes manquantes partent en un seul
+        `create(vals_list)` (`_amorcer_depuis_metas`), les rafraîchissements
+        restent des `write()` par Période (vals propres à chaque meta) que le
+        flush du savepoint envoie groupés. Les listes du lot ne rejoignent
+        celles du pull qu'une fois le lot validé.
+
+        Au moindre échec, le lot est annulé en bloc puis rejoué élément par
+        élément, chacun sous son savepoint (skip-and-report, ADR 0011) :
+        seule la meta fautive part en erreur, même rapport qu'avant les lots."""
+        listes = {'creees': [], 'rafraichies': [], 'inchangees': [], 'conservees': [], 'cles_conservees': set()}
+        a_creer, cles_creees = {}, []
+        with chronometrer_lot(len(lot)):
+            try:
+                with self.env.cr.savepoint():
+                    for souscription, meta in lot:
+                        # Même RSC deux fois dans le lot : la création en
+                        # attente part d'abord, la seconde meta la lit.
+                        if self._cle(souscription, meta) in a_creer:
+                            cles_creees += self._creer_en_bloc(Periode, a_creer, index)
+                        self._appliquer_une(
+                            Periode,
+                            souscription,
+                            meta,
+                            index=index,
+                            mois_indexe=mois_indexe,
+                            creer_manquantes=creer_manquantes,
+                            a_creer=a_creer,
+                            **listes,
+                        )
+                    cles_creees += self._creer_en_bloc(Periode, a_creer, index)
+            except Exception:
+                # Les créations annulées avec le savepoint sortent de l'index.
+                for cle in cles_creees:
+                    index.pop(cle, None)
+            else:
+                creees += listes['creees']
+                rafraichies += listes['rafraichies']
+                inchangees += listes['inchangees']
+                conservees += listes['conservees']
+                cles_conservees |= listes['cles_conservees']
+                return
+
+            for souscription, meta in lot:
                 try:
                     # Savepoint par élément (skip-and-report, ADR 0011) :
                     # un échec de mapping/contrainte sur une RSC ne doit
@@ -169,11 +356,14 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
                             Periode,
                             souscription,
                             meta,
+                            index=index,
+                            mois_indexe=mois_indexe,
                             creer_manquantes=creer_manquantes,
                             creees=creees,
                             rafraichies=rafraichies,
                             inchangees=inchangees,
                             conservees=conservees,
+                            cles_conservees=cles_conservees,
                         )
                 except Exception as exc:
                     # Skip-and-report durable (#341, ADR 0036 décision
@@ -190,43 +380,85 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
                         (f'{souscription.name} ({mois_str}) : {exc}', 'souscription.souscription', souscription.id)
                     )
 
-        # Mois absent du flux (ADR 0030 décision 1) : une Période déjà
-        # amorcée dont la RSC n'est pas revenue dans ce lot est conservée et
-        # signalée — « je ne sais pas » n'écrase pas « je savais ».
-        rsc_absentes = [rsc for rsc in par_rsc if rsc not in rsc_traitees]
-        if rsc_absentes:
-            souscription_ids = [par_rsc[rsc].id for rsc in rsc_absentes]
-            existantes = Periode.search(
-                [
-                    ('souscription_id', 'in', souscription_ids),
-                    ('mois', '=', mois_cle_requete),
-                    ('type_periode', '=', 'mensuelle'),
-                ]
-            )
-            for periode in existantes:
-                conservees.append(f'{periode.souscription_id.name} ({periode.mois_annee}) : mois absent du flux')
-
-        return creees, rafraichies, inchangees, conservees, erreurs
+    @staticmethod
+    def _cle(souscription, meta):
+        """Clé `(souscription_id, mois)` d'une meta — le mois se dérive de
+        `meta.debut` (même idiome que `_amorcer_depuis_meta`)."""
+        return souscription.id, fields.Date.to_date(meta.debut).replace(day=1)
+
+    def _creer_en_bloc(self, Periode, a_creer, index):
+        """Crée en un `create(vals_list)` les Périodes en attente dans
+        `a_creer` (`{clé: (souscription, meta)}`), les range dans l'index et
+        vide l'attente — rend les clés créées."""
+        if not a_creer:
+            return []
+        cles = list(a_creer)
+        periodes = Periode._amorcer_depuis_metas(list(a_creer.values()))
+        for cle, periode in zip(cles, periodes, strict=True):
+            index[cle] = periode
+        a_creer.clear()
+        return cles
+
+    def _indexer_periodes(self, Periode, souscriptions, mois):
+        """`{(souscription_id, mois): période}` des Périodes mensuelles de
+        `mois` pour `souscriptions`, en une requête — la première dans
+        l'ordre du modèle si doublon, comme la recherche unitaire
+        `limit=1` qu'il remplace."""
+        index = {}
+        periodes = Periode.search(
+            [
+                ('souscription_id', 'in', [s.id for s in souscriptions]),
+                ('mois', '=', mois),
+                ('type_periode', '=', 'mensuelle'),
+            ]
+        )
+        for periode in periodes:
+            index.setdefault((periode.souscription_id.id, mois), periode)
+        return index
 
     def _appliquer_une(
-        self, Periode, souscription, meta, *, creer_manquantes, creees, rafraichies, inchangees, conservees
+        self,
+        Periode,
+        souscription,
+        meta,
+        *,
+        index,
+        mois_indexe,
+        creer_manquantes,
+        creees,
+        rafraichies,
+        inchangees,
+        conservees,
+        cles_conservees=None,
+        a_creer=None,
     ):
         """Applique la politique gardée par l'empreinte (ADR 0030 décision 1)
         à un couple `(souscription, mois)` face à une `meta` du flux — le mois
-        se dérive de `meta.debut` (même idiome que `_amorcer_depuis_meta`)."""
-        mois_cle = fields.Date.to_date(meta.debut).replace(day=1)
-        existante = Periode.search(
-            [
-                ('souscription_id', '=', souscription.id),
-                ('mois', '=', mois_cle),
-                ('type_periode', '=', 'mensuelle'),
-            ],
-            limit=1,
-        )
+        se dérive de `meta.debut` (`_cle`).
+        Lecture dans `index` (`_indexer_periodes`, mois `mois_indexe`) ; un
+        mois inattendu (serveur qui tronque autrement) retombe sur la
+        recherche unitaire, mémorisée à son tour. Avec `a_creer` (chemin par
+        lots), une Période manquante est mise en attente plutôt que créée —
+        `_creer_en_bloc` s'en charge."""
+        cle = self._cle(souscription, meta)
+        mois_cle = cle[1]
+        if cle not in index and mois_cle != mois_indexe:
+            index[cle] = Periode.search(
+                [
+                    ('souscription_id', '=', souscription.id),
+                    ('mois', '=', mois_cle),
+                    ('type_periode', '=', 'mensuelle'),
+                ],
+                limit=1,
+            )
+        existante = index.get(cle, Periode)
 
         if not existante:
             if creer_manquantes:
-                Periode._amorcer_depuis_meta(souscription, meta)
+                if a_creer is not None:
+                    a_creer[cle] = (souscription, meta)
+                else:
+                    index[cle] = Periode._amorcer_depuis_meta(souscription, meta)
                 creees.append(f'{souscription.name} ({meta.mois_annee})')
             return  # scope refresh : ne crée jamais (#235 AC6)
 
@@ -237,6 +469,8 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
         qualite = meta.qualite or 'incalculable'
         if qualite not in _QUALITES_FIABLES:
             conservees.append(f'{souscription.name} ({meta.mois_annee}) : qualité {qualite}')
+            if cles_conservees is not None:
+                cles_conservees.add(cle)
             return
 
         existante._rafraichir_depuis_meta(meta)
@@ -245,8 +479,9 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
     def _ouvrir_flux(self, client, mois_str, rsc):
         """Point de transport unique : ouvre le flux `meta_periodes` (context
         manager). Seul endroit qui parle réseau — c'est la couture patchée en
-        tests (réponses en boîte, rien d'autre n'est mocké)."""
-        return client.meta_periodes(mois=mois_str, rsc=rsc)
+        tests (réponses en boîte, rien d'autre n'est mocké). L'ouverture passe
+        par la politique de transport de la fabrique (retentée, disjoncteur)."""
+        return ouvrir_flux_avec_reprise(lambda: client.meta_periodes(mois=mois_str, rsc=rsc))
 
     # === Pull des sorties C15 (#246, ADR 0031 décisions 1-2, tranche 1 du
     # chantier résiliations #21) : `date_fin` gouvernée par le fait C15, à
@@ -256,7 +491,7 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
     # encore présente ou inconnue n'apparaît simplement pas dans la réponse
     # (cas nominal « pas sortie »), jamais d'erreur.
 
-    def pull_sorties(self, souscriptions):
+    def pull_sorties(self, souscriptions, tirage=None):
         """Pull des sorties C15 sur toutes les souscriptions non résiliées à
         RSC de `souscriptions` — périmètre déjà voulu par l'appelant (bouton
         autonome ; le câblage dans l'ordre de la campagne relève de la
@@ -272,6 +507,10 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
         Args:
             souscriptions: le périmètre déjà voulu par l'appelant — seules
                 les souscriptions à RSC résolue participent à l'appel.
+            tirage: `Future` de `_appeler_sorties` sur `_par_rsc
+                (souscriptions)`, déjà lancé par l'appelant (amorçage
+                concurrent, phase réseau dans un fil) — seule l'application
+                reste à faire ici.
 
         Returns:
             tuple[list[str], list[str], list[str], list[tuple]]: `(ecrites,
@@ -280,17 +519,19 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
             res_id)` (#366) — les trois autres listes restent des libellés
             simples.
         """
-        client = self.env['souscription.electricore.client'].client()
-        par_rsc = {s.ref_situation_contractuelle: s for s in souscriptions if s.ref_situation_contractuelle}
+        if tirage is None:
+            client = self.env['souscription.electricore.client'].client()
+        par_rsc = self._par_rsc(souscriptions)
 
         ecrites, corrigees, inchangees, erreurs = [], [], [], []
         if not par_rsc:
             return ecrites, corrigees, inchangees, erreurs
 
         with traduire_exceptions_electricore():
-            lignes = self._appeler_sorties(client, list(par_rsc))
+            lignes = tirage.result() if tirage is not None else self._appeler_sorties(client, list(par_rsc))
 
         for ligne in lignes:
+            noter_octets_electricore(ligne)
             souscription = par_rsc.get(ligne.ref_situation_contractuelle)
             if souscription is None:
                 continue  # RSC hors du filtre demandé, ignorée silencieusement
@@ -298,7 +539,7 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
                 # Savepoint par élément (skip-and-report, ADR 0011) : une
                 # ligne invalide ne doit ni écrire de résultat partiel ni
                 # casser le curseur pour les lignes suivantes du même lot.
-                with self.env.cr.savepoint():
+                with chronometrer_unite(), self.env.cr.savepoint():
                     self._appliquer_une_sortie(
                         souscription, ligne, ecrites=ecrites, corrigees=corrigees, inchangees=inchangees
                     )
@@ -350,9 +591,16 @@ class SouscriptionPullMetaPeriodesService(models.AbstractModel):
             )
             ecrites.append(souscription.name)
 
+    def _par_rsc(self, souscriptions):
+        """Souscriptions à RSC résolue, par RSC — l'ordre des clés est celui
+        du lot envoyé à `_appeler_sorties`."""
+        return {s.ref_situation_contractuelle: s for s in souscriptions if s.ref_situation_contractuelle}
+
     def _appeler_sorties(self, client, rsc):
         """Point de transport unique du pull des sorties C15 : un RPC (pas un
         flux) sur `sorties(rsc=...)` (`electricore_client` 0.5.0) — rend un
         sous-ensemble du lot envoyé, jamais plus, ordre non garanti. Seul
-        endroit qui parle réseau pour ce pull ; couture patchée en tests."""
-        return client.sorties(rsc=rsc)
+        endroit qui parle réseau pour ce pull ; couture patchée en tests.
+        RPC idempotent : retenté sous la politique de transport de la
+        fabrique (`appeler_avec_reprise`), sans base — sûr dans un fil."""
+        return appeler_avec_reprise(lambda: client.sorties(rsc=rsc))
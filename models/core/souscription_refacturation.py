@@ -1,6 +1,12 @@
+import hashlib
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
 
 from odoo import _, api, fields, models
+from odoo.tools import str2bool
 
 # Exceptions du mapping electricore : la traduction en UserError vit dans
 # `traduire_exceptions_electricore()` (#360). Les trois noms d'exception
@@ -9,8 +15,10 @@ from .electricore_client_fabrique import (  # noqa: F401
     ContractVersionError,
     IngestionEnCours,
     PreconditionNonRemplie,
+    appeler_avec_reprise,
     traduire_exceptions_electricore,
 )
+from .souscription_campagne_mesure import chronometrer_unite, noter_octets_electricore
 
 _logger = logging.getLogger(__name__)
 
@@ -21,6 +29,25 @@ _logger = logging.getLogger(__name__)
 TAILLE_LOT_RSC = 150
 
 
+def empreinte_reference(reference):
+    """Empreinte compacte (8 octets, hex) d'une référence de contenu F15."""
+    return hashlib.blake2b(reference.encode(), digest_size=8).hexdigest()
+
+
+def _lire_prestations(client, lot, connues=None):
+    """Un lot de `TAILLE_LOT_RSC` RSC, flux consommé jusqu'au bout. `connues`
+    (sync incrémentale) : empreintes des références déjà en base — leurs
+    lignes sont sautées avant tout `model_dump()`."""
+    lignes = []
+    with client.prestations(rsc=lot) as flux:
+        for presta in flux:
+            if connues is not None and empreinte_reference(presta.reference) in connues:
+                continue
+            noter_octets_electricore(presta)
+            lignes.append(presta.model_dump())
+    return lignes
+
+
 class SouscriptionRefacturation(models.Model):
     """Refacturation Enedis (#8 / ADR 0009 ; renommée #38 — cf. CONTEXT.md).
 
@@ -61,7 +88,7 @@ class SouscriptionRefacturation(models.Model):
 
     # Mise en attente manuelle par le·la facturiste sur un doute (ADR 0012) :
     # opt-out de la facturation automatique. Tant que coché et non facturée, la
-    # prestation est exclue de creer_factures() (cf. _facturer_refacturations).
+    # prestation est exclue de creer_factures() (cf. _refacturations_a_rassembler).
     en_attente = fields.Boolean(string='En attente', default=False)
 
     # État dérivé pour le groupage/les stats de l'écran de vérification (ADR 0012).
@@ -106,7 +133,7 @@ class SouscriptionRefacturation(models.Model):
 
     # --- Sync electricore : pull-tout des prestations F15 (#147, ADR 0009 §2 amendé) ---
 
-    def _synchroniser_depuis_electricore_donnees(self):
+    def _synchroniser_depuis_electricore_donnees(self, progression=None, complet=False):
         """Méthode-données du pull des prestations F15 (#341, ADR 0036
         décision 13) : tire les prestations F15 d'electricore sur les RSC de
         nos souscriptions, insert-si-absente par `reference`.
@@ -120,6 +147,26 @@ class SouscriptionRefacturation(models.Model):
         pas sur le fil les prestations d'un tiers. Le client est acquis en tête,
         avant tout travail (échec rapide et déterministe, ADR 0024 §5).
 
+        En flux, lot par lot (`TAILLE_LOT_RSC`) : chaque lot est tiré,
+        dédupliqué contre les références déjà en base, inséré — puis
+        `progression(nb_lignes)` est appelée — dans l'ordre des lots ; les
+        tirages suivants peuvent être en vol pendant l'insertion
+        (`_tirer_lots_en_ordre`). La mémoire de pointe est celle d'un lot
+        (l'historique F15 de ses `TAILLE_LOT_RSC` RSC), jamais celle du
+        portefeuille ; le `reference IN (...)` de la dédup est borné de
+        même. Seuls les libellés rendus (`creees`, `ignorees`, `erreurs`)
+        s'accumulent d'un lot à l'autre.
+
+        Mode incrémental (opt-in, paramètre système `souscriptions.
+        f15_incrementale`) : chaque lot part avec les empreintes des
+        références qu'il a déjà en base (`souscription.refacturation.
+        empreinte`, une par RSC) — une ligne connue est sautée au fil du
+        flux, avant `model_dump()` et avant toute requête. Le filet reste la
+        réconciliation complète : un lot dont une RSC n'a pas d'empreinte,
+        ou n'a pas été réconciliée depuis `souscriptions.
+        f15_reconciliation_jours` jours, est tiré en entier et son empreinte
+        recalculée depuis la base ; `complet` force ce passage pour tous.
+
         Returns:
             tuple[list[str], list[str], list[tuple]] : `(creees, ignorees,
             erreurs)`, même gabarit que les deux autres pulls (méta-périodes,
@@ -128,11 +175,38 @@ class SouscriptionRefacturation(models.Model):
             `erreurs` porte des triplets `(libellé, res_model, res_id)`
             (#366) — `ignorees` (RSC inconnue, aucune souscription à
             désigner) reste une liste de libellés simples.
+
+        Args:
+            progression: appelée après chaque lot inséré, avec le nombre de
+                lignes du lot — l'automate d'amorçage y committe (la Campagne,
+                `_avancer_sync_f15`) ; le bouton n'en passe pas. Aucun curseur
+                : un worker tué en route reprend du début, l'insert-si-absente
+                saute les lots déjà committés.
+            complet: réconciliation complète forcée (mode incrémental
+                seulement ; sans lui, chaque sync est déjà complète).
         """
         client = self.env['souscription.electricore.client'].client()
-        with traduire_exceptions_electricore():
-            lignes = self._tirer_prestations(client)
-        return self._inserer_prestations(lignes)
+        rscs = self._rscs_a_tirer()
+        # Au moins un passage : la couture répond seule du « aucune RSC,
+        # aucun appel réseau ».
+        lots = [rscs[debut : debut + TAILLE_LOT_RSC] for debut in range(0, len(rscs), TAILLE_LOT_RSC)] or [[]]
+        Empreinte = self.env['souscription.refacturation.empreinte']
+        incrementale = self._sync_f15_incrementale()
+
+        def connues_du_lot(lot):
+            return Empreinte._connues(lot) if incrementale and not complet else None
+
+        creees, ignorees, erreurs = [], [], []
+        for lot, connues, lignes in self._tirer_lots_en_ordre(client, lots, connues_du_lot):
+            lot_creees, lot_ignorees, lot_erreurs = self._inserer_prestations(lignes)
+            if incrementale and lot:
+                Empreinte._enregistrer(lot, lignes, lot_creees, reconciliation=connues is None)
+            creees += lot_creees
+            ignorees += lot_ignorees
+            erreurs += lot_erreurs
+            if progression:
+                progression(len(lignes))
+        return creees, ignorees, erreurs
 
     def _toast_sync_f15(self, creees, ignorees, erreurs):
         """Toast de la sync F15 (#341) — extrait de `synchroniser_depuis_electricore`
@@ -165,7 +239,78 @@ class SouscriptionRefacturation(models.Model):
         creees, ignorees, erreurs = self._synchroniser_depuis_electricore_donnees()
         return self._toast_sync_f15(creees, ignorees, erreurs)
 
-    def _tirer_prestations(self, client):
+    _CONCURRENCE_F15_DEFAUT = 1
+
+    def _concurrence_f15(self):
+        try:
+            return max(
+                1,
+                int(
+                    self.env['ir.config_parameter']
+                    .sudo()
+                    .get_param('souscriptions.f15_concurrence', self._CONCURRENCE_F15_DEFAUT)
+                ),
+            )
+        except ValueError:
+            return self._CONCURRENCE_F15_DEFAUT
+
+    def _tirer_lots_en_ordre(self, client, lots, connues_du_lot):
+        """Rend `(lot, connues, lignes)` dans l'ordre de `lots`, pour un
+        consommateur unique sur le curseur (insertion, commit). Paramètre
+        système `souscriptions.f15_concurrence` (défaut 1, séquentiel) :
+        au-delà, jusqu'à autant de lots sont tirés en même temps dans un pool
+        de fils — `_tirer_prestations` n'y touche pas la base, `connues` est
+        lu ici, dans le fil principal. Fenêtre bornée : un lot n'est lancé
+        que quand un autre est rendu, la mémoire reste celle de quelques
+        lots. Une exception electricore remonte au rang de son lot, traduite
+        comme en direct ; les tirages encore en attente sont annulés."""
+        concurrence = self._concurrence_f15()
+        if concurrence == 1 or len(lots) == 1:
+            for lot in lots:
+                connues = connues_du_lot(lot)
+                with traduire_exceptions_electricore():
+                    lignes = self._tirer_prestations(client, lot, connues=connues)
+                yield lot, connues, lignes
+            return
+        a_lancer = iter(lots)
+        en_vol = deque()
+        with ThreadPoolExecutor(max_workers=concurrence) as executeur:
+
+            def lancer():
+                lot = next(a_lancer, None)
+                if lot is not None:
+                    connues = connues_du_lot(lot)
+                    en_vol.append(
+                        (lot, connues, executeur.submit(self._tirer_prestations, client, lot, connues=connues))
+                    )
+
+            try:
+                for _rang in range(concurrence):
+                    lancer()
+                while en_vol:
+                    lot, connues, tirage = en_vol.popleft()
+                    with traduire_exceptions_electricore():
+                        lignes = tirage.result()
+                    lancer()
+                    yield lot, connues, lignes
+            finally:
+                for _lot, _connues, tirage in en_vol:
+                    tirage.cancel()
+
+    def _sync_f15_incrementale(self):
+        return str2bool(
+            self.env['ir.config_parameter'].sudo().get_param('souscriptions.f15_incrementale', 'False'), False
+        )
+
+    def _rscs_a_tirer(self):
+        """RSC de nos souscriptions, filtre du pull F15 (#245)."""
+        return (
+            self.env['souscription.souscription']
+            .search([('ref_situation_contractuelle', '!=', False)])
+            .mapped('ref_situation_contractuelle')
+        )
+
+    def _tirer_prestations(self, client, rscs=None, connues=None):
         """Couture transport (patchée par les tests) : consomme le flux JSONL typé
         (`PrestationF15`, contrat v1) et rend des dicts plats. Seul endroit qui
         parle réseau.
@@ -178,17 +323,24 @@ class SouscriptionRefacturation(models.Model):
         (`ElectricoreClient.prestations`, client 0.4.0) — ~1 000 RSC en une
         seule requête dépasserait les limites usuelles de longueur d'URL.
         Aucune souscription à RSC résolue -> aucun appel réseau.
+
+        `rscs` déjà résolues par l'appelant (`_rscs_a_tirer`) : aucun accès
+        base ici, la méthode peut alors tourner dans un fil (amorçage
+        concurrent de la Campagne).
+
+        Chaque lot est lu en entier sous la politique de transport de la
+        fabrique (`appeler_avec_reprise`) : rien n'est appliqué avant la fin
+        du lot, le relire après un échec est donc sans effet de bord.
+
+        `connues` : empreintes des références déjà en base (sync
+        incrémentale), lignes sautées au fil du flux (`_lire_prestations`).
         """
-        rscs = (
-            self.env['souscription.souscription']
-            .search([('ref_situation_contractuelle', '!=', False)])
-            .mapped('ref_situation_contractuelle')
-        )
+        if rscs is None:
+            rscs = self._rscs_a_tirer()
         lignes = []
         for debut in range(0, len(rscs), TAILLE_LOT_RSC):
             lot = rscs[debut : debut + TAILLE_LOT_RSC]
-            with client.prestations(rsc=lot) as flux:
-                lignes.extend(presta.model_dump() for presta in flux)
+            lignes.extend(appeler_avec_reprise(partial(_lire_prestations, client, lot, connues)))
         return lignes
 
     def _inserer_prestations(self, lignes):
@@ -232,7 +384,7 @@ class SouscriptionRefacturation(models.Model):
                 ignorees.append(ligne['reference'])
                 continue
             try:
-                with self.env.cr.savepoint():
+                with chronometrer_unite(), self.env.cr.savepoint():
                     self.create(self._vals_prestation(ligne, souscription))
                 creees.append(ligne['reference'])
                 souscriptions_touchees.add(souscription.id)
@@ -256,13 +408,16 @@ class SouscriptionRefacturation(models.Model):
         return creees, ignorees, erreurs
 
     def _recomposer_brouillons_mensuels(self, souscription_ids):
-        """Recompose les brouillons mensuels (source Période, pas
-        Régularisation) NON ÉMIS des souscriptions dont une nouvelle
-        Refacturation vient d'être insérée (#267, point d'entrée (c)) — pour
-        que le·la facturiste voie tout de suite la ligne rassemblée sur le
-        document qu'il·elle s'apprête à émettre. Aucun effet sur une facture
-        déjà émise (filtre `state == 'draft'`) : la re-génération à
-        l'émission (#266) reste le filet de sécurité final.
+        """Planifie la recomposition des brouillons mensuels (source
+        Période, pas Régularisation) NON ÉMIS des souscriptions dont une
+        nouvelle Refacturation vient d'être insérée (#267, point d'entrée
+        (c)) — pour que le·la facturiste voie, dès le commit, la ligne
+        rassemblée sur le document qu'il·elle s'apprête à émettre. Un
+        brouillon déjà planifié par le pull de la même transaction n'est
+        recomposé qu'une fois (`account.move._planifier_recomposition`).
+        Aucun effet sur une facture déjà émise (filtre `state == 'draft'`) :
+        la re-génération à l'émission (#266) reste le filet de sécurité
+        final.
 
         Point d'entrée (c) : carte complète des 5 points d'entrée dans la
         bannière « Régénération au fil de l'eau » de `account_move.py`."""
@@ -275,8 +430,7 @@ class SouscriptionRefacturation(models.Model):
                 ('periode_id', '!=', False),
             ]
         )
-        for move in brouillons:
-            move._recomposer_lignes_generees()
+        brouillons._planifier_recomposition()
 
     @api.model
     def _vals_prestation(self, ligne, souscription):
@@ -315,7 +469,7 @@ class SouscriptionRefacturation(models.Model):
         Porte `souscription_ligne_generee = True` (#266, ADR 0014 amendé) :
         une Refacturation rassemblée est TOUJOURS une ligne générée, jamais
         une retouche manuelle — posé ici, une fois pour toutes, que le
-        rassemblement se fasse à la création (`souscription._facturer_refacturations`)
+        rassemblement se fasse à la création (`souscription.creer_factures`)
         ou à la re-génération de l'émission (`account.move._composer_lignes_generees`).
         """
         self.ensure_one()
@@ -342,7 +496,7 @@ class SouscriptionRefacturation(models.Model):
         sans presta à rassembler.
 
         Point d'entrée unique appelé par les deux chemins de rassemblement
-        (création : `souscription._facturer_refacturations`, re-génération à
+        (création : `souscription.creer_factures`, re-génération à
         l'émission : `account.move._composer_lignes_generees`) — un seul
         endroit pose la section, jamais dupliquée.
 
@@ -358,3 +512,99 @@ class SouscriptionRefacturation(models.Model):
             {'display_type': 'line_section', 'name': 'Prestations Enedis', 'souscription_ligne_generee': True},
         )
         return [section] + [presta._composer_ligne() for presta in self]
+
+
+class SouscriptionRefacturationEmpreinte(models.Model):
+    """Empreinte F15 d'une RSC pour la sync incrémentale : les références
+    de contenu déjà en base, sous forme d'empreintes courtes triées
+    (`empreinte_reference`, une par ligne), et les deux repères du lot —
+    dernière ingestion, dernière réconciliation complète. Technique, écrite
+    par la sync seule ; la supprimer force la réconciliation complète de sa
+    RSC au passage suivant.
+
+    Une collision d'empreintes (8 octets) ferait sauter une ligne nouvelle
+    jusqu'à la réconciliation suivante — jamais plus longtemps."""
+
+    _name = 'souscription.refacturation.empreinte'
+    _description = 'Empreinte F15 par RSC (sync incrémentale)'
+    _order = 'ref_situation_contractuelle'
+
+    _RECONCILIATION_JOURS_DEFAUT = 30
+
+    ref_situation_contractuelle = fields.Char(string='RSC', required=True, index=True)
+    empreintes = fields.Text(string='Empreintes des références')
+    nb_references = fields.Integer(string='Références connues')
+    date_ingestion = fields.Datetime(string='Dernière ingestion')
+    date_reconciliation = fields.Datetime(string='Dernière réconciliation complète')
+
+    _unique_rsc = models.Constraint(
+        'UNIQUE(ref_situation_contractuelle)',
+        'Une empreinte F15 existe déjà pour cette RSC.',
+    )
+
+    def _jours_reconciliation(self):
+        try:
+            return int(
+                self.env['ir.config_parameter']
+                .sudo()
+                .get_param('souscriptions.f15_reconciliation_jours', self._RECONCILIATION_JOURS_DEFAUT)
+            )
+        except ValueError:
+            return self._RECONCILIATION_JOURS_DEFAUT
+
+    @api.model
+    def _connues(self, rscs):
+        """Empreintes connues du lot `rscs`, ou None si le lot doit être
+        réconcilié en entier (une RSC sans empreinte ou réconciliée il y a
+        trop longtemps)."""
+        empreintes = self.sudo().search([('ref_situation_contractuelle', 'in', list(rscs))])
+        limite = fields.Datetime.now() - timedelta(days=self._jours_reconciliation())
+        if len(empreintes) < len(set(rscs)) or any(
+            not e.date_reconciliation or e.date_reconciliation < limite for e in empreintes
+        ):
+            return None
+        return {empreinte for e in empreintes for empreinte in (e.empreintes or '').split()}
+
+    @api.model
+    def _enregistrer(self, rscs, lignes, creees, *, reconciliation):
+        """Met à jour les empreintes du lot `rscs` après insertion.
+        Réconciliation : recalculées depuis la base (source de vérité, une
+        référence supprimée à la main en sort). Sinon : empreintes connues
+        plus celles des lignes créées (`creees`, références)."""
+        maintenant = fields.Datetime.now()
+        par_rsc = {rsc: set() for rsc in rscs}
+        if reconciliation:
+            prestations = self.env['souscription.refacturation'].search(
+                [('souscription_id.ref_situation_contractuelle', 'in', list(rscs))]
+            )
+            for presta in prestations:
+                par_rsc.setdefault(presta.souscription_id.ref_situation_contractuelle, set()).add(
+                    empreinte_reference(presta.reference)
+                )
+        else:
+            creees = set(creees)
+            for ligne in lignes:
+                if ligne['reference'] in creees and ligne.get('ref_situation_contractuelle') in par_rsc:
+                    par_rsc[ligne['ref_situation_contractuelle']].add(empreinte_reference(ligne['reference']))
+        existantes = {
+            e.ref_situation_contractuelle: e
+            for e in self.sudo().search([('ref_situation_contractuelle', 'in', list(par_rsc))])
+        }
+        a_creer = []
+        for rsc, nouvelles in par_rsc.items():
+            existante = existantes.get(rsc)
+            if not reconciliation and existante:
+                nouvelles |= set((existante.empreintes or '').split())
+            vals = {
+                'empreintes': '\n'.join(sorted(nouvelles)),
+                'nb_references': len(nouvelles),
+                'date_ingestion': maintenant,
+            }
+            if reconciliation:
+                vals['date_reconciliation'] = maintenant
+            if existante:
+                existante.write(vals)
+            else:
+                a_creer.append(dict(vals, ref_situation_contractuelle=rsc))
+        if a_creer:
+            self.sudo().create(a_creer)
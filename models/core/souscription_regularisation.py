@@ -1,6 +1,10 @@
+import logging
+
 from odoo import api, fields, models
 from odoo.exceptions import UserError
 
+_logger = logging.getLogger(__name__)
+
 
 class SouscriptionRegularisation(models.Model):
     """Régularisation (solde) — CONTEXT.md, ADR 0030 décisions 3-4, tranches
@@ -112,17 +116,17 @@ class SouscriptionRegularisation(models.Model):
     def action_recalculer(self):
         """Bouton « Recalculer » du formulaire brouillon. Régénération au fil
         de l'eau (#267, point d'entrée (d)) : si un brouillon de Facture est
-        déjà lié (``_recalculer`` l'autorise tant qu'il n'est pas ÉMIS), ses
-        lignes générées sont recomposées juste après — le·la facturiste voit
-        immédiatement l'effet du recalcul sur le document, sans devoir
-        rouvrir la Facture.
+        déjà lié (``_recalculer`` l'autorise tant qu'il n'est pas ÉMIS), la
+        recomposition de ses lignes générées est planifiée pour la fin de la
+        transaction (``account.move._planifier_recomposition``) — le·la
+        facturiste voit l'effet du recalcul sur le document au retour du
+        bouton, sans devoir rouvrir la Facture.
 
         Point d'entrée (d) : carte complète des 5 points d'entrée dans la
         bannière « Régénération au fil de l'eau » de `account_move.py`."""
         self.ensure_one()
         self._recalculer()
-        if self.facture_id.state == 'draft':
-            self.facture_id._recomposer_lignes_generees()
+        self.facture_id._planifier_recomposition()
 
     # === Calcul des candidats (ADR 0030 décision 4) ===
     #
@@ -134,11 +138,15 @@ class SouscriptionRegularisation(models.Model):
     # facturées de la Souscription — recalculable à volonté, idempotent à
     # données constantes.
 
-    def _recalculer(self):
+    def _recalculer(self, fraicheur=None):
         """(Re)construit les lignes depuis les mois candidats — supprime les
         lignes existantes puis reconstruit entièrement (idempotent à données
         constantes, AC #236).
 
+        `fraicheur` : `{(souscription_id, mois): bool}` déjà tiré pour tout un
+        lot (`_recalculer_en_lot`) — à défaut, le mesuré de CETTE
+        Souscription est rafraîchi ici (`_rafraichir_mesure`).
+
         Refuse dès qu'une Facture ÉMISE existe (``facture_id.state ==
         'posted'``, tranche 5 #237, condition dérivée amendée tranche 3
         #267) : une Régularisation ÉMISE est verrouillée, au même titre
@@ -159,9 +167,7 @@ class SouscriptionRegularisation(models.Model):
         souscription = self.souscription_id
         self.ligne_ids.unlink()
 
-        facturees = souscription.periode_ids.filtered(
-            lambda p: p.type_periode == 'mensuelle' and (p.facture_id or p.facture_legacy_ref)
-        )
+        facturees = self._periodes_facturees()
         if not facturees:
             self.write(
                 {'signalements': False, 'date_debut': False, 'date_fin': False, 'periode_couverte_ids': [(5, 0, 0)]}
@@ -174,8 +180,7 @@ class SouscriptionRegularisation(models.Model):
         # la Période facturée la plus récente — un statut vide (donnée
         # ancienne, jamais atterrie en v3) ne bloque pas, seul un statut
         # explicitement non communicant écarte toute la Souscription.
-        derniere = facturees.sorted('mois')[-1]
-        if derniere.statut_communication and derniere.statut_communication != 'communicante':
+        if not self._compteur_communicant(facturees):
             signalements.append(
                 f'{souscription.name} : compteur non communicant, régularisation écartée (hors périmètre v1, ADR 0030).'
             )
@@ -190,16 +195,10 @@ class SouscriptionRegularisation(models.Model):
             return
 
         # Rafraîchit le mesuré (scope régul de la tranche 2, #235) avant de
-        # lire les verdicts — un appel par mois représenté, jamais une plage :
-        # chaque appel rend son propre rapport (conservées/rafraîchies…),
-        # corrélé sans ambiguïté au mois qui vient d'être demandé (pas de
-        # parsing de libellés à travers deux conventions de format).
-        Service = self.env['souscription.pull.meta.periodes.service']
-        fraiches = set()
-        for mois in sorted(set(facturees.mapped('mois'))):
-            _creees, _rafraichies, _inchangees, conservees, _erreurs = Service.refresh(souscription, mois, mois)
-            if not conservees:
-                fraiches.add(mois)
+        # lire les verdicts — cf. `_rafraichir_mesure`.
+        if fraicheur is None:
+            fraicheur = self._rafraichir_mesure()
+        fraiches = {mois for mois in facturees.mapped('mois') if fraicheur.get((souscription.id, mois))}
 
         groupes = {}
         couvertes = self.env['souscription.periode']
@@ -291,6 +290,87 @@ class SouscriptionRegularisation(models.Model):
             }
         )
 
+    def _periodes_facturees(self):
+        """Mensuelles FACTURÉES de la Souscription (facture_id ou
+        facture_legacy_ref, même convention que `creer_factures`) — la
+        matière des candidats."""
+        self.ensure_one()
+        return self.souscription_id.periode_ids.filtered(
+            lambda p: p.type_periode == 'mensuelle' and (p.facture_id or p.facture_legacy_ref)
+        )
+
+    @api.model
+    def _compteur_communicant(self, facturees):
+        """Compteur communicant (ADR 0030 décision 4, v1 scopée) : vérifié sur
+        la Période facturée la plus récente — un statut vide ne bloque pas."""
+        derniere = facturees.sorted('mois')[-1]
+        return not derniere.statut_communication or derniere.statut_communication == 'communicante'
+
+    def _rafraichir_mesure(self):
+        """Rafraîchit le mesuré des mois facturés de CES Régularisations —
+        UN appel de flux par mois, toutes Souscriptions du mois ensemble
+        (`refresh()` accepte un recordset), jamais une plage : chaque appel
+        rend ses conservées par couple (`cles_conservees`), corrélées sans
+        ambiguïté au mois demandé (pas de parsing de libellés).
+
+        Mêmes exclusions que `_recalculer` : rien à tirer pour une
+        Régularisation émise, une Souscription sans mois facturé ou au
+        compteur non communicant.
+
+        Returns:
+            dict: `{(souscription_id, mois): bool}` — frais sauf conservé
+            (verdict non fiable ou mois absent du flux).
+        """
+        par_mois = {}
+        for regul in self:
+            if regul.facture_id.state == 'posted':
+                continue  # verrouillée, `_recalculer` refusera de toute façon
+            facturees = regul._periodes_facturees()
+            if not facturees or not self._compteur_communicant(facturees):
+                continue
+            for mois in set(facturees.mapped('mois')):
+                par_mois.setdefault(mois, self.env['souscription.souscription'])
+                par_mois[mois] |= regul.souscription_id
+
+        Service = self.env['souscription.pull.meta.periodes.service']
+        fraicheur, conservees = {}, set()
+        for mois in sorted(par_mois):
+            Service.refresh(par_mois[mois], mois, mois, cles_conservees=conservees)
+            for souscription in par_mois[mois]:
+                fraicheur[souscription.id, mois] = (souscription.id, mois) not in conservees
+        return fraicheur
+
+    def _recalculer_en_lot(self):
+        """Point d'entrée en lot : recalcule CES Régularisations après un
+        seul rafraîchissement partagé (`_rafraichir_mesure`) — le coût réseau
+        suit le nombre de mois, plus le nombre de contrats (2 000 contrats
+        sur 12 mois : 12 flux au lieu de 24 000).
+
+        Skip-and-report par Régularisation (ADR 0011) : chacune recalcule
+        sous son savepoint. Si le rafraîchissement partagé échoue (transport,
+        ou une Souscription qui fait échouer le flux d'un mois entier), le
+        lot retombe sur le chemin unitaire : chaque Régularisation rafraîchit
+        alors sa propre Souscription sous son savepoint, et seule la fautive
+        est rapportée — comme avant le lot.
+
+        Returns:
+            list[tuple]: `(régularisation, exception)` des échecs.
+        """
+        try:
+            with self.env.cr.savepoint():
+                fraicheur = self._rafraichir_mesure()
+        except Exception as exc:
+            _logger.warning(f'Rafraîchissement en lot de {len(self)} régularisations en échec ({exc}) : repli unitaire')
+            fraicheur = None
+        echecs = []
+        for regul in self:
+            try:
+                with self.env.cr.savepoint():
+                    regul._recalculer(fraicheur=fraicheur)
+            except Exception as exc:
+                echecs.append((regul, exc))
+        return echecs
+
     # === Projection facture (ADR 0030 décision 3, tranche 5 du PRD #231, #237) ===
     #
     # La Facture est la PROJECTION des lignes typées, jamais l'inverse (même
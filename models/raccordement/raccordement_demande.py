@@ -12,7 +12,13 @@ from odoo.exceptions import UserError, ValidationError
 # mapping propre, distinct de celui des quatre appelants frères — les deux
 # premières deviennent une notification non bloquante plutôt qu'une
 # UserError, cf. action_estimer_provisions.
-from ..core.electricore_client_fabrique import ContractVersionError, IngestionEnCours, PreconditionNonRemplie
+from ..core.electricore_client_fabrique import (
+    ContractVersionError,
+    DisjoncteurOuvert,
+    IngestionEnCours,
+    PreconditionNonRemplie,
+    appeler_avec_reprise,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -701,7 +707,8 @@ class RaccordementDemande(models.Model):
         Mapping d'exceptions (#229, trio ré-exporté par la fabrique) :
         `IngestionEnCours`/`PreconditionNonRemplie` (flux R67 absent, typé
         upstream) -> notification non bloquante + chatter (même
-        comportement que l'ancien 503, plus précis) ; `ContractVersionError`
+        comportement que l'ancien 503, plus précis), de même qu'un
+        disjoncteur electricore ouvert (`DisjoncteurOuvert`) ; `ContractVersionError`
         -> `UserError` (la garde de version vit dans le client) ; tout le
         reste (réseau coupé, 500 inattendu) remonte tel quel — plus
         d'enveloppe `UserError` générique."""
@@ -709,7 +716,7 @@ class RaccordementDemande(models.Model):
         client = self.env['souscription.electricore.client'].client()  # fast-fail paquet+config (ADR 0024)
         try:
             reponse = self._appeler_estimation(client, self.pdl)
-        except (IngestionEnCours, PreconditionNonRemplie) as exc:
+        except (IngestionEnCours, PreconditionNonRemplie, DisjoncteurOuvert) as exc:
             return self._notifier_estimation_indisponible(exc)
         except ContractVersionError as exc:
             raise UserError(
@@ -728,8 +735,9 @@ class RaccordementDemande(models.Model):
         """Point de transport unique : passe-plat vers
         `client.provision_estimation(pdl)` (`electricore-client` 0.5.0,
         #229) — couture patchée en tests, réponse en boîte, rien d'autre
-        n'est mocké."""
-        return client.provision_estimation(pdl)
+        n'est mocké. Lecture idempotente, retentée sous la politique de
+        transport de la fabrique."""
+        return appeler_avec_reprise(lambda: client.provision_estimation(pdl))
 
     def _notifier_estimation_indisponible(self, exc):
         """`IngestionEnCours`/`PreconditionNonRemplie` (#229) = état
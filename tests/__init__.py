@@ -5,12 +5,18 @@ from . import (
     test_campagne_bandeau_stats,
     test_campagne_bandeau_view,
     test_campagne_catalogue,
+    test_campagne_cloture_mois,
     test_campagne_etapes_actions,
     test_campagne_facturation,
     test_campagne_journal,
     test_campagne_lettre_mois,
+    test_campagne_mesure,
     test_campagne_notes,
     test_campagne_signaux,
+    test_campagne_statut_ensembliste,
+    test_campagne_vidange_bissection,
+    test_campagne_vidange_paquet_adaptatif,
+    test_campagne_vidange_parallele,
     test_campagne_vue_phases,
     test_catalogue,
     test_champs_passe,
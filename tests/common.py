@@ -398,6 +398,12 @@ class SouscriptionsTestMixin:
         facture = periode._creer_facture()
         return periode, facture
 
+    def vider_recompositions(self):
+        """Joue le precommit de la transaction : la régénération au fil de
+        l'eau (points d'entrée (a)-(d)) y recompose les brouillons en file."""
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+
     def assert_invoice_structure(self, facture):
         """
         Helper pour vérifier la structure d'une facture d'énergie.
@@ -441,3 +447,15 @@ class SouscriptionsTestCase(SouscriptionsTestMixin, TransactionCase):
     def setUpClass(cls):
         super().setUpClass()
         cls.setUpSouscriptionsData()
+
+    def setUp(self):
+        super().setUp()
+        # Politique de transport electricore : jamais d'attente réelle entre
+        # deux essais, et un disjoncteur neuf par test — l'état du processus
+        # ne fuit pas d'un test à l'autre.
+        for patcher in (
+            patch.object(_fabrique_module, '_attendre'),
+            patch.dict(_fabrique_module._DISJONCTEUR, {'echecs': 0, 'ouvert_jusqua': 0.0}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
@@ -11,10 +11,12 @@ test mode, client electricore factice, aucune couture réseau réelle.
 Dates dans la couverture de la grille de prix fixture (2024, tests/common.py).
 """
 
+import threading
 from datetime import date
 from unittest.mock import MagicMock, patch
 
 from dateutil.relativedelta import relativedelta
+from odoo import fields
 from odoo.addons.souscriptions_odoo.models.core import electricore_client_fabrique
 from odoo.addons.souscriptions_odoo.models.core import souscription_pull_meta_periodes_service as service_module
 from odoo.addons.souscriptions_odoo.models.core import souscription_refacturation as refacturation_module
@@ -243,6 +245,49 @@ class TestCampagneAmorcageEchecTransport(SouscriptionsTestCase):
         self.assertFalse(etape.demande)
         self.assertFalse(etape.fait)
 
+    def test_echec_transitoire_redeclenche_le_cron_a_la_reprise(self):
+        """Politique de transport : l'ingestion verrouillée est retentée
+        (`_TENTATIVES` appels), puis le cron d'amorçage est re-déclenché à la
+        reprise — dans le quart d'heure, plus le filet quotidien."""
+        client = _client_amorcage(sorties_leve=service_module.IngestionEnCours('verrou'))
+        avant = fields.Datetime.now()
+
+        with (
+            patcher_client_fabrique(client),
+            patcher_transport(refacturation_module.SouscriptionRefacturation, '_tirer_prestations', return_value=[]),
+            self.enter_registry_test_mode(),
+        ):
+            self.cron.method_direct_trigger()
+
+        self.assertEqual(client.sorties.call_count, electricore_client_fabrique._TENTATIVES)
+        declencheurs = self.env['ir.cron.trigger'].search(
+            [('cron_id', '=', self.cron.id), ('call_at', '>', avant + relativedelta(minutes=10))]
+        )
+        self.assertEqual(len(declencheurs), 1)
+        self.assertLessEqual(declencheurs.call_at, fields.Datetime.now() + relativedelta(minutes=15))
+
+    def test_echec_definitif_ne_masque_pas_un_echec_transitoire_suivant(self):
+        """Sorties C15 en échec définitif (précondition), puis sync F15 en
+        échec transitoire : c'est le second qui décide du re-déclenchement."""
+        client = _client_amorcage(sorties_leve=service_module.PreconditionNonRemplie('réconciliez les RSC'))
+        avant = fields.Datetime.now()
+
+        with (
+            patcher_client_fabrique(client),
+            patcher_transport(
+                refacturation_module.SouscriptionRefacturation,
+                '_tirer_prestations',
+                side_effect=service_module.IngestionEnCours('verrou'),
+            ),
+            self.enter_registry_test_mode(),
+        ):
+            self.cron.method_direct_trigger()
+
+        declencheurs = self.env['ir.cron.trigger'].search(
+            [('cron_id', '=', self.cron.id), ('call_at', '>', avant + relativedelta(minutes=10))]
+        )
+        self.assertEqual(len(declencheurs), 1)
+
 
 @tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
 class TestCampagneAmorcageNotificationRecap(SouscriptionsTestCase):
@@ -383,3 +428,242 @@ class TestCampagneAmorcageIdempotence(SouscriptionsTestCase):
             [('souscription_id', '=', self.souscription_base.id), ('mois', '=', self.MOIS)]
         )
         self.assertEqual(nb_apres, 1, 'idempotent : un re-clic manuel après amorçage ne double rien')
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneAmorcageConcurrent(SouscriptionsTestCase):
+    """Amorçage concurrent (`souscriptions.amorcage_concurrent`) : la phase
+    réseau des racines à transport en bloc (sorties C15) part dans un fil,
+    la phase base reste séquentielle dans le fil principal — mêmes effets
+    que la passe séquentielle. La sync F15 garde son flux par lots et
+    tourne pendant que les sorties sont en vol."""
+
+    MOIS = date(2024, 3, 1)
+
+    def setUp(self):
+        super().setUp()
+        self.souscription_base.with_context(rsc_automatisme=True).write(
+            {'ref_situation_contractuelle': 'RSC-AMORCAGE-BASE'}
+        )
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.amorcage_concurrent', 'True')
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+        self.cron = self.env.ref('souscriptions_odoo.ir_cron_amorcage_campagne')
+        self.fils_reseau = []
+        self.fils_f15 = []
+
+    def _noter_fil(self, resultat, fils=None):
+        def transport(*args, **kwargs):
+            (self.fils_reseau if fils is None else fils).append(threading.get_ident())
+            if isinstance(resultat, Exception):
+                raise resultat
+            return resultat
+
+        return transport
+
+    def _declencher(self, client, transport_f15=None):
+        with (
+            patcher_client_fabrique(client),
+            patcher_transport(
+                refacturation_module.SouscriptionRefacturation,
+                '_tirer_prestations',
+                side_effect=transport_f15 or self._noter_fil([], self.fils_f15),
+            ),
+            self.enter_registry_test_mode(),
+        ):
+            self.cron.method_direct_trigger()
+        self.campagne.etape_ids.invalidate_recordset()
+        return {e.code: e for e in self.campagne.etape_ids}
+
+    def test_phase_reseau_dans_des_fils_meme_resultat(self):
+        client = _client_amorcage(meta_items=[_meta()])
+        client.sorties.side_effect = self._noter_fil([])
+
+        etapes = self._declencher(client)
+
+        self.assertEqual(len(self.fils_reseau), 1, 'sorties C15 tirées une fois')
+        self.assertNotIn(threading.get_ident(), self.fils_reseau, 'hors du fil principal')
+        self.assertEqual(self.fils_f15, [threading.get_ident()], 'F15 en flux par lots, pas de tirage en bloc')
+        self.assertTrue(all(etapes[code].demande for code in ('pull_sorties_c15', 'pull_meta_periodes', 'sync_f15')))
+        periode = self.env['souscription.periode'].search(
+            [('souscription_id', '=', self.souscription_base.id), ('mois', '=', self.MOIS)]
+        )
+        self.assertEqual(len(periode), 1, 'le pull méta, dans le fil principal, crée la Période')
+
+    def test_sync_f15_tiree_pendant_que_les_sorties_sont_en_vol(self):
+        """Chevauchement réel : chaque transport attend que l'autre ait
+        démarré. La sync F15, racine indépendante, passe en tête de la phase
+        base — en ordre catalogue, le fil principal attendrait les sorties
+        avant de lancer la F15, et aucune attente n'aboutirait."""
+        sorties_en_vol, f15_en_vol = threading.Event(), threading.Event()
+        chevauchements = {}
+
+        def sorties(*args, **kwargs):
+            sorties_en_vol.set()
+            chevauchements['sorties'] = f15_en_vol.wait(5)
+            return []
+
+        def prestations(*args, **kwargs):
+            f15_en_vol.set()
+            chevauchements['f15'] = sorties_en_vol.wait(5)
+            return []
+
+        client = _client_amorcage(meta_items=[_meta()])
+        client.sorties.side_effect = sorties
+
+        etapes = self._declencher(client, transport_f15=prestations)
+
+        self.assertEqual(chevauchements, {'sorties': True, 'f15': True}, 'les deux tirages en vol ensemble')
+        self.assertTrue(all(etapes[code].demande for code in ('pull_sorties_c15', 'pull_meta_periodes', 'sync_f15')))
+
+    def test_ordre_amorcage_racines_independantes_en_tete(self):
+        Campagne = type(self.campagne)
+        self.assertEqual(Campagne._ordre_amorcage({}), ['pull_sorties_c15', 'pull_meta_periodes', 'sync_f15'])
+        self.assertEqual(
+            Campagne._ordre_amorcage({'pull_sorties_c15': None}),
+            ['sync_f15', 'pull_sorties_c15', 'pull_meta_periodes'],
+        )
+
+    def test_echec_sorties_c15_bloque_toujours_pull_meta(self):
+        """L'ordre doux sorties C15 -> méta-périodes tient : l'échec du tirage
+        concurrent remonte à l'application des sorties, traduit comme en
+        direct, et le pull méta n'est jamais tenté."""
+        client = _client_amorcage()
+        client.sorties.side_effect = self._noter_fil(service_module.IngestionEnCours('verrou'))
+        client.meta_periodes.side_effect = AssertionError('pull méta ne doit jamais être tenté ici')
+
+        etapes = self._declencher(client)
+
+        self.assertFalse(etapes['pull_sorties_c15'].demande)
+        self.assertFalse(etapes['pull_meta_periodes'].fait)
+        self.assertTrue(etapes['sync_f15'].demande, 'F15 indépendant, tiré et inséré quand même')
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagnePullMetaRepris(SouscriptionsTestCase):
+    """Pull méta-périodes repris sous l'automate : une tranche de RSC par
+    appel de flux, committée avec le curseur de la Campagne
+    (`pull_meta_curseur_*`) — un worker tué en route reprend après la
+    dernière tranche committée."""
+
+    MOIS = date(2024, 3, 1)
+
+    def setUp(self):
+        super().setUp()
+        self.souscription_base.with_context(rsc_automatisme=True).write(
+            {'ref_situation_contractuelle': 'RSC-AMORCAGE-BASE'}
+        )
+        for suffixe in ('B', 'C'):
+            self.env['souscription.souscription'].create(
+                {
+                    'partner_id': self.partner_test.id,
+                    'pdl': f'PDL_REPRIS_{suffixe}',
+                    'puissance_souscrite': '6',
+                    'type_tarif': 'base',
+                    'date_debut': date(2024, 1, 1),
+                }
+            ).with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': f'RSC-AMORCAGE-{suffixe}'})
+        self.rscs = sorted(['RSC-AMORCAGE-BASE', 'RSC-AMORCAGE-B', 'RSC-AMORCAGE-C'])
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.pull_meta_taille_tranche', '1')
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+        self.client = MagicMock()
+        self.client.meta_periodes.side_effect = self._flux
+
+    @staticmethod
+    def _flux(mois, rsc):
+        return flux_electricore([_meta(ref_situation_contractuelle=r) for r in rsc])
+
+    def _tirer(self):
+        with (
+            patcher_client_fabrique(self.client),
+            patch.object(type(self.env['ir.cron']), '_commit_progress') as commit,
+        ):
+            resultat = self.campagne._pull_meta_periodes_donnees(reprise=True)
+        return resultat, commit
+
+    def _rsc_demandees(self):
+        return [appel.kwargs['rsc'] for appel in self.client.meta_periodes.call_args_list]
+
+    def test_une_tranche_committee_par_appel_de_flux(self):
+        (creees, *_autres), commit = self._tirer()
+
+        self.assertEqual(self._rsc_demandees(), [[rsc] for rsc in self.rscs])
+        self.assertEqual([appel.args for appel in commit.call_args_list], [(1,)] * 3)
+        self.assertEqual(len(creees), 3)
+        self.assertFalse(self.campagne.pull_meta_curseur_rsc, 'curseur remis à zéro au bout du pull')
+        self.assertEqual(self.campagne.pull_meta_curseur_lot, 0)
+
+    def test_interrompu_puis_repris_apres_le_curseur(self):
+        self.client.meta_periodes.side_effect = [
+            self._flux(self.MOIS, [self.rscs[0]]),
+            *[service_module.IngestionEnCours('verrou')] * electricore_client_fabrique._TENTATIVES,
+        ]
+        with self.assertRaises(UserError):
+            self._tirer()
+
+        self.assertEqual(
+            (self.campagne.pull_meta_curseur_rsc, self.campagne.pull_meta_curseur_mois),
+            (self.rscs[0], self.MOIS),
+        )
+        self.assertEqual(self.campagne.pull_meta_curseur_lot, 1)
+
+        self.client.meta_periodes.reset_mock(side_effect=True)
+        self.client.meta_periodes.side_effect = self._flux
+        (creees, *_autres), _commit = self._tirer()
+
+        self.assertEqual(self._rsc_demandees(), [[rsc] for rsc in self.rscs[1:]])
+        self.assertEqual(len(creees), 2)
+        periodes = self.env['souscription.periode'].search(
+            [('mois', '=', self.MOIS), ('souscription_id.ref_situation_contractuelle', 'in', self.rscs)]
+        )
+        self.assertEqual(len(periodes), 3, 'aucune tranche rejouée, aucune perdue')
+
+    def test_perimetre_change_depuis_la_panne_reprise_depuis_le_debut(self):
+        """Une RSC résolue entre la panne et la reprise, triée avant le
+        curseur : la reprise repart du début plutôt que de la sauter."""
+        self.client.meta_periodes.side_effect = [
+            self._flux(self.MOIS, [self.rscs[0]]),
+            *[service_module.IngestionEnCours('verrou')] * electricore_client_fabrique._TENTATIVES,
+        ]
+        with self.assertRaises(UserError):
+            self._tirer()
+        self.assertEqual(self.campagne.pull_meta_curseur_rsc, 'RSC-AMORCAGE-B')
+
+        self.env['souscription.souscription'].create(
+            {
+                'partner_id': self.partner_test.id,
+                'pdl': 'PDL_REPRIS_A',
+                'puissance_souscrite': '6',
+                'type_tarif': 'base',
+                'date_debut': date(2024, 1, 1),
+            }
+        ).with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-AMORCAGE-A'})
+        self.client.meta_periodes.reset_mock(side_effect=True)
+        self.client.meta_periodes.side_effect = self._flux
+        self._tirer()
+
+        self.assertEqual(self._rsc_demandees(), [[rsc] for rsc in sorted([*self.rscs, 'RSC-AMORCAGE-A'])])
+        self.assertTrue(
+            self.env['souscription.periode'].search(
+                [('mois', '=', self.MOIS), ('souscription_id.ref_situation_contractuelle', '=', 'RSC-AMORCAGE-A')]
+            )
+        )
+
+    def test_curseur_dun_autre_mois_ignore(self):
+        self.campagne.write(
+            {
+                'pull_meta_curseur_rsc': self.rscs[0],
+                'pull_meta_curseur_mois': date(2024, 2, 1),
+                'pull_meta_curseur_lot': 4,
+            }
+        )
+
+        self._tirer()
+
+        self.assertEqual(self._rsc_demandees(), [[rsc] for rsc in self.rscs])
+
+    def test_bouton_sans_reprise_un_seul_appel(self):
+        with patcher_client_fabrique(self.client):
+            self.campagne._pull_meta_periodes_donnees()
+
+        self.assertEqual(len(self.client.meta_periodes.call_args_list), 1)
+        self.assertFalse(self.campagne.pull_meta_curseur_rsc)
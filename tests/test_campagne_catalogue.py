@@ -45,6 +45,7 @@ _MODELE_PAR_CLE = {
 _MODELE_VIDANGE_ACTION = {
     'creer_factures': 'souscription.souscription',
     'emettre_factures': 'account.move',
+    'envoyer_factures': 'account.move',
 }
 
 
@@ -168,9 +169,9 @@ class TestCatalogueCampagneStructurel(TransactionCase):
             for cle in ('message_echec', 'libelle_reussite'):
                 self.assertIsInstance(vidange[cle], str, f'{code}.vidange.{cle} : devrait être une chaîne')
 
-    def test_vidange_presente_seulement_sur_les_deux_etapes_en_tache_de_fond(self):
+    def test_vidange_presente_seulement_sur_les_etapes_en_tache_de_fond(self):
         codes_avec_vidange = {code for code, info in ETAPES_CAMPAGNE.items() if 'vidange' in info}
-        self.assertEqual(codes_avec_vidange, {'creer_factures', 'emettre_factures'})
+        self.assertEqual(codes_avec_vidange, {'creer_factures', 'emettre_factures', 'envoyer_factures'})
 
     def test_amorcage_present_seulement_sur_les_trois_pulls(self):
         """AC #343, ADR 0036 : la frontière machine/humain est structurelle —
@@ -0,0 +1,174 @@
+"""Tests de la clôture de campagne : instantané persisté d'un mois fermé.
+
+Quand toutes les étapes sont faites, la Campagne fige son bandeau, le
+décompte de ses factures et le reste-à-faire de chaque étape — la liste des
+campagnes (l'historique) ne rejoue plus la partition d'un mois clos. Un
+instantané, jamais une source de vérité : réouverture explicite
+(`action_rouvrir`) ou automatique dès qu'une écriture tardive touche le
+mois. À distinguer de test_cloture_campagne.py (clôture d'une Souscription,
+ADR 0031).
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+from odoo.exceptions import UserError
+from odoo.tests.common import tagged
+
+from .common import SouscriptionsTestCase
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneClotureMois(SouscriptionsTestCase):
+    MOIS = date(2024, 3, 1)
+    FIN_MOIS = date(2024, 3, 31)
+
+    def setUp(self):
+        super().setUp()
+        # Virement : aucune facture prélèvement due, « Préparer les
+        # prélèvements » est faite dès l'émission.
+        for souscription, rsc in ((self.souscription_base, 'RSC-CLOS-BASE'), (self.souscription_hphc, 'RSC-CLOS-HPHC')):
+            souscription.with_context(rsc_automatisme=True).write(
+                {'ref_situation_contractuelle': rsc, 'mode_paiement': 'virement'}
+            )
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+
+    def _etape(self, code):
+        return self.campagne.etape_ids.filtered(lambda e: e.code == code)
+
+    def _emettre_tout(self):
+        factures = self.env['account.move']
+        for souscription in (self.souscription_base, self.souscription_hphc):
+            periode = self.create_test_periode(souscription, date_debut=self.MOIS, date_fin=self.FIN_MOIS)
+            factures |= periode._creer_facture()
+        factures.action_post()
+        factures.write({'is_move_sent': True})
+        return factures
+
+    def _tout_faire_sauf_une_porte(self):
+        """Toutes les étapes faites, sauf la porte « Mot du mois »."""
+        factures = self._emettre_tout()
+        self.campagne.etape_ids.filtered(lambda e: e.type_etape == 'action').write({'demande': True})
+        portes = self.campagne.etape_ids.filtered(lambda e: e.type_etape == 'porte' and e.code != 'mot_du_mois')
+        portes.write({'valide': True})
+        return factures
+
+    # --- Clôture ---
+
+    def test_cloture_automatique_a_la_derniere_etape_faite(self):
+        self._tout_faire_sauf_une_porte()
+        self.assertFalse(self.campagne.cloturee)
+
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self.assertTrue(self.campagne.cloturee)
+        self.assertEqual(self.campagne.cloturee_par_id, self.env.user)
+        self.assertTrue(self.campagne.cloturee_le)
+
+    def test_cloture_manuelle_refusee_tant_quune_etape_manque(self):
+        self._tout_faire_sauf_une_porte()
+        with self.assertRaisesRegex(UserError, 'Mot du mois'):
+            self.campagne.action_cloturer()
+        self.assertFalse(self.campagne.cloturee)
+
+    def test_instantane_fige_bandeau_et_compteurs_des_etapes(self):
+        factures = self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        instantane = self.campagne.instantane_cloture
+        self.assertEqual(instantane['bandeau']['nb_perimetre'], 2)
+        self.assertEqual(instantane['bandeau']['nb_emises_bucket'], 2)
+        self.assertEqual(instantane['bandeau']['nb_factures_emises'], 2)
+        self.assertAlmostEqual(instantane['bandeau']['total_emis_ttc'], sum(factures.mapped('amount_total')), places=2)
+        self.assertEqual(set(instantane['etapes']), set(self.campagne.etape_ids.mapped('code')))
+        self.assertFalse(any(instantane['etapes'].values()))
+
+    def test_mois_clos_lu_sans_rejouer_la_partition(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+        self.campagne.invalidate_recordset()
+        self.campagne.etape_ids.invalidate_recordset()
+
+        Campagne = type(self.campagne)
+        with (
+            patch.object(Campagne, '_souscriptions_par_bucket', side_effect=AssertionError('partition rejouée')),
+            patch.object(Campagne, '_factures_du_mois', side_effect=AssertionError('factures relues')),
+        ):
+            self.assertEqual(self.campagne.nb_emises_bucket, 2)
+            self.assertEqual(self.campagne.nb_factures_emises, 2)
+            self.assertEqual(set(self.campagne.etape_ids.mapped('nb_reste_a_faire')), {0})
+
+    # --- Réouverture ---
+
+    def test_rouvrir_explicitement(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self.campagne.action_rouvrir()
+
+        self.assertFalse(self.campagne.cloturee)
+        self.assertFalse(self.campagne.instantane_cloture)
+        self.assertEqual(self.campagne.nb_emises_bucket, 2)
+
+    def test_ecriture_tardive_sur_le_mois_rouvre(self):
+        factures = self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        factures[:1].button_draft()
+
+        self.assertFalse(self.campagne.cloturee)
+        self.campagne.invalidate_recordset()
+        self.assertEqual(self.campagne.nb_emises_bucket, 1)
+        self.assertEqual(self.campagne.nb_facturees_brouillon, 1)
+
+    def test_ecriture_sur_un_autre_mois_ne_rouvre_pas(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self.create_test_periode(self.souscription_base, date_debut=date(2024, 4, 1), date_fin=date(2024, 4, 30))
+
+        self.assertTrue(self.campagne.cloturee)
+
+    def test_date_fin_posee_apres_le_mois_ne_rouvre_pas(self):
+        """Une résiliation (C15 sorties) postérieure au mois clos ne change
+        pas son Périmètre : seuls les mois à partir de la fin rouvrent, pas
+        tout l'intervalle de service depuis `date_debut`."""
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self.souscription_base.date_fin = date(2024, 6, 30)
+
+        self.assertTrue(self.campagne.cloturee)
+
+    def test_date_fin_dans_le_mois_rouvre(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self.souscription_base.date_fin = date(2024, 3, 15)
+
+        self.assertFalse(self.campagne.cloturee)
+
+    def test_archiver_une_souscription_du_perimetre_rouvre(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self.souscription_base.active = False
+
+        self.assertFalse(self.campagne.cloturee)
+
+    def test_porte_devalidee_rouvre(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+
+        self._etape('verif_periodes').write({'valide': False})
+
+        self.assertFalse(self.campagne.cloturee)
+
+    def test_cloture_et_reouverture_tracees_au_journal(self):
+        self._tout_faire_sauf_une_porte()
+        self._etape('mot_du_mois').write({'valide': True})
+        self.campagne.action_rouvrir()
+
+        corps = ' '.join(self.campagne.message_ids.mapped('body'))
+        self.assertIn('Clôture de la campagne', corps)
+        self.assertIn('Réouverture manuelle', corps)
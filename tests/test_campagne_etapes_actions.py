@@ -1208,7 +1208,11 @@ class TestCampagneEtapeEnvoyerFactures(SouscriptionsTestCase):
     NATIVE d'envoi (`account.move.send._generate_and_send_invoices`) —
     jamais réimplémentée : les tests mockent cette frontière plutôt que de
     faire tourner un rendu PDF/e-mail réel (même convention que
-    tests/test_mail_facture_energie.py, « jamais un envoi SMTP complet »)."""
+    tests/test_mail_facture_energie.py, « jamais un envoi SMTP complet »).
+
+    L'envoi passe en tâche de fond (harnais de vidange, comme créer/émettre) :
+    le bouton pose l'intention, le cron réel — `method_direct_trigger()` dans
+    `self.enter_registry_test_mode()` — envoie par paquets."""
 
     MOIS = date(2024, 3, 1)
     FIN_MOIS = date(2024, 3, 31)
@@ -1236,7 +1240,22 @@ class TestCampagneEtapeEnvoyerFactures(SouscriptionsTestCase):
         return self.create_test_periode(souscription, date_debut=self.MOIS, date_fin=self.FIN_MOIS)
 
     def _mock_send(self):
-        return patch.object(type(self.env['account.move.send']), '_generate_and_send_invoices')
+        """Envoi natif simulé : marque le lot envoyé, comme le ferait la
+        liaison du PDF généré (`is_move_sent`)."""
+
+        def _envoyer(moves, **kwargs):
+            moves.is_move_sent = True
+
+        return patch.object(type(self.env['account.move.send']), '_generate_and_send_invoices', side_effect=_envoyer)
+
+    def _vidanger(self):
+        cron = self.env.ref('souscriptions_odoo.ir_cron_vidange_envoyer_factures')
+        with self.enter_registry_test_mode():
+            for _ in range(5):
+                cron.method_direct_trigger()
+                self._etape('envoyer_factures').invalidate_recordset()
+                if not self._etape('envoyer_factures').demande:
+                    break
 
     def test_envoyer_bloque_si_mot_du_mois_non_valide(self):
         """AC : tenter d'envoyer sans avoir validé la porte refuse, avec un
@@ -1272,11 +1291,16 @@ class TestCampagneEtapeEnvoyerFactures(SouscriptionsTestCase):
 
         with self._mock_send() as mock_send:
             self.campagne.action_envoyer_factures()
+            mock_send.assert_not_called()
+            self.assertTrue(self._etape('envoyer_factures').demande, 'le bouton demande, il ne fait plus')
+            self._vidanger()
 
         mock_send.assert_called_once()
         args, kwargs = mock_send.call_args
         self.assertEqual(set(args[0].ids), {facture.id})
-        self.assertFalse(kwargs.get('allow_raising', True), 'remontée au chatter, jamais une levée (#314)')
+        self.assertTrue(kwargs.get('allow_raising'), "l'échec lève pour que le harnais l'isole")
+        self.assertTrue(facture.is_move_sent)
+        self.assertFalse(self._etape('envoyer_factures').demande)
 
     def test_bouton_generique_dispatch_vers_envoyer_factures(self):
         self._facture_postee()
@@ -1285,6 +1309,7 @@ class TestCampagneEtapeEnvoyerFactures(SouscriptionsTestCase):
 
         with self._mock_send() as mock_send:
             self._etape('envoyer_factures').action_executer()
+            self._vidanger()
 
         mock_send.assert_called_once()
 
@@ -1299,14 +1324,16 @@ class TestCampagneEtapeEnvoyerFactures(SouscriptionsTestCase):
 
         with self._mock_send() as mock_send:
             self.campagne.action_envoyer_factures()
+            self._vidanger()
 
         mock_send.assert_not_called()
 
     def test_echec_denvoi_sur_une_facture_nempeche_pas_les_autres(self):
         """AC : un échec d'envoi sur une facture n'empêche pas les autres de
-        partir ; l'échec est rapporté (ici, au chatter de la facture
-        fautive — le point d'échec va toujours à l'enregistrement en
-        cause, même convention que les vidanges #326/#327)."""
+        partir ; l'échec est rapporté au chatter de la facture fautive — le
+        point d'échec va toujours à l'enregistrement en cause, même
+        convention que les vidanges #326/#327 — et au journal de la
+        Campagne, avec un lien vers la facture."""
         p1 = self._periode_pour(self.souscription_base)
         p2 = self._periode_pour(self.souscription_hphc)
         f_ok = p1._creer_facture()
@@ -1318,18 +1345,22 @@ class TestCampagneEtapeEnvoyerFactures(SouscriptionsTestCase):
 
         def _envoi_partiel(model_self, moves, allow_raising=True, **kwargs):
             for move in moves:
-                if move.id == f_ko.id:
-                    move.message_post(body='Envoi impossible : erreur simulée')
-                else:
-                    move.is_move_sent = True
+                if move.id == f_ko.id and allow_raising:
+                    raise UserError('Adresse invalide : erreur simulée')
+                move.is_move_sent = True
 
         with patch.object(type(self.env['account.move.send']), '_generate_and_send_invoices', _envoi_partiel):
             self.campagne.action_envoyer_factures()
+            self._vidanger()
 
         self.assertTrue(f_ok.is_move_sent)
         self.assertFalse(f_ko.is_move_sent)
         self.assertTrue(any('erreur simulée' in (m.body or '') for m in f_ko.message_ids))
         self.assertEqual(self.campagne._factures_a_envoyer_du_mois(), f_ko)
+        recap = self.campagne.message_ids.filtered(lambda m: 'Envoyées' in (m.body or ''))
+        self.assertEqual(len(recap), 1)
+        self.assertIn('data-oe-model="account.move"', recap.body, 'lien vers la facture non envoyée')
+        self.assertIn(f'data-oe-id="{f_ko.id}"', recap.body)
 
 
 @tagged('souscriptions', 'souscriptions_migration', 'post_install', '-at_install')
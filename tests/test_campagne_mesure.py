@@ -0,0 +1,138 @@
+"""Tests du journal de performance des étapes de campagne.
+
+Une mesure par pull, paquet de vidange ou action d'étape, ouverte par
+`Etape._mesurer` : unités, durée, p50/p95, requêtes SQL, trafic
+electricore (compté au passage de `traduire_exceptions_electricore`).
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from odoo.addons.souscriptions_odoo.models.core import souscription_campagne_mesure as mesure_module
+from odoo.addons.souscriptions_odoo.models.core.electricore_client_fabrique import traduire_exceptions_electricore
+from odoo.exceptions import UserError
+from odoo.tests.common import tagged
+
+from .common import SouscriptionsTestCase
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneMesure(SouscriptionsTestCase):
+    MOIS = date(2024, 3, 1)
+    FIN_MOIS = date(2024, 3, 31)
+
+    def setUp(self):
+        super().setUp()
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+
+    def _etape(self, campagne, code):
+        return campagne.etape_ids.filtered(lambda e: e.code == code)
+
+    # --- Accumulateur ---
+
+    def test_percentiles_au_rang_le_plus_proche(self):
+        chrono = mesure_module.Chrono(self.env.cr)
+        chrono.durees_unitaires = [i / 1000 for i in range(1, 101)]
+        self.assertEqual(chrono.percentiles(), (0.051, 0.096))
+
+    def test_percentiles_a_defaut_la_moyenne(self):
+        chrono = mesure_module.Chrono(self.env.cr)
+        chrono.nb_unites, chrono.duree = 4, 2.0
+        self.assertEqual(chrono.percentiles(), (0.5, 0.5))
+
+    def test_hors_mesure_les_echantillons_ne_font_rien(self):
+        with mesure_module.chronometrer_unite(), traduire_exceptions_electricore():
+            mesure_module.noter_octets_electricore({'reference': 'F15-1'})
+        self.assertFalse(self.env['souscription.campagne.mesure'].search([]))
+
+    def test_octets_estimes_sur_un_echantillon(self):
+        """Un objet sur `_PAS_ECHANTILLON_OCTETS` est sérialisé ; le trafic
+        est extrapolé à tous les objets reçus."""
+        serialisations = []
+
+        class Objet:
+            def model_dump_json(self):
+                serialisations.append(self)
+                return 'x' * 10
+
+        chrono, jeton = mesure_module.ouvrir_chrono(self.env.cr)
+        for _i in range(120):
+            mesure_module.noter_octets_electricore(Objet())
+        mesure_module.fermer_chrono(chrono, jeton)
+
+        self.assertEqual(len(serialisations), 3, 'objets 1, 51 et 101')
+        self.assertEqual(chrono.objets_electricore, 120)
+        self.assertEqual(chrono.octets_electricore, 1200)
+
+    # --- Mesure d'un bloc ---
+
+    def test_bloc_mesure_avec_trafic_electricore(self):
+        etape = self._etape(self.campagne, 'sync_f15')
+
+        with etape._mesurer('pull') as chrono, traduire_exceptions_electricore():
+            for reference in ('F15-1', 'F15-2'):
+                mesure_module.noter_octets_electricore(SimpleNamespace(reference=reference))
+                with mesure_module.chronometrer_unite():
+                    self.env['souscription.souscription'].search_count([])
+            chrono.nb_unites = 2
+
+        mesure = self.campagne.mesure_ids
+        self.assertEqual(len(mesure), 1)
+        self.assertEqual((mesure.etape_id, mesure.code, mesure.nature), (etape, 'sync_f15', 'pull'))
+        self.assertEqual(mesure.nb_unites, 2)
+        self.assertEqual(mesure.appels_electricore, 1)
+        self.assertGreater(mesure.octets_electricore, 0)
+        self.assertGreaterEqual(mesure.nb_requetes, 2)
+        self.assertLessEqual(mesure.latence_electricore, mesure.duree, 'le travail par unité est hors latence')
+
+    def test_bloc_en_echec_non_enregistre(self):
+        etape = self._etape(self.campagne, 'sync_f15')
+        with self.assertRaises(UserError), etape._mesurer('pull'):
+            raise UserError('Transport indisponible')
+        self.assertFalse(self.campagne.mesure_ids)
+
+    # --- Points de mesure ---
+
+    def test_pull_mesure_ses_unites(self):
+        Campagne = type(self.campagne)
+        with patch.object(Campagne, '_sync_f15_donnees', return_value=(['F15-1', 'F15-2'], ['F15-3'], [])):
+            self.campagne.action_sync_f15()
+
+        self.assertEqual(self.campagne.mesure_ids.mapped('nature'), ['pull'])
+        self.assertEqual(self.campagne.mesure_ids.nb_unites, 3)
+
+    def test_action_executer_mesure_une_action(self):
+        etape = self._etape(self.campagne, 'regulariser_clotures')
+        etape.action_executer()
+        self.assertEqual(self.campagne.mesure_ids.mapped('nature'), ['action'])
+
+    def test_paquet_de_vidange_mesure(self):
+        self.souscription_base.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-MESURE'})
+        self.create_test_periode(self.souscription_base, date_debut=self.MOIS, date_fin=self.FIN_MOIS)
+        etape = self._etape(self.campagne, 'creer_factures')
+        etape.write({'demande': True})
+
+        with self.enter_registry_test_mode():
+            self.env.ref('souscriptions_odoo.ir_cron_vidange_creer_factures').method_direct_trigger()
+
+        mesure = self.campagne.mesure_ids.filtered(lambda m: m.nature == 'paquet')
+        self.assertEqual(len(mesure), 1)
+        self.assertEqual(mesure.nb_unites, 1)
+        etape.invalidate_recordset()
+        self.assertAlmostEqual(etape.cout_unitaire, mesure.duree, places=6, msg='même chronomètre que le paquet')
+
+    # --- Régression d'un mois sur l'autre ---
+
+    def test_variation_par_rapport_au_mois_precedent(self):
+        Mesure = self.env['souscription.campagne.mesure']
+        suivante = self.env['souscription.campagne.facturation'].create({'mois': date(2024, 4, 1)})
+        Mesure.create(
+            {'etape_id': self._etape(self.campagne, 'sync_f15').id, 'nature': 'pull', 'nb_unites': 10, 'duree': 1.0}
+        )
+        mesure = Mesure.create(
+            {'etape_id': self._etape(suivante, 'sync_f15').id, 'nature': 'pull', 'nb_unites': 10, 'duree': 1.5}
+        )
+
+        self.assertAlmostEqual(mesure.variation_pct, 50.0)
+        self.assertAlmostEqual(mesure.debit, 10 / 1.5, places=2)
@@ -0,0 +1,148 @@
+"""Tests du classement ensembliste du statut de facturation de la Campagne.
+
+Le Périmètre de campagne est classé en à tirer / à facturer / facturée /
+émise en UNE requête SQL (`_statuts_facturation`) au lieu d'une recherche de
+Période par souscription : mêmes buckets qu'avant (#157/#301, y compris la
+Période d'ouverture #107), mais un coût en requêtes constant — le bandeau,
+le reste-à-faire des étapes et les drill-downs ne grossissent plus avec le
+Périmètre. La partition et les factures du mois sont en outre mémorisées
+pour la transaction, et oubliées à chaque écriture qui déplace un statut.
+"""
+
+from datetime import date
+
+from odoo.tests.common import tagged
+
+from .common import SouscriptionsTestCase
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneStatutEnsembliste(SouscriptionsTestCase):
+    MOIS = date(2024, 3, 1)
+    FIN_MOIS = date(2024, 3, 31)
+
+    # Périmètre de campagne (_souscriptions_facturables) + classement SQL
+    # (_statuts_facturation) : deux requêtes, quelle que soit la taille.
+    REQUETES_PAR_PARTITION = 2
+
+    def setUp(self):
+        super().setUp()
+        self.souscription_base.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-ENS-BASE'})
+        self.souscription_hphc.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-ENS-HPHC'})
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+
+    def _periode(self, souscription, **kwargs):
+        return self.create_test_periode(souscription, date_debut=self.MOIS, date_fin=self.FIN_MOIS, **kwargs)
+
+    def _creer_souscriptions(self, nombre):
+        Souscription = self.env['souscription.souscription']
+        souscriptions = Souscription.create(
+            [
+                {
+                    'partner_id': self.partner_test.id,
+                    'pdl': f'PDL_ENS_{i:03d}',
+                    'puissance_souscrite': '6',
+                    'type_tarif': 'base',
+                    'date_debut': date(2024, 1, 1),
+                    'provision_mensuelle_kwh': 300.0,
+                }
+                for i in range(nombre)
+            ]
+        )
+        for i, souscription in enumerate(souscriptions):
+            souscription.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': f'RSC-ENS-{i:03d}'})
+        return souscriptions
+
+    # --- Même règle que le classement unitaire (#157/#301/#284) ---
+
+    def test_classe_chaque_statut_du_cycle(self):
+        a_facturer, facturee, emise, legacy = self._creer_souscriptions(4)
+        self._periode(a_facturer)
+        self._periode(facturee)._creer_facture()
+        self._periode(emise)._creer_facture().action_post()
+        self._periode(legacy, facture_legacy_ref='FACT-PROD-2024-0042')
+
+        buckets = self.campagne._souscriptions_par_bucket()
+
+        self.assertEqual(buckets['a_tirer'], self.souscription_base | self.souscription_hphc)
+        self.assertEqual(buckets['a_facturer'], a_facturer)
+        self.assertEqual(buckets['facturee'], facturee)
+        self.assertEqual(set(buckets['emise'].ids), {emise.id, legacy.id})
+
+    def test_statut_unitaire_concorde_avec_la_partition(self):
+        self._periode(self.souscription_base)._creer_facture()
+        buckets = self.campagne._souscriptions_par_bucket()
+        for statut, souscriptions in buckets.items():
+            for souscription in souscriptions:
+                self.assertEqual(self.campagne._statut_facturation(souscription), statut)
+
+    def test_lit_les_ecritures_non_flushees(self):
+        """Le SQL lit les colonnes stockées : une écriture encore en cache ORM
+        (état de la facture) doit être flushée avant le classement."""
+        facture = self._periode(self.souscription_base)._creer_facture()
+        facture.action_post()
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'emise')
+
+    def test_reste_a_faire_reste_cumulatif_amont(self):
+        self._periode(self.souscription_base)._creer_facture()  # facturée
+        self.assertEqual(self.campagne._reste_a_faire('creer_factures'), self.souscription_hphc)
+        self.assertEqual(
+            set(self.campagne._reste_a_faire('emettre_factures').ids),
+            {self.souscription_base.id, self.souscription_hphc.id},
+        )
+
+    # --- Coût constant en requêtes ---
+
+    def test_partition_en_nombre_constant_de_requetes(self):
+        self.campagne._invalider_memo_facturation()
+        with self.assertQueryCount(self.REQUETES_PAR_PARTITION):
+            petit = self.campagne._souscriptions_par_bucket()
+        self.assertEqual(sum(len(bucket) for bucket in petit.values()), 2)
+
+        for souscription in self._creer_souscriptions(12)[:6]:
+            self._periode(souscription)
+
+        self.campagne._invalider_memo_facturation()
+        with self.assertQueryCount(self.REQUETES_PAR_PARTITION):
+            grand = self.campagne._souscriptions_par_bucket()
+        self.assertEqual(sum(len(bucket) for bucket in grand.values()), 14)
+        self.assertEqual(len(grand['a_facturer']), 6)
+
+    # --- Mémo transactionnel de la partition ---
+
+    def test_partition_memorisee_pour_la_transaction(self):
+        self.campagne._souscriptions_par_bucket()
+        self.campagne._factures_du_mois()
+        with self.assertQueryCount(0):
+            self.campagne._souscriptions_par_bucket()
+            self.campagne._factures_du_mois()
+
+    def test_memo_oublie_a_la_creation_de_la_periode(self):
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'a_tirer')
+        self._periode(self.souscription_base)
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'a_facturer')
+
+    def test_memo_oublie_au_cycle_de_vie_de_la_facture(self):
+        periode = self._periode(self.souscription_base)
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'a_facturer')
+        self.assertFalse(self.campagne._factures_du_mois())
+
+        facture = periode._creer_facture()
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'facturee')
+        self.assertEqual(self.campagne._factures_du_mois(), facture)
+
+        facture.action_post()
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'emise')
+
+        facture.button_draft()
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'facturee')
+
+        facture.unlink()
+        self.assertEqual(self.campagne._statut_facturation(self.souscription_base), 'a_facturer')
+        self.assertFalse(self.campagne._factures_du_mois())
+
+    def test_memo_oublie_quand_le_perimetre_bouge(self):
+        self.assertEqual(self.campagne.nb_perimetre, 2)
+        self._creer_souscriptions(1)
+        self.campagne.invalidate_recordset()
+        self.assertEqual(self.campagne.nb_perimetre, 3)
@@ -0,0 +1,120 @@
+"""Tests de l'isolation des échecs de vidange par dichotomie.
+
+Un paquet qui échoue en lot est coupé en deux, chaque moitié retentée sous
+savepoint, seules les moitiés en échec redécoupées : k unités fautives
+parmi n coûtent O(k log n) tentatives. Sémantique inchangée : les unités
+saines sont traitées, chaque unité fautive est sautée avec sa cause.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+from odoo.exceptions import UserError
+from odoo.tests.common import tagged
+
+from .common import SouscriptionsTestCase
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneVidangeBissection(SouscriptionsTestCase):
+    MOIS = date(2024, 3, 1)
+
+    def setUp(self):
+        super().setUp()
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+        self.etape = self.campagne.etape_ids.filtered(lambda e: e.code == 'creer_factures')
+        self.unites = self.env['souscription.souscription'].create(
+            [
+                {
+                    'partner_id': self.partner_test.id,
+                    'pdl': f'PDL_BIS_{i:03d}',
+                    'puissance_souscrite': '6',
+                    'type_tarif': 'base',
+                    'date_debut': date(2024, 1, 1),
+                    'provision_mensuelle_kwh': 300.0,
+                }
+                for i in range(16)
+            ]
+        )
+
+    def _bissecter(self, fautives):
+        """Rejoue `_bissecter` avec une action qui échoue dès que le lot
+        contient une unité fautive ; retourne le résultat et le nombre de
+        tentatives."""
+        tentatives = []
+
+        def action(etape, travail):
+            tentatives.append(travail)
+            if travail & fautives:
+                raise UserError(f'Grille manquante : {(travail & fautives)[:1].pdl}')
+            return len(travail)
+
+        Etape = type(self.etape)
+        with (
+            patch.object(Etape, '_traiter_le_paquet', action),
+            patch.object(Etape, '_traiter_une_unite', action),
+        ):
+            resultat = self.etape._bissecter(self.unites)
+        return resultat, len(tentatives)
+
+    def test_isole_une_unite_fautive_en_log_n_tentatives(self):
+        fautive = self.unites[11]
+
+        (traites, echecs), nb_tentatives = self._bissecter(fautive)
+
+        self.assertEqual(traites, 15)
+        self.assertEqual([unite for unite, _exc in echecs], [fautive])
+        self.assertIn(fautive.pdl, str(echecs[0][1]), "la cause est celle de l'unité fautive")
+        self.assertEqual(nb_tentatives, 8, '2 tentatives par niveau sur 16 = 2⁴ unités, au lieu de 16')
+
+    def test_isole_plusieurs_unites_fautives(self):
+        fautives = self.unites[0] | self.unites[9] | self.unites[15]
+
+        (traites, echecs), nb_tentatives = self._bissecter(fautives)
+
+        self.assertEqual(traites, 13)
+        self.assertEqual({unite.id for unite, _exc in echecs}, set(fautives.ids))
+        self.assertLess(nb_tentatives, len(self.unites) + len(fautives))
+
+    def test_les_moities_saines_restent_acquises(self):
+        """Chaque moitié passe sous son propre savepoint : une moitié saine
+        n'est pas défaite par l'échec de sa voisine."""
+        fautive = self.unites[3]
+        traitees = []
+        Etape = type(self.etape)
+
+        def action(etape, travail):
+            travail.write({'provision_mensuelle_kwh': 400.0})
+            if fautive in travail:
+                raise UserError('Grille manquante')
+            traitees.append(travail)
+            return len(travail)
+
+        with (
+            patch.object(Etape, '_traiter_le_paquet', action),
+            patch.object(Etape, '_traiter_une_unite', action),
+        ):
+            self.etape._bissecter(self.unites)
+
+        self.unites.invalidate_recordset()
+        self.assertEqual(fautive.provision_mensuelle_kwh, 300.0, "l'écriture de l'unité fautive est défaite")
+        self.assertEqual(set((self.unites - fautive).mapped('provision_mensuelle_kwh')), {400.0})
+
+    def test_dichotomie_ne_reclasse_pas_la_partition_par_unite(self):
+        """Le mémo de la partition est vidé à chaque frontière de savepoint :
+        la dichotomie ne doit donc jamais relire les buckets, sous peine d'un
+        classement complet par tentative."""
+        appels = []
+        Campagne = type(self.campagne)
+        statuts_facturation = Campagne._statuts_facturation
+
+        def espion(campagne, souscriptions):
+            appels.append(souscriptions)
+            return statuts_facturation(campagne, souscriptions)
+
+        with patch.object(Campagne, '_statuts_facturation', espion):
+            (traites, _echecs), nb_tentatives = self._bissecter(self.unites[2] | self.unites[13])
+
+        self.assertEqual(traites, 14)
+        self.assertGreater(nb_tentatives, 2)
+        self.assertFalse(appels, 'aucun classement pendant les tentatives sous savepoint')
@@ -0,0 +1,82 @@
+"""Tests du paquet de vidange adaptatif (créer/émettre factures).
+
+Le harnais mesure le coût unitaire de chaque paquet tenté en lot, le lisse
+en moyenne mobile par étape, et dimensionne le paquet suivant pour remplir
+la fraction configurée du budget temps d'une passe. Taille de départ
+(`_TAILLE_PAQUET_VIDANGE`) tant que rien n'est mesuré.
+"""
+
+from datetime import date
+
+from odoo.tests.common import tagged
+
+from .common import SouscriptionsTestCase
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneVidangePaquetAdaptatif(SouscriptionsTestCase):
+    MOIS = date(2024, 3, 1)
+    FIN_MOIS = date(2024, 3, 31)
+
+    def setUp(self):
+        super().setUp()
+        self.souscription_base.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-ADAPT'})
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+        self.etape = self._etape(self.campagne)
+
+    def _etape(self, campagne, code='creer_factures'):
+        return campagne.etape_ids.filtered(lambda e: e.code == code)
+
+    def test_taille_de_depart_sans_mesure(self):
+        self.assertEqual(self.etape._taille_paquet(), self.etape._TAILLE_PAQUET_VIDANGE)
+
+    def test_taille_suit_le_cout_mesure(self):
+        budget = self.etape._budget_par_passe()
+
+        self.etape.cout_unitaire = budget / 20
+        self.assertEqual(self.etape._taille_paquet(), 20)
+
+        self.etape.cout_unitaire = budget * 10
+        self.assertEqual(self.etape._taille_paquet(), 1, 'toujours au moins une unité par passe')
+
+        self.etape.cout_unitaire = budget / 100_000
+        self.assertEqual(self.etape._taille_paquet(), self.etape._TAILLE_PAQUET_VIDANGE_MAX)
+
+    def test_fraction_du_budget_configurable(self):
+        ICP = self.env['ir.config_parameter'].sudo()
+        ICP.set_param('souscriptions.vidange_fraction_budget', '0.3')
+        budget_bas = self.etape._budget_par_passe()
+        ICP.set_param('souscriptions.vidange_fraction_budget', '0.6')
+        self.assertAlmostEqual(self.etape._budget_par_passe(), 2 * budget_bas)
+
+    def test_moyenne_mobile_du_cout_unitaire(self):
+        self.etape._mesurer_cout_unitaire(10, 1.0)
+        self.assertAlmostEqual(self.etape.cout_unitaire, 0.1)
+
+        self.etape._mesurer_cout_unitaire(10, 2.0)
+        lissage = self.etape._LISSAGE_COUT_UNITAIRE
+        self.assertAlmostEqual(self.etape.cout_unitaire, lissage * 0.2 + (1 - lissage) * 0.1)
+
+        self.etape._mesurer_cout_unitaire(0, 5.0)
+        self.assertAlmostEqual(self.etape.cout_unitaire, lissage * 0.2 + (1 - lissage) * 0.1, msg='paquet vide')
+
+    def test_nouvelle_campagne_repart_du_dernier_cout_de_letape(self):
+        self.etape._mesurer_cout_unitaire(4, 2.0)
+        suivante = self.env['souscription.campagne.facturation'].create({'mois': date(2024, 4, 1)})
+
+        self.assertAlmostEqual(self._etape(suivante)._cout_unitaire_reference(), 0.5)
+        self.assertFalse(
+            self._etape(suivante, 'emettre_factures')._cout_unitaire_reference(), 'mesure propre à chaque étape'
+        )
+
+    def test_la_vidange_mesure_le_paquet_traite(self):
+        self.create_test_periode(self.souscription_base, date_debut=self.MOIS, date_fin=self.FIN_MOIS)
+        self.etape.write({'demande': True})
+        cron = self.env.ref('souscriptions_odoo.ir_cron_vidange_creer_factures')
+
+        with self.enter_registry_test_mode():
+            cron.method_direct_trigger()
+
+        self.etape.invalidate_recordset()
+        self.assertEqual(len(self.souscription_base.facture_ids), 1)
+        self.assertGreater(self.etape.cout_unitaire, 0)
@@ -0,0 +1,114 @@
+"""Tests de la vidange à plusieurs workers (créer/émettre factures).
+
+Le bouton d'étape déclenche le cron historique et, si le paramètre système
+`souscriptions.vidange_workers` le demande, des crons de renfort — même
+point d'entrée `_cron_vidanger(code)`. Les workers se partagent la liste de
+travail par verrou `FOR NO KEY UPDATE SKIP LOCKED` (`_reserver`) et la fin
+n'est notifiée qu'une fois (`_conclure`). En mode registre de test, tous les
+curseurs partagent la même transaction : les verrous concurrents ne se
+testent pas ici, seuls l'ordre, la limite et la conclusion unique.
+"""
+
+from datetime import date
+
+from odoo.tests.common import tagged
+
+from .common import SouscriptionsTestCase
+
+
+@tagged('souscriptions', 'souscriptions_campagne', 'post_install', '-at_install')
+class TestCampagneVidangeParallele(SouscriptionsTestCase):
+    MOIS = date(2024, 3, 1)
+    FIN_MOIS = date(2024, 3, 31)
+
+    def setUp(self):
+        super().setUp()
+        self.souscription_base.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-PAR-BASE'})
+        self.souscription_hphc.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': 'RSC-PAR-HPHC'})
+        self.campagne = self.env['souscription.campagne.facturation'].create({'mois': self.MOIS})
+        self.etape = self.campagne.etape_ids.filtered(lambda e: e.code == 'creer_factures')
+
+    def _workers(self, valeur):
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.vidange_workers', valeur)
+        return self.etape._crons_vidange()
+
+    # --- Nombre de workers ---
+
+    def test_un_seul_worker_par_defaut(self):
+        self.assertEqual(self.etape._crons_vidange(), self.env.ref('souscriptions_odoo.ir_cron_vidange_creer_factures'))
+
+    def test_renforts_selon_le_parametre_systeme(self):
+        crons = self._workers('3')
+        self.assertEqual(len(crons), 3)
+        self.assertEqual(set(crons.mapped('code')), {"model._cron_vidanger('creer_factures')"})
+
+    def test_parametre_plafonne_et_tolerant(self):
+        self.assertEqual(len(self._workers('12')), 3, 'plafonné au nombre de crons livrés')
+        self.assertEqual(len(self._workers('0')), 1, 'au moins le cron historique')
+        self.assertEqual(len(self._workers('beaucoup')), 1, 'valeur illisible : comportement historique')
+
+    def test_clic_pose_lintention_et_declenche_chaque_worker(self):
+        self._workers('2')
+        self.campagne.etape_ids.filtered(lambda e: e.code in ('verif_periodes', 'verif_refacturations')).write(
+            {'valide': True}
+        )
+        triggers_avant = self.env['ir.cron.trigger'].search_count([('cron_id', 'in', self.etape._crons_vidange().ids)])
+
+        self.campagne.action_creer_factures()
+
+        self.assertTrue(self.etape.demande)
+        triggers = self.env['ir.cron.trigger'].search_count([('cron_id', 'in', self.etape._crons_vidange().ids)])
+        self.assertEqual(triggers - triggers_avant, 2)
+
+    # --- Réservation ---
+
+    def test_reserver_garde_lordre_et_la_limite(self):
+        souscriptions = self.souscription_hphc | self.souscription_base
+        reserves = self.etape._reserver(souscriptions, limit=1)
+        self.assertEqual(reserves, self.souscription_hphc, "l'ordre de la liste de travail est respecté")
+        self.assertEqual(self.etape._reserver(souscriptions), souscriptions)
+        self.assertFalse(self.etape._reserver(self.env['souscription.souscription']))
+
+    def test_reserver_paquet_sur_letat_courant(self):
+        """Sélection et verrou en une requête sur l'état courant : une
+        souscription déjà facturée (par un autre worker, par exemple) n'est
+        jamais re-réservée ; la limite tient."""
+        for souscription in (self.souscription_base, self.souscription_hphc):
+            self.create_test_periode(souscription, date_debut=self.MOIS, date_fin=self.FIN_MOIS)
+        self.assertEqual(len(self.etape._reserver_paquet(limit=1)), 1)
+
+        self.souscription_base.creer_factures()
+
+        self.assertEqual(self.etape._reserver_paquet(), self.souscription_hphc)
+        self.assertEqual(
+            self.etape._reserver_paquet(),
+            self.campagne._souscriptions_a_facturer_du_mois(),
+            'même travail que la liste',
+        )
+
+    # --- Conclusion unique ---
+
+    def test_fin_notifiee_une_seule_fois(self):
+        self.etape.write({'demande': True})
+
+        self.etape._conclure()
+        self.etape._conclure()
+
+        self.assertFalse(self.etape.demande)
+        recaps = [m for m in self.campagne.message_ids.mapped('body') if 'Échecs' in m]
+        self.assertEqual(len(recaps), 1, 'un second worker arrivé en fin ne reposte pas le récap')
+
+    def test_un_worker_vide_et_conclut_comme_avant(self):
+        self.create_test_periode(self.souscription_base, date_debut=self.MOIS, date_fin=self.FIN_MOIS)
+        self.etape.write({'demande': True})
+        cron = self.env.ref('souscriptions_odoo.ir_cron_vidange_creer_factures')
+
+        with self.enter_registry_test_mode():
+            for _ in range(3):
+                cron.method_direct_trigger()
+                self.etape.invalidate_recordset()
+                if not self.etape.demande:
+                    break
+
+        self.assertFalse(self.etape.demande)
+        self.assertEqual(len(self.souscription_base.facture_ids), 1)
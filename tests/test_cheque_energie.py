@@ -11,6 +11,7 @@ couvert en intégration côté `test_periode_facture.py`.
 """
 
 from datetime import date
+from unittest.mock import patch
 
 from odoo.exceptions import UserError
 from odoo.tests.common import TransactionCase, tagged
@@ -235,3 +236,35 @@ class TestChequeEnergieImputer(SouscriptionsTestCase):
 
         self.assertAlmostEqual(facture_fevrier.amount_residual, 0.0, places=2)
         self.assertAlmostEqual(cheque.solde, solde_apres_janvier - 15.0, places=2)
+
+    def test_imputation_en_lot_equivaut_aux_appels_successifs(self):
+        """Émission d'un paquet : `imputer()` reçoit toutes les factures
+        postées — une seule recherche des chèques, même FIFO et même report
+        du reliquat qu'en appels successifs, facture par facture dans
+        l'ordre du lot ; une facture d'un autre partenaire n'y touche pas."""
+        cheque = self._new_cheque(montant=20.0)
+        cheque.action_valider()
+        autre = self.env['res.partner'].create({'name': 'Sans chèque'})
+        facture_janvier = self._new_facture(15.0)
+        facture_autre = self._new_facture(15.0, partner=autre)
+        facture_fevrier = self._new_facture(15.0)
+        Cheque = type(self.env['souscription.cheque_energie'])
+        recherches = []
+        search_natif = Cheque.search
+
+        def search(modele, domaine, *args, **kwargs):
+            recherches.append(domaine)
+            return search_natif(modele, domaine, *args, **kwargs)
+
+        with patch.object(Cheque, 'search', search):
+            consommes = self.env['souscription.cheque_energie'].imputer(
+                facture_janvier | facture_autre | facture_fevrier
+            )
+
+        self.assertEqual(len(recherches), 1)
+        self.assertEqual(consommes, cheque)
+        self.assertAlmostEqual(facture_janvier.amount_residual, 0.0, places=2)
+        reliquat = 20.0 - facture_janvier.amount_total
+        self.assertAlmostEqual(facture_fevrier.amount_residual, facture_fevrier.amount_total - reliquat, places=2)
+        self.assertAlmostEqual(facture_autre.amount_residual, facture_autre.amount_total, places=2)
+        self.assertAlmostEqual(cheque.solde, 0.0, places=2)
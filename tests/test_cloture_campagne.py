@@ -14,6 +14,7 @@ réel de la dernière mensuelle d'un lissé (`_tamponner_provision`).
 """
 
 from datetime import date
+from unittest.mock import patch
 
 from odoo.tests.common import tagged
 
@@ -385,6 +386,32 @@ class TestRegulariserClotures(SouscriptionsTestCase):
             'souscription hors périmètre de juillet : aucune Période créée malgré le flux',
         )
 
+    # --- Skip-and-report : une souscription en erreur n'arrête pas le lot ---
+
+    def test_brouillon_en_erreur_rapporte_sans_bloquer_les_autres(self):
+        self._grille_moulin('Grille Clôture Isolation')
+        saine = self._souscription_lissee('RSC-CLOTURE-SAINE', 'PDL_CLOTURE_SAINE')
+        fautive = self._souscription_lissee('RSC-CLOTURE-FAUTIVE', 'PDL_CLOTURE_FAUTIVE')
+        for souscription in (saine, fautive):
+            self._periode_legacy(souscription, 1, energie_base_kwh=225.0)
+            souscription.date_fin = date(2024, 1, 31)
+        Souscription = type(self.env['souscription.souscription'])
+        brouillon = Souscription._regularisation_brouillon
+
+        def brouillon_fragile(souscription):
+            if souscription == fautive:
+                raise RuntimeError('brouillon impossible')
+            return brouillon(souscription)
+
+        campagne = self._campagne(date(2024, 2, 1))
+        with patch.object(Souscription, '_regularisation_brouillon', brouillon_fragile), self._sans_appel_reseau():
+            notification = campagne.action_regulariser_clotures()
+
+        self.assertIn('Émises : 1', notification['params']['message'])
+        self.assertIn('Erreurs : 1', notification['params']['message'])
+        self.assertEqual(saine.etat, 'resiliee')
+        self.assertEqual(fautive.etat, 'en_attente_cloture', 'retentée au passage suivant')
+
     # --- Idempotence structurelle : hors de la file, non-événement ---
 
     def test_regulariser_clotures_reste_no_op_une_fois_resiliee(self):
@@ -7,14 +7,16 @@ couture de transport (`_appeler` / `_ouvrir_flux`), plus jamais cette garde
 (cf. tests/test_rsc_service.py, tests/test_pull_meta_periodes.py).
 """
 
+import json
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from odoo import fields
 from odoo.addons.souscriptions_odoo.models.core import electricore_client_fabrique as fabrique_module
 from odoo.exceptions import UserError
 from odoo.tests.common import tagged
 
-from .common import SouscriptionsTestCase
+from .common import SouscriptionsTestCase, flux_electricore
 
 _MODEL = 'souscription.electricore.client'
 
@@ -26,6 +28,9 @@ class TestElectricoreClientFabrique(SouscriptionsTestCase):
         patcher = patch.object(fabrique_module, 'ELECTRICORE_CLIENT_DISPONIBLE', True)
         patcher.start()
         self.addCleanup(patcher.stop)
+        pool_patcher = patch.dict(fabrique_module._POOL_CLIENTS, clear=True)
+        pool_patcher.start()
+        self.addCleanup(pool_patcher.stop)
         # #152 : la fabrique retombe sur les variables d'environnement
         # ELECTRICORE_URL/API_KEY quand l'ir.config_parameter est absent. On les
         # neutralise ici pour rendre ces tests hermétiques (config = config_parameter
@@ -61,3 +66,225 @@ class TestElectricoreClientFabrique(SouscriptionsTestCase):
         with patch.object(fabrique_module, 'ElectricoreClient') as MockClient:
             self.env[_MODEL].client()
         MockClient.assert_called_once_with(url='https://electricore.example.test', api_key='fake-api-key')
+
+    def test_pool_reutilise_le_client_de_la_meme_configuration(self):
+        with patch.object(fabrique_module, 'ElectricoreClient') as MockClient:
+            premier = self.env[_MODEL].client()
+            second = self.env[_MODEL].client()
+        self.assertIs(premier, second)
+        MockClient.assert_called_once()
+        self.assertEqual(self.env[_MODEL].statistiques_pool()['clients'], 1)
+
+    def test_pool_invalide_quand_la_configuration_change(self):
+        avant = self.env[_MODEL].statistiques_pool()
+        with patch.object(fabrique_module, 'ElectricoreClient') as MockClient:
+            self.env[_MODEL].client()
+            self.env['ir.config_parameter'].sudo().set_param('souscriptions.electricore_api_key', 'nouvelle-cle')
+            self.env[_MODEL].client()
+        self.assertEqual(MockClient.call_count, 2)
+        MockClient.assert_called_with(url='https://electricore.example.test', api_key='nouvelle-cle')
+        apres = self.env[_MODEL].statistiques_pool()
+        self.assertEqual(apres['clients'], 1, "l'ancienne configuration sort du pool")
+        self.assertEqual(apres['invalidations'] - avant['invalidations'], 1)
+
+    def test_pool_un_client_par_base_sans_eviction_croisee(self):
+        """Un processus qui sert deux bases aux réglages différents : chacune
+        garde son client, l'alternance ne reconstruit rien."""
+        avant = self.env[_MODEL].statistiques_pool()
+        with patch.object(fabrique_module, 'ElectricoreClient') as MockClient:
+            for _tour in range(3):
+                fabrique_module._client_du_pool('base_a', 'https://a.example.test', 'cle-a')
+                fabrique_module._client_du_pool('base_b', 'https://b.example.test', 'cle-b')
+        self.assertEqual(MockClient.call_count, 2)
+        apres = self.env[_MODEL].statistiques_pool()
+        self.assertEqual(apres['clients'], 2)
+        self.assertEqual(apres['invalidations'], avant['invalidations'], 'usage multi-base, pas un changement')
+
+
+class _ObjetContrat:
+    """Stub d'un modèle typé du contrat : même paire de sérialisation que
+    pydantic (`model_dump_json`/`model_validate_json`)."""
+
+    def __init__(self, reference):
+        self.reference = reference
+
+    def model_dump_json(self):
+        return json.dumps({'reference': self.reference})
+
+    @classmethod
+    def model_validate_json(cls, donnees):
+        return cls(**json.loads(donnees))
+
+
+@tagged('souscriptions', 'souscriptions_electricore_client_fabrique', 'post_install', '-at_install')
+class TestElectricoreClientCache(SouscriptionsTestCase):
+    """Cache des flux (opt-in) : rejeu typé depuis une pièce jointe JSONL
+    gzip, clé endpoint + paramètres + ensemble de RSC, TTL, invalidation."""
+
+    def setUp(self):
+        super().setUp()
+        for cible, valeur in (('ELECTRICORE_CLIENT_DISPONIBLE', True), ('_MODULES_REJOUABLES', (__name__,))):
+            patcher = patch.object(fabrique_module, cible, valeur)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        pool_patcher = patch.dict(fabrique_module._POOL_CLIENTS, clear=True)
+        pool_patcher.start()
+        self.addCleanup(pool_patcher.stop)
+        ICP = self.env['ir.config_parameter'].sudo()
+        ICP.set_param('souscriptions.electricore_url', 'https://electricore.example.test')
+        ICP.set_param('souscriptions.electricore_api_key', 'fake-api-key')
+        ICP.set_param('souscriptions.electricore_cache', 'True')
+        self.reel = MagicMock()
+        self.reel.meta_periodes.side_effect = lambda **kw: flux_electricore([_ObjetContrat(rsc) for rsc in kw['rsc']])
+        self.Fabrique = self.env[_MODEL]
+
+    def _tirer(self, rsc):
+        with patch.object(fabrique_module, 'ElectricoreClient', return_value=self.reel):
+            client = self.Fabrique.client()
+        with client.meta_periodes(mois='2024-01-01', rsc=rsc) as stream:
+            return list(stream)
+
+    def test_second_appel_rejoue_sans_reseau_les_memes_objets_types(self):
+        avant = self.Fabrique.statistiques_cache()
+
+        premier = self._tirer(['RSC-B', 'RSC-A'])
+        second = self._tirer(['RSC-A', 'RSC-B'])
+
+        self.assertEqual(self.reel.meta_periodes.call_count, 1, 'même ensemble de RSC, même clé')
+        self.assertEqual([o.reference for o in second], [o.reference for o in premier])
+        self.assertIsInstance(second[0], _ObjetContrat)
+        apres = self.Fabrique.statistiques_cache()
+        self.assertEqual((apres['hits'] - avant['hits'], apres['misses'] - avant['misses']), (1, 1))
+
+    def test_autre_ensemble_de_rsc_autre_entree(self):
+        self._tirer(['RSC-A'])
+        self._tirer(['RSC-A', 'RSC-B'])
+        self.assertEqual(self.reel.meta_periodes.call_count, 2)
+
+    def test_entree_perimee_au_dela_du_ttl(self):
+        self._tirer(['RSC-A'])
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.electricore_cache_ttl', '-1')
+        self._tirer(['RSC-A'])
+        self.assertEqual(self.reel.meta_periodes.call_count, 2)
+
+    def test_lecture_ne_supprime_pas_la_purge_retire_les_perimees(self):
+        """Une entrée périmée est ignorée à la lecture, jamais supprimée là ;
+        c'est le cron de purge qui la retire."""
+        self._tirer(['RSC-A'])
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.electricore_cache_ttl', '-1')
+        with patch.object(type(self.env['ir.attachment']), 'unlink') as unlink:
+            self._tirer(['RSC-A'])
+        unlink.assert_not_called()
+        self.assertEqual(self.Fabrique.statistiques_cache()['entrees'], 2)
+
+        self.Fabrique._cron_purger_cache()
+
+        self.assertEqual(self.Fabrique.statistiques_cache()['entrees'], 0)
+
+    def test_flux_enregistre_au_fil_rejoue_a_l_identique(self):
+        rscs = [f'RSC-{rang:04d}' for rang in range(500)]
+        premier = self._tirer(rscs)
+        second = self._tirer(rscs)
+        self.assertEqual(self.reel.meta_periodes.call_count, 1)
+        self.assertEqual([o.reference for o in second], [o.reference for o in premier])
+
+    def test_invalidation_explicite(self):
+        self._tirer(['RSC-A'])
+        self.Fabrique.vider_cache('meta_periodes')
+        self._tirer(['RSC-A'])
+        self.assertEqual(self.reel.meta_periodes.call_count, 2)
+
+    def test_flux_interrompu_jamais_mis_en_cache(self):
+        with patch.object(fabrique_module, 'ElectricoreClient', return_value=self.reel):
+            client = self.Fabrique.client()
+        with self.assertRaises(ValueError), client.meta_periodes(mois='2024-01-01', rsc=['RSC-A']) as stream:
+            next(iter(stream))
+            raise ValueError('consommateur en échec')
+        self.assertEqual(self.Fabrique.statistiques_cache()['entrees'], 0)
+
+    def test_desactive_par_defaut(self):
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.electricore_cache', 'False')
+        with patch.object(fabrique_module, 'ElectricoreClient', return_value=self.reel):
+            self.assertIs(self.Fabrique.client(), self.reel)
+
+
+@tagged('souscriptions', 'souscriptions_electricore_client_fabrique', 'post_install', '-at_install')
+class TestPolitiqueTransport(SouscriptionsTestCase):
+    """Politique de transport : essais espacés sur échec transitoire,
+    disjoncteur du processus, re-déclenchement du cron propriétaire. Les
+    attentes sont neutralisées et le disjoncteur remis à zéro par
+    `SouscriptionsTestCase`."""
+
+    def test_echec_transitoire_retente_puis_reussit(self):
+        appel = MagicMock(side_effect=[fabrique_module.IngestionEnCours('verrou'), 'ok'])
+
+        self.assertEqual(fabrique_module.appeler_avec_reprise(appel), 'ok')
+        self.assertEqual(appel.call_count, 2)
+        (attente,), _kwargs = fabrique_module._attendre.call_args
+        self.assertLessEqual(attente, fabrique_module._DELAI_BASE)
+        self.assertEqual(fabrique_module._DISJONCTEUR['echecs'], 0, 'un succès referme le compteur')
+
+    def test_essais_bornes_puis_erreur_d_origine(self):
+        appel = MagicMock(side_effect=ConnectionError('réseau coupé'))
+
+        with self.assertRaises(ConnectionError):
+            fabrique_module.appeler_avec_reprise(appel)
+        self.assertEqual(appel.call_count, fabrique_module._TENTATIVES)
+
+    def test_erreur_locale_jamais_retentee(self):
+        """Une erreur système locale (fichier, permission) n'est pas du
+        réseau : ni retentée, ni transitoire."""
+        appel = MagicMock(side_effect=PermissionError('cache illisible'))
+
+        with self.assertRaises(PermissionError):
+            fabrique_module.appeler_avec_reprise(appel)
+        appel.assert_called_once()
+        self.assertFalse(fabrique_module.est_transitoire(PermissionError('cache illisible')))
+        self.assertTrue(fabrique_module.est_transitoire(TimeoutError('délai dépassé')))
+
+    def test_precondition_jamais_retentee(self):
+        appel = MagicMock(side_effect=fabrique_module.PreconditionNonRemplie('réconciliez les RSC'))
+
+        with self.assertRaises(fabrique_module.PreconditionNonRemplie):
+            fabrique_module.appeler_avec_reprise(appel)
+        appel.assert_called_once()
+
+    def test_disjoncteur_ouvert_refuse_sans_appel_reseau(self):
+        appel = MagicMock(side_effect=fabrique_module.IngestionEnCours('verrou'))
+        with patch.object(fabrique_module, '_SEUIL_DISJONCTEUR', 2):
+            with self.assertRaises(fabrique_module.DisjoncteurOuvert):
+                fabrique_module.appeler_avec_reprise(appel)
+            self.assertEqual(appel.call_count, 2)
+
+            with self.assertRaises(UserError) as cm, fabrique_module.traduire_exceptions_electricore():
+                fabrique_module.appeler_avec_reprise(appel)
+        self.assertEqual(appel.call_count, 2, 'disjoncteur ouvert : aucun appel ne part')
+        self.assertIn('plus tard', str(cm.exception))
+
+    def test_flux_seule_l_ouverture_est_retentee(self):
+        ouvrir = MagicMock(side_effect=[fabrique_module.IngestionEnCours('verrou'), flux_electricore(['a', 'b'])])
+        with fabrique_module.ouvrir_flux_avec_reprise(ouvrir) as stream:
+            self.assertEqual(list(stream), ['a', 'b'])
+        self.assertEqual(ouvrir.call_count, 2)
+
+        ouvrir = MagicMock(side_effect=lambda: flux_electricore(['a']))
+        with self.assertRaises(ConnectionError), fabrique_module.ouvrir_flux_avec_reprise(ouvrir) as stream:
+            next(iter(stream))
+            raise ConnectionError('coupure en cours de lecture')
+        ouvrir.assert_called_once()
+
+    def test_replanifie_le_cron_seulement_sur_echec_transitoire(self):
+        cron = self.env.ref('souscriptions_odoo.cron_poll_affaires_enedis')
+        Fabrique = self.env[_MODEL]
+        transitoire = UserError('ingestion en cours')
+        transitoire.__cause__ = fabrique_module.IngestionEnCours('verrou')
+
+        with patch.object(type(cron), '_trigger') as trigger:
+            self.assertIsNone(Fabrique.replanifier_si_transitoire(cron, UserError('configuration manquante')))
+            trigger.assert_not_called()
+
+            reprise = Fabrique.replanifier_si_transitoire(cron, transitoire)
+        trigger.assert_called_once_with(at=reprise)
+        self.assertAlmostEqual(
+            (reprise - fields.Datetime.now()).total_seconds(), fabrique_module._DELAI_REPLANIFICATION, delta=60
+        )
@@ -1,4 +1,5 @@
 from datetime import date
+from unittest.mock import patch
 
 from odoo.exceptions import UserError, ValidationError
 from odoo.tests.common import TransactionCase, tagged
@@ -143,6 +144,34 @@ class TestGrillePrix(TransactionCase):
             'la grille précédente redevient en vigueur, aucun trou de période',
         )
 
+    # === Index en mémoire (timeline par régime, tables de prix figées) ===
+
+    def test_get_grille_active_ne_relit_pas_la_base(self):
+        """Timeline en cache : une fois construite, la sélection ne lance
+        plus aucune recherche."""
+        Grille = self.env['grille.prix']
+        Grille.get_grille_active(date(2024, 6, 15))
+
+        with patch.object(type(Grille), 'search', side_effect=AssertionError('recherche inattendue')):
+            self.assertEqual(Grille.get_grille_active(date(2024, 7, 15)), self.grille)
+
+    def test_archiver_une_grille_la_retire_de_la_timeline(self):
+        grille_2025 = self.env['grille.prix'].create({'name': 'Grille 2025', 'date_debut': date(2025, 1, 1)})
+        self.assertEqual(self.env['grille.prix'].get_grille_active(date(2025, 3, 1)), grille_2025)
+
+        grille_2025.active = False
+
+        self.assertEqual(self.env['grille.prix'].get_grille_active(date(2025, 3, 1)), self.grille)
+
+    def test_modifier_un_prix_invalide_la_table(self):
+        """Table de prix figée, mais jamais périmée : l'écriture d'une ligne
+        invalide l'index."""
+        self.assertEqual(self._prix_energie(self.grille.composants('base', 6.0), 'base'), 0.2276)
+        produit_base = self.env.ref('souscriptions_odoo.souscriptions_product_energie_base')
+        self.grille.ligne_ids.filtered(lambda l: l.product_id == produit_base).prix_unitaire = 0.25
+
+        self.assertEqual(self._prix_energie(self.grille.composants('base', 6.0), 'base'), 0.25)
+
     # === composants() — l'unique règle d'assemblage des prix (ADR 0029) ===
 
     def _prix_energie(self, composants, cadran):
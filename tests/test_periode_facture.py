@@ -6,7 +6,9 @@ expose sa facture via `facture_id`, champ calculé/stocké dérivé de ce lien.
 """
 
 from datetime import date
+from unittest.mock import patch
 
+from odoo.exceptions import UserError
 from odoo.tests.common import tagged
 
 from .common import SouscriptionsTestCase, build_grille_lignes
@@ -134,20 +136,80 @@ class TestPeriodeFactureRegenerationEmission(SouscriptionsTestCase):
         self.assertEqual(ligne_apres.price_unit, -5.0)
 
     def test_lignes_generees_recomposees_a_l_emission(self):
-        """Les lignes GÉNÉRÉES sont bien re-composées (supprimées puis
-        recréées) à l'émission — même structure qu'au brouillon (la provision
-        et la grille ne bougent pas dans cette tranche, ADR 0030 décision 4
-        vs tranche 3)."""
+        """Les lignes GÉNÉRÉES sont re-composées à l'émission par différence :
+        source inchangée (la provision et la grille ne bougent pas, ADR 0030
+        décision 4 vs tranche 3), lignes inchangées — mêmes enregistrements,
+        même structure qu'au brouillon."""
         periode = self.create_test_periode(self.souscription_base, provision_base_kwh=100.0)
         facture = periode._creer_facture()
-        ids_avant = set(facture.invoice_line_ids.filtered('souscription_ligne_generee').ids)
+        ids_avant = facture.invoice_line_ids.filtered('souscription_ligne_generee').ids
 
         facture.action_post()
 
-        ids_apres = set(facture.invoice_line_ids.filtered('souscription_ligne_generee').ids)
-        self.assertFalse(ids_avant & ids_apres, 'les anciennes lignes générées sont supprimées, pas réutilisées')
+        ids_apres = facture.invoice_line_ids.filtered('souscription_ligne_generee').ids
+        self.assertEqual(ids_avant, ids_apres, 'rien ne change : aucune ligne supprimée ni recréée')
         self.assert_invoice_structure(facture)
 
+    def test_recomposition_ne_reecrit_que_la_ligne_qui_change(self):
+        """Recomposition par différence : seule la quantité d'énergie bouge,
+        seule sa ligne est réécrite — les autres lignes générées gardent leur
+        enregistrement, aucune n'est recréée."""
+        periode = self.create_test_periode(self.souscription_base, energie_base_kwh=100.0)
+        facture = periode._creer_facture()
+        generees_avant = facture.invoice_line_ids.filtered('souscription_ligne_generee')
+        periode.energie_base_kwh = 130.0
+
+        commandes, disparues = facture._commandes_lignes_generees(facture._composer_lignes_generees())
+
+        energie = generees_avant.filtered(lambda l: l.name == 'Énergie Base')
+        self.assertEqual(commandes, [(1, energie.id, {'quantity': 130.0})])
+        self.assertFalse(disparues)
+
+        facture._recomposer_lignes_generees()
+
+        self.assertEqual(facture.invoice_line_ids.filtered('souscription_ligne_generee'), generees_avant)
+        self.assertEqual(energie.quantity, 130.0)
+
+    def test_recomposition_ajoute_en_fin_les_refacturations_nouvelles(self):
+        """Une Refacturation entrée en file s'ajoute en fin de document
+        (section « Prestations Enedis » + sa ligne) sans toucher aux lignes
+        déjà là."""
+        periode = self.create_test_periode(self.souscription_base, provision_base_kwh=100.0)
+        facture = periode._creer_facture()
+        generees_avant = facture.invoice_line_ids.filtered('souscription_ligne_generee')
+        self.env['souscription.refacturation'].create(
+            {
+                'souscription_id': self.souscription_base.id,
+                'reference': 'F15-DIFF',
+                'libelle': 'Déplacement',
+                'prix': 25.0,
+                'quantite': 1.0,
+            }
+        )
+
+        facture._recomposer_lignes_generees()
+
+        generees_apres = facture.invoice_line_ids.filtered('souscription_ligne_generee')
+        self.assertLess(generees_avant, generees_apres, 'lignes existantes conservées')
+        nouvelles = (generees_apres - generees_avant).sorted(lambda l: (l.sequence, l.id))
+        self.assertEqual(nouvelles.mapped('name'), ['Prestations Enedis', 'Déplacement'])
+
+    def test_recomposition_complete_si_l_ordre_change(self):
+        """Une ligne nouvelle au milieu du document (note TURPE fixe sous
+        l'abonnement) : l'appariement bouleverserait l'ordre, repli sur la
+        recomposition complète — la note arrive à sa place."""
+        periode = self.create_test_periode(self.souscription_base, provision_base_kwh=100.0, turpe_fixe=0.0)
+        facture = periode._creer_facture()
+        generees_avant = facture.invoice_line_ids.filtered('souscription_ligne_generee')
+        periode.turpe_fixe = 8.5
+
+        facture._recomposer_lignes_generees()
+
+        generees_apres = facture.invoice_line_ids.filtered('souscription_ligne_generee')
+        self.assertFalse(generees_avant.exists(), 'toutes recréées')
+        noms = generees_apres.sorted(lambda l: (l.sequence, l.id)).mapped('name')
+        self.assertLess(noms.index('Dont turpe fixe: 8.50€'), noms.index('Énergie'))
+
     def test_refacturation_entree_apres_le_brouillon_rassemblee_a_l_emission(self):
         """AC #266 : une Refacturation entrée en file APRÈS la création du
         brouillon est rassemblée à l'émission (re-génération), pas seulement
@@ -368,6 +430,7 @@ class TestPeriodeEditionBrouillonRegenerationFilDeLeau(SouscriptionsTestCase):
         self.assertEqual(hp_avant.quantity, 150.0)
 
         periode.write({'provision_hp_kwh': 175.0})  # correction du·de la facturiste
+        self.vider_recompositions()
 
         hp_apres = facture.invoice_line_ids.filtered(lambda l: l.name == 'Énergie HP')
         self.assertEqual(hp_apres.quantity, 175.0, "l'édition régénère le brouillon")
@@ -387,6 +450,7 @@ class TestPeriodeEditionBrouillonRegenerationFilDeLeau(SouscriptionsTestCase):
         )
 
         periode.write({'provision_hp_kwh': 175.0})
+        self.vider_recompositions()
 
         ligne_manuelle = facture.invoice_line_ids.filtered(lambda l: l.name == 'Geste commercial')
         self.assertEqual(len(ligne_manuelle), 1, 'la ligne manuelle survit à la régénération au fil de l’eau')
@@ -404,6 +468,7 @@ class TestPeriodeEditionBrouillonRegenerationFilDeLeau(SouscriptionsTestCase):
         self.assertEqual(ligne.quantity, 100.0)
 
         periode.write({'energie_base_kwh': 130.0})  # estimation corrigée à la main
+        self.vider_recompositions()
 
         ligne = facture.invoice_line_ids.filtered(lambda l: l.name == 'Énergie Base')
         self.assertEqual(ligne.quantity, 130.0, 'le mesuré corrigé se reflète en live dans le brouillon')
@@ -415,5 +480,199 @@ class TestPeriodeEditionBrouillonRegenerationFilDeLeau(SouscriptionsTestCase):
         self.assertFalse(periode.facture_id)
 
         periode.write({'provision_base_kwh': 150.0})  # ne lève rien
+        self.vider_recompositions()
 
         self.assertEqual(periode.provision_base_kwh, 150.0)
+
+    def test_plusieurs_points_d_entree_une_seule_recomposition(self):
+        """File de la transaction : un pull qui touche énergies, TURPE puis
+        une insertion F15 sur la même Souscription planifient le même
+        brouillon trois fois — il n'est recomposé qu'UNE fois, au precommit,
+        avec l'état final de sa source."""
+        periode = self.create_test_periode(self.souscription_base, energie_base_kwh=100.0)
+        facture = periode._creer_facture()
+        Move = type(self.env['account.move'])
+        recompositions = []
+        recomposer = Move._recomposer_lignes_generees
+
+        def compter(moves):
+            recompositions.append(moves.ids)
+            return recomposer(moves)
+
+        with patch.object(Move, '_recomposer_lignes_generees', compter):
+            periode.write({'energie_base_kwh': 120.0})
+            periode.write({'turpe_fixe': 12.0})
+            self.env['souscription.refacturation']._recomposer_brouillons_mensuels({self.souscription_base.id})
+            self.assertFalse(recompositions, 'rien avant le precommit')
+            self.vider_recompositions()
+
+        self.assertEqual(recompositions, [facture.ids])
+        ligne = facture.invoice_line_ids.filtered(lambda l: l.name == 'Énergie Base')
+        self.assertEqual(ligne.quantity, 120.0)
+
+    def test_file_dedupliquee_par_portee_de_savepoint(self):
+        """Le precommit tourne aussi à l'entrée et à la sortie d'un
+        savepoint : ce qui est planifié avant est recomposé à l'entrée, ce
+        qui est planifié dedans (deux fois) l'est une fois à la sortie, et
+        ce qui suit attend le commit — une recomposition par portée."""
+        periode = self.create_test_periode(self.souscription_base, energie_base_kwh=100.0)
+        facture = periode._creer_facture()
+        Move = type(self.env['account.move'])
+        recompositions = []
+        recomposer = Move._recomposer_lignes_generees
+
+        def compter(moves):
+            recompositions.append(moves.ids)
+            return recomposer(moves)
+
+        with patch.object(Move, '_recomposer_lignes_generees', compter):
+            periode.write({'energie_base_kwh': 110.0})
+            with self.env.cr.savepoint():
+                self.assertEqual(len(recompositions), 1, "planifié avant : vidé à l'entrée du savepoint")
+                periode.write({'energie_base_kwh': 120.0})
+                periode.write({'turpe_fixe': 12.0})
+                self.assertEqual(len(recompositions), 1, 'rien avant la sortie du savepoint')
+            self.assertEqual(len(recompositions), 2, 'planifié dedans : une fois, à la sortie')
+            periode.write({'energie_base_kwh': 130.0})
+            self.vider_recompositions()
+
+        self.assertEqual(recompositions, [facture.ids] * 3)
+        ligne = facture.invoice_line_ids.filtered(lambda l: l.name == 'Énergie Base')
+        self.assertEqual(ligne.quantity, 130.0)
+
+    def test_emission_retire_le_brouillon_de_la_file(self):
+        """`_post()` recompose sur-le-champ (tampon puis re-génération) : le
+        move émis sort de la file, le precommit ne le recompose pas une
+        seconde fois."""
+        periode = self.create_test_periode(self.souscription_base, energie_base_kwh=100.0)
+        facture = periode._creer_facture()
+        periode.write({'energie_base_kwh': 130.0})
+        Move = type(self.env['account.move'])
+
+        facture.action_post()
+        with patch.object(Move, '_recomposer_lignes_generees') as recomposer:
+            self.vider_recompositions()
+
+        recomposer.assert_not_called()
+        self.assertEqual(facture.state, 'posted')
+
+
+@tagged('souscriptions', 'souscriptions_periode_facture', 'post_install', '-at_install')
+class TestPeriodeFacturesLot(SouscriptionsTestCase):
+    """Création en lot (`souscription.periode._creer_factures_lot`) : un seul
+    `account.move.create(vals_list)` pour tout le recordset, mêmes factures
+    que la création unitaire `_creer_facture`."""
+
+    def _periodes(self):
+        janvier = self.create_test_periode(self.souscription_base)
+        fevrier = self.create_test_periode(
+            self.souscription_base, date_debut=date(2024, 2, 1), date_fin=date(2024, 2, 29)
+        )
+        hphc = self.create_test_periode(self.souscription_hphc)
+        return janvier | fevrier | hphc
+
+    def test_une_facture_par_periode_en_un_seul_create(self):
+        periodes = self._periodes()
+        Move = type(self.env['account.move'])
+        appels = []
+        create_natif = Move.create
+
+        def create(moves, vals_list):
+            appels.append(len(vals_list))
+            return create_natif(moves, vals_list)
+
+        with patch.object(Move, 'create', create):
+            factures = periodes._creer_factures_lot()
+
+        self.assertEqual(appels, [3], 'un seul create multi pour tout le lot')
+        self.assertEqual(factures.periode_id, periodes)
+        self.assertEqual([facture.periode_id for facture in factures], list(periodes), 'ordre du recordset')
+        self.assertEqual(set(factures.mapped('state')), {'draft'})
+
+    def test_memes_lignes_que_la_creation_unitaire(self):
+        periode = self.create_test_periode(self.souscription_hphc)
+
+        def lignes(facture):
+            return [(l.display_type, l.name, l.quantity, l.price_unit) for l in facture.invoice_line_ids]
+
+        en_lot = lignes(periode._creer_factures_lot())
+        periode.facture_id.unlink()
+        unitaire = lignes(periode._creer_facture())
+
+        self.assertTrue(unitaire)
+        self.assertEqual(en_lot, unitaire)
+
+    def test_creer_factures_rassemble_les_prestations_sur_la_premiere_facture(self):
+        self.env['souscription.refacturation'].create(
+            {
+                'souscription_id': self.souscription_base.id,
+                'reference': 'F15-LOT',
+                'libelle': 'Déplacement en lot',
+                'prix': 25.0,
+                'quantite': 1.0,
+            }
+        )
+        janvier, fevrier = self._periodes()[:2]
+
+        (self.souscription_base | self.souscription_hphc).creer_factures()
+
+        presta = self.souscription_base.refacturation_ids
+        self.assertEqual(presta.facture_id, janvier.facture_id, 'rassemblée sur la première facture')
+        self.assertTrue(janvier.facture_id.invoice_line_ids.filtered(lambda l: l.name == 'Déplacement en lot'))
+        self.assertFalse(fevrier.facture_id.invoice_line_ids.filtered(lambda l: l.name == 'Déplacement en lot'))
+        self.assertEqual(len(self.souscription_hphc.facture_ids), 1)
+
+    def test_composition_en_echec_nomme_la_periode(self):
+        periodes = self._periodes()
+        GrillePrix = type(self.env['grille.prix'])
+        with (
+            patch.object(GrillePrix, 'get_grille_active', side_effect=UserError('Aucune grille de prix')),
+            self.assertRaisesRegex(UserError, periodes[0].mois_annee),
+        ):
+            periodes._creer_factures_lot()
+        self.assertFalse(periodes.facture_id)
+
+
+@tagged('souscriptions', 'souscriptions_periode_facture', 'post_install', '-at_install')
+class TestPeriodeFacturesEmissionLot(SouscriptionsTestCase):
+    """Émission d'un paquet (`account.move._post()` sur N brouillons) : tampon
+    groupé, une passe de re-génération, une recherche des chèques — même
+    résultat, facture par facture, qu'une émission une à une."""
+
+    def test_emission_en_lot_tamponne_et_regenere_chaque_facture(self):
+        janvier = self.create_test_periode(self.souscription_base, energie_base_kwh=120.0)
+        fevrier = self.create_test_periode(
+            self.souscription_base, date_debut=date(2024, 2, 1), date_fin=date(2024, 2, 29), energie_base_kwh=90.0
+        )
+        factures = (janvier | fevrier)._creer_factures_lot()
+        self.assertFalse(janvier.lisse_periode)
+        produit = self.env.ref('souscriptions_odoo.souscriptions_product_energie_base')
+        factures[0].write(
+            {'invoice_line_ids': [(0, 0, {'product_id': produit.id, 'name': 'Geste commercial', 'price_unit': -5.0})]}
+        )
+
+        factures.action_post()
+
+        self.assertEqual(set(factures.mapped('state')), {'posted'})
+        self.assertEqual(janvier.provision_base_kwh, 120.0)
+        self.assertEqual(fevrier.provision_base_kwh, 90.0)
+        for facture, kwh in ((factures[0], 120.0), (factures[1], 90.0)):
+            ligne = facture.invoice_line_ids.filtered(lambda l: l.name == 'Énergie Base')
+            self.assertEqual(ligne.quantity, kwh)
+        self.assertTrue(factures[0].invoice_line_ids.filtered(lambda l: l.name == 'Geste commercial'))
+
+    def test_emission_en_lot_une_seule_resolution_de_grille_par_mois(self):
+        periodes = self.create_test_periode(self.souscription_base) | self.create_test_periode(self.souscription_hphc)
+        factures = periodes._creer_factures_lot()
+        GrillePrix = type(self.env['grille.prix'])
+        resolutions = []
+        natif = GrillePrix.get_grille_active
+
+        def get_grille_active(modele, *args, **kwargs):
+            resolutions.append(args)
+            return natif(modele, *args, **kwargs)
+
+        with patch.object(GrillePrix, 'get_grille_active', get_grille_active):
+            factures._recomposer_lignes_generees()
+
+        self.assertEqual(len(resolutions), len({(p.regime_prix_periode, p.date_debut) for p in periodes}))
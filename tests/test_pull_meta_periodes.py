@@ -23,7 +23,7 @@ Fixtures RSC/PDL : identifiants factices (jamais des vrais échantillons).
 
 import unittest
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from odoo.addons.souscriptions_odoo.models.core import electricore_client_fabrique as fabrique_module
 from odoo.addons.souscriptions_odoo.models.core import souscription_pull_meta_periodes_service as service_module
@@ -215,6 +215,60 @@ class TestRafraichirDepuisMeta(SouscriptionsTestCase):
         self.assertEqual(len(periode.releve_ids), 1)
         self.assertEqual(periode.releve_ids.releve_externe_id, 'R2')
 
+    def test_releves_rapproches_par_identifiant_externe(self):
+        """Re-pull : relevé inchangé intact (même ligne, aucune écriture),
+        relevé modifié mis à jour sur place, nouveau créé, disparu supprimé —
+        plus de suppression/recréation en bloc."""
+        periode = self.env['souscription.periode']._amorcer_depuis_meta(
+            self.souscription_base,
+            _periode_meta(
+                releves_utilises=[
+                    _objet_releve(releve_id='R1', index_base_kwh=1000),
+                    _objet_releve(releve_id='R2', index_base_kwh=1310),
+                    _objet_releve(releve_id='R3', index_base_kwh=1400),
+                ]
+            ),
+        )
+        avant = {r.releve_externe_id: r for r in periode.releve_ids}
+        Releve = type(self.env['souscription.releve'])
+
+        with patch.object(Releve, 'write', autospec=True, side_effect=Releve.write) as write:
+            periode._rafraichir_depuis_meta(
+                _periode_meta(
+                    source_hash='H2',
+                    releves_utilises=[
+                        _objet_releve(releve_id='R1', index_base_kwh=1000),
+                        _objet_releve(releve_id='R2', index_base_kwh=1320),
+                        _objet_releve(releve_id='R4', index_base_kwh=1500),
+                    ],
+                )
+            )
+
+        apres = {r.releve_externe_id: r for r in periode.releve_ids}
+        self.assertEqual(sorted(apres), ['R1', 'R2', 'R4'])
+        self.assertEqual(apres['R1'], avant['R1'])
+        self.assertEqual(apres['R2'], avant['R2'], 'mis à jour sur place')
+        self.assertEqual(apres['R2'].index_base, 1320)
+        self.assertFalse(avant['R3'].exists())
+        self.assertEqual([appel.args[0] for appel in write.call_args_list], [avant['R2']])
+        self.assertEqual(write.call_args.args[1], {'index_base': 1320})
+
+    def test_releve_identique_a_la_forme_de_cache_pres_jamais_reecrit(self):
+        """Index flottants sur des champs Integer, optionnels à None : la
+        charge diffère des valeurs en cache sans rien changer — aucune
+        écriture au re-pull."""
+        releve = {'releve_id': 'R1', 'index_base_kwh': 1000.0, 'index_hp_kwh': None, 'famille_cadrans': None}
+        periode = self.env['souscription.periode']._amorcer_depuis_meta(
+            self.souscription_base, _periode_meta(releves_utilises=[_objet_releve(**releve)])
+        )
+        Releve = type(self.env['souscription.releve'])
+
+        with patch.object(Releve, 'write', autospec=True, side_effect=Releve.write) as write:
+            periode._rafraichir_depuis_meta(_periode_meta(source_hash='H2', releves_utilises=[_objet_releve(**releve)]))
+
+        write.assert_not_called()
+        self.assertEqual(periode.releve_ids.index_base, 1000)
+
     def test_provisions_et_releves_intacts_si_emise(self):
         """AC2/AC5 (condition dérivée amendée #267) : Période ÉMISE (facture
         postée) -> le mesuré est rafraîchi mais la provision (facturé gelé)
@@ -274,6 +328,7 @@ class TestRafraichirDepuisMeta(SouscriptionsTestCase):
         self.assertEqual(ligne.quantity, 280.0)
 
         periode._rafraichir_depuis_meta(_periode_meta(source_hash='H2', energie_base_kwh=310.0, qualite='réelle'))
+        self.vider_recompositions()
 
         ligne_apres = facture.invoice_line_ids.filtered(lambda l: l.name == 'Énergie Base')
         self.assertEqual(ligne_apres.quantity, 310.0, 'le brouillon a été recomposé avec le mesuré rafraîchi')
@@ -562,6 +617,135 @@ class TestPullMetaPeriodesService(SouscriptionsTestCase):
         self.assertFalse(erreurs)
 
 
+@tagged('souscriptions', 'souscriptions_pull_meta', 'post_install', '-at_install')
+class TestPullMetaPeriodesIndexMois(SouscriptionsTestCase):
+    """Index des Périodes du mois (`_indexer_periodes`) : une requête avant
+    le flux au lieu d'une recherche par meta — le coût en requêtes d'un
+    pull sans écriture ne croît plus avec une recherche par meta."""
+
+    def _souscriptions(self, nombre):
+        souscriptions = self.env['souscription.souscription'].create(
+            [
+                {
+                    'partner_id': self.partner_test.id,
+                    'pdl': f'PDL_IDX_{i:03d}',
+                    'puissance_souscrite': '6',
+                    'type_tarif': 'base',
+                    'date_debut': date(2024, 1, 1),
+                }
+                for i in range(nombre)
+            ]
+        )
+        for i, souscription in enumerate(souscriptions):
+            souscription.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': f'RSC-IDX-{i:03d}'})
+        return souscriptions
+
+    def _metas(self, souscriptions):
+        return [_periode_meta(ref_situation_contractuelle=s.ref_situation_contractuelle) for s in souscriptions]
+
+    def _requetes_du_pull_sans_ecriture(self, souscriptions):
+        Service = self.env['souscription.pull.meta.periodes.service']
+        with patcher_client_fabrique(client_flux_factice('meta_periodes', self._metas(souscriptions))):
+            Service.pull(souscriptions, date(2024, 1, 1))  # amorce : crée les Périodes
+            self.env.flush_all()
+            self.env.invalidate_all()
+            avant = self.env.cr.sql_log_count
+            _creees, _rafraichies, inchangees, _conservees, _erreurs = Service.pull(souscriptions, date(2024, 1, 1))
+        self.assertEqual(len(inchangees), len(souscriptions))
+        return self.env.cr.sql_log_count - avant
+
+    def test_recherches_en_nombre_constant(self):
+        petit = self._requetes_du_pull_sans_ecriture(self._souscriptions(2))
+        grand = self._requetes_du_pull_sans_ecriture(self._souscriptions(12))
+
+        self.assertLessEqual(
+            (grand - petit) / 10, 2, 'par meta : SAVEPOINT/RELEASE seulement, aucune recherche de Période'
+        )
+
+    def test_index_suit_les_creations_du_flux(self):
+        """Une RSC revenue deux fois dans le même flux ne crée qu'une Période :
+        la seconde meta lit la création de la première dans l'index."""
+        souscription = self._souscriptions(1)
+        metas = self._metas(souscription) * 2
+
+        with patcher_client_fabrique(client_flux_factice('meta_periodes', metas)):
+            creees, _rafraichies, inchangees, _conservees, _erreurs = self.env[
+                'souscription.pull.meta.periodes.service'
+            ].pull(souscription, date(2024, 1, 1))
+
+        self.assertEqual(len(creees), 1)
+        self.assertEqual(len(inchangees), 1)
+        self.assertEqual(len(souscription.periode_ids), 1)
+
+
+@tagged('souscriptions', 'souscriptions_pull_meta', 'post_install', '-at_install')
+class TestPullMetaPeriodesParLots(SouscriptionsTestCase):
+    """Application par lots (`_appliquer_lot`) : un savepoint et un
+    `create(vals_list)` par lot, repli élément par élément sur échec — le
+    rapport à cinq listes ne change pas."""
+
+    def setUp(self):
+        super().setUp()
+        self.souscriptions = self.env['souscription.souscription'].create(
+            [
+                {
+                    'partner_id': self.partner_test.id,
+                    'pdl': f'PDL_LOT_{i:03d}',
+                    'puissance_souscrite': '6',
+                    'type_tarif': 'base',
+                    'date_debut': date(2024, 1, 1),
+                }
+                for i in range(5)
+            ]
+        )
+        for i, souscription in enumerate(self.souscriptions):
+            souscription.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': f'RSC-LOT-{i:03d}'})
+        self.metas = [
+            _periode_meta(ref_situation_contractuelle=s.ref_situation_contractuelle) for s in self.souscriptions
+        ]
+
+    def _pull(self, metas):
+        Periode = type(self.env['souscription.periode'])
+        with (
+            patcher_client_fabrique(client_flux_factice('meta_periodes', metas)),
+            patch.object(
+                Periode, '_amorcer_depuis_metas', autospec=True, side_effect=Periode._amorcer_depuis_metas
+            ) as amorcer,
+        ):
+            resultat = self.env['souscription.pull.meta.periodes.service'].pull(self.souscriptions, date(2024, 1, 1))
+        return resultat, amorcer
+
+    def test_un_seul_create_par_lot(self):
+        (creees, *_autres, erreurs), amorcer = self._pull(self.metas)
+
+        self.assertEqual(len(creees), 5)
+        self.assertFalse(erreurs)
+        amorcer.assert_called_once()
+        self.assertEqual(len(amorcer.call_args.args[1]), 5)
+        self.assertEqual(len(self.souscriptions.periode_ids), 5)
+
+    def test_taille_de_lot_configurable(self):
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.pull_meta_taille_lot', '2')
+
+        (creees, *_autres), amorcer = self._pull(self.metas)
+
+        self.assertEqual(len(creees), 5)
+        self.assertEqual([len(appel.args[1]) for appel in amorcer.call_args_list], [2, 2, 1])
+
+    def test_echec_dans_le_lot_retombe_a_l_element(self):
+        """Une meta invalide annule son lot, rejoué élément par élément :
+        seule la fautive part en erreur, les autres Périodes sont créées."""
+        self.metas[2] = _periode_meta(ref_situation_contractuelle='RSC-LOT-002', debut=None)
+
+        (creees, rafraichies, inchangees, conservees, erreurs), _amorcer = self._pull(self.metas)
+
+        self.assertEqual(len(creees), 4)
+        self.assertEqual([e[2] for e in erreurs], [self.souscriptions[2].id])
+        self.assertFalse(rafraichies or inchangees or conservees)
+        self.assertEqual(len(self.souscriptions.periode_ids), 4)
+        self.assertFalse(self.souscriptions[2].periode_ids)
+
+
 # === Scope refresh (#235 AC6) : plage de mois, création désactivée — testé à
 # la couture transport (un appel de flux par mois, mêmes arguments que
 # pull()). Consommé par la Régularisation à la tranche 4 du PRD #231.
@@ -14,7 +14,7 @@ candidats.
 """
 
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from odoo.exceptions import UserError, ValidationError
 from odoo.tests.common import tagged
@@ -286,6 +286,88 @@ class TestRegularisationCandidats(SouscriptionsTestCase):
         self.assertAlmostEqual(regularisation.ligne_ids.ecart_kwh, ecart_1, places=2)
         self.assertAlmostEqual(regularisation.ligne_ids.montant, montant_1, places=2)
 
+    # --- Recalcul en lot : un flux par mois pour toutes les Souscriptions ---
+
+    def test_lot_un_flux_par_mois_pour_toutes_les_souscriptions(self):
+        self._grille_moulin(name='Grille LOT')
+        regularisations = self.env['souscription.regularisation']
+        for i in range(3):
+            souscription = self._souscription_lissee(ref=f'RSC-REGUL-LOT{i}', pdl=f'PDL_REGUL_LOT{i}')
+            for m in (1, 2):
+                self._periode_facturee(souscription, m, energie_base_kwh=220.0)
+            regularisations |= self.env['souscription.regularisation'].create({'souscription_id': souscription.id})
+
+        client = client_flux_factice('meta_periodes', [])
+        with patcher_client_fabrique(client):
+            echecs = regularisations._recalculer_en_lot()
+
+        self.assertFalse(echecs)
+        appels = client.meta_periodes.call_args_list
+        self.assertEqual([appel.kwargs['mois'] for appel in appels], ['2024-01-01', '2024-02-01'])
+        self.assertTrue(all(len(appel.kwargs['rsc']) == 3 for appel in appels), 'toutes les Souscriptions du mois')
+        for regularisation in regularisations:
+            self.assertAlmostEqual(regularisation.ligne_ids.ecart_kwh, 40.0, places=2)
+
+    def test_lot_fraicheur_par_souscription_et_mois(self):
+        """Un même flux rafraîchit une Souscription et en conserve une
+        autre (RSC absente) : seule la seconde est « estimation locale »."""
+        self._grille_moulin(name='Grille LOT FRAICHEUR')
+        fraiche = self._souscription_lissee(ref='RSC-REGUL-FRAICHE', pdl='PDL_REGUL_FRAICHE')
+        conservee = self._souscription_lissee(ref='RSC-REGUL-CONSERVEE', pdl='PDL_REGUL_CONSERVEE')
+        for souscription in (fraiche, conservee):
+            self._periode_facturee(souscription, 1, energie_base_kwh=220.0)
+        regularisations = self.env['souscription.regularisation'].create(
+            [{'souscription_id': fraiche.id}, {'souscription_id': conservee.id}]
+        )
+        meta = periode_meta(
+            ref_situation_contractuelle='RSC-REGUL-FRAICHE',
+            debut='2024-01-01',
+            fin='2024-02-01',
+            mois_annee='2024-01',
+            energie_base_kwh=220.0,
+            turpe_fixe_eur=0.0,
+            turpe_variable_eur=0.0,
+            cta_eur=0.0,
+            taux_accise_eur_mwh=0.0,
+            source_hash='H-LOT',
+        )
+
+        with patcher_client_fabrique(client_flux_factice('meta_periodes', [meta])):
+            regularisations._recalculer_en_lot()
+
+        self.assertNotIn('estimation locale', regularisations[0].ligne_ids.detail)
+        self.assertIn('estimation locale', regularisations[1].ligne_ids.detail)
+
+    def test_lot_echec_du_flux_partage_seule_la_fautive_est_rapportee(self):
+        """Une Souscription qui fait tomber le flux partagé (erreur autre
+        qu'une UserError) : le lot retombe sur le rafraîchissement unitaire,
+        les autres Régularisations sont calculées."""
+        self._grille_moulin(name='Grille LOT ECHEC')
+        saine = self._souscription_lissee(ref='RSC-REGUL-SAINE', pdl='PDL_REGUL_SAINE')
+        fautive = self._souscription_lissee(ref='RSC-REGUL-FAUTIVE', pdl='PDL_REGUL_FAUTIVE')
+        for souscription in (saine, fautive):
+            self._periode_facturee(souscription, 1, energie_base_kwh=220.0)
+        regularisations = self.env['souscription.regularisation'].create(
+            [{'souscription_id': saine.id}, {'souscription_id': fautive.id}]
+        )
+        Service = type(self.env['souscription.pull.meta.periodes.service'])
+        refresh = Service.refresh
+
+        def refresh_fragile(service, souscriptions, *args, **kwargs):
+            if fautive in souscriptions:
+                raise RuntimeError('flux illisible')
+            return refresh(service, souscriptions, *args, **kwargs)
+
+        with (
+            patch.object(Service, 'refresh', refresh_fragile),
+            patcher_client_fabrique(client_flux_factice('meta_periodes', [])),
+        ):
+            echecs = regularisations._recalculer_en_lot()
+
+        self.assertEqual([regul for regul, _exc in echecs], [regularisations[1]])
+        self.assertIn('flux illisible', str(echecs[0][1]))
+        self.assertAlmostEqual(regularisations[0].ligne_ids.ecart_kwh, 20.0, places=2)
+
 
 @tagged('souscriptions', 'souscriptions_regularisation', 'post_install', '-at_install')
 class TestRegularisationBouton(SouscriptionsTestCase):
@@ -471,6 +553,7 @@ class TestRegularisationEtatEtVerrou(SouscriptionsTestCase):
         self.assertTrue(facture.invoice_line_ids.filtered(lambda l: l.product_id))
 
         regularisation.action_recalculer()
+        self.vider_recompositions()
 
         self.assertFalse(regularisation.ligne_ids, 'aucun candidat réel : le recalcul vide les lignes')
         self.assertFalse(
@@ -268,12 +268,12 @@ class TestRegularisationFactureRegenerationEmission(SouscriptionsTestCase):
     def test_lignes_generees_recomposees_a_l_emission(self):
         regularisation = self._regularisation_avec_ecart()
         facture = regularisation._creer_facture()
-        ids_avant = set(facture.invoice_line_ids.filtered('souscription_ligne_generee').ids)
+        ids_avant = facture.invoice_line_ids.filtered('souscription_ligne_generee').ids
 
         facture.action_post()
 
-        ids_apres = set(facture.invoice_line_ids.filtered('souscription_ligne_generee').ids)
-        self.assertFalse(ids_avant & ids_apres, 'les anciennes lignes générées sont supprimées, pas réutilisées')
+        ids_apres = facture.invoice_line_ids.filtered('souscription_ligne_generee').ids
+        self.assertEqual(ids_avant, ids_apres, 'source inchangée : lignes générées conservées, pas recréées')
         lignes_produit = facture.invoice_line_ids.filtered(lambda l: l.display_type == 'product')
         self.assertEqual(len(lignes_produit), 1)
 
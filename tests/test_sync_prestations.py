@@ -12,6 +12,7 @@ Décisions du grill 2026-07-08 (cf. issue #147) : résolution par RSC seule
 la *Référence de contenu* EST le contenu), `montant_ht` ignoré.
 """
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -195,6 +196,7 @@ class TestSyncPrestations(SouscriptionsTestCase):
         self.assertFalse(facture.invoice_line_ids.filtered(lambda l: l.name == 'Mise en service'))
 
         self._sync([_ligne(reference='ref-au-fil-de-leau')])
+        self.vider_recompositions()
 
         ligne = facture.invoice_line_ids.filtered(lambda l: l.name == 'Mise en service')
         self.assertEqual(len(ligne), 1)
@@ -208,6 +210,7 @@ class TestSyncPrestations(SouscriptionsTestCase):
         facture.action_post()
 
         self._sync([_ligne(reference='ref-apres-emission')])
+        self.vider_recompositions()
 
         self.assertFalse(facture.invoice_line_ids.filtered(lambda l: l.name == 'Mise en service'))
         self.assertFalse(self._prestas('ref-apres-emission').facture_id, 'reste en file, pas rassemblée après coup')
@@ -258,6 +261,34 @@ class TestSyncPrestations(SouscriptionsTestCase):
         self.assertFalse(ignorees)
         self.assertFalse(erreurs)
 
+    def test_flux_lot_par_lot_insere_avant_le_lot_suivant(self):
+        """Mémoire bornée : un lot de RSC tiré, inséré et signalé à
+        `progression` avant que le suivant ne soit tiré — jamais tout
+        l'historique F15 en une liste."""
+        self.souscription_hphc.with_context(rsc_automatisme=True).write(
+            {'ref_situation_contractuelle': 'RSC_SYNC_HPHC'}
+        )
+        rscs = self.Refacturation._rscs_a_tirer()
+        vues = []
+
+        def tirer(client, lot, connues=None):
+            vues.append(set(self.Refacturation.search([]).mapped('reference')))
+            return [_ligne(reference=f'ref-{rsc}', ref_situation_contractuelle=rsc) for rsc in lot]
+
+        progression = MagicMock()
+        with (
+            patch.object(refacturation_module, 'TAILLE_LOT_RSC', 1),
+            patcher_transport(refacturation_module.SouscriptionRefacturation, '_tirer_prestations', side_effect=tirer),
+        ):
+            creees, _ignorees, _erreurs = self.Refacturation._synchroniser_depuis_electricore_donnees(
+                progression=progression
+            )
+
+        self.assertEqual(len(vues), len(rscs), 'un tirage par lot')
+        self.assertIn(f'ref-{rscs[0]}', vues[1], 'lot 1 inséré avant le tirage du lot 2')
+        self.assertLessEqual({'ref-RSC_SYNC_BASE', 'ref-RSC_SYNC_HPHC'}, set(creees))
+        self.assertEqual([appel.args for appel in progression.call_args_list], [(1,)] * len(rscs))
+
     def test_contract_version_error_mappee_en_userror(self):
         """Contrat obsolète -> erreur dure actionnable (UserError), pas de
         traceback brut pour le·la facturiste."""
@@ -332,3 +363,139 @@ class TestTirerPrestations(SouscriptionsTestCase):
         lots_demandes = [call.kwargs['rsc'] for call in client.prestations.call_args_list]
         self.assertEqual([len(lot) for lot in lots_demandes], [1, 1])
         self.assertEqual({ligne['reference'] for ligne in lignes}, {'ref-base', 'ref-hphc'})
+
+
+@tagged('souscriptions', 'souscriptions_sync_prestations', 'post_install', '-at_install')
+class TestSyncPrestationsIncrementale(SouscriptionsTestCase):
+    """Sync F15 incrémentale (opt-in) : empreintes des références connues
+    par RSC, lignes connues sautées au fil du flux, réconciliation complète
+    périodique (ou forcée)."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patcher_client_fabrique(MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.souscription_base.with_context(rsc_automatisme=True).write(
+            {'ref_situation_contractuelle': 'RSC_SYNC_BASE'}
+        )
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.f15_incrementale', 'True')
+        self.Refacturation = self.env['souscription.refacturation']
+        self.Empreinte = self.env['souscription.refacturation.empreinte']
+
+    def _sync(self, lignes, **kwargs):
+        with patcher_transport(
+            refacturation_module.SouscriptionRefacturation, '_tirer_prestations', return_value=lignes
+        ) as tirer:
+            resultat = self.Refacturation._synchroniser_depuis_electricore_donnees(**kwargs)
+        return resultat, [appel.kwargs['connues'] for appel in tirer.call_args_list]
+
+    def _empreinte(self):
+        return self.Empreinte.search([('ref_situation_contractuelle', '=', 'RSC_SYNC_BASE')])
+
+    def test_premier_passage_reconcilie_puis_passages_incrementaux(self):
+        (creees, _ignorees, _erreurs), connues = self._sync([_ligne(reference='ref-a')])
+
+        self.assertEqual(creees, ['ref-a'])
+        self.assertTrue(all(c is None for c in connues), 'sans empreinte : lot tiré en entier')
+        empreinte = self._empreinte()
+        self.assertEqual(empreinte.nb_references, 1)
+        self.assertTrue(empreinte.date_reconciliation)
+
+        (creees, *_autres), connues = self._sync([_ligne(reference='ref-b')])
+
+        self.assertIn(refacturation_module.empreinte_reference('ref-a'), connues[0])
+        self.assertEqual(creees, ['ref-b'])
+        self.assertEqual(self._empreinte().nb_references, 2, 'la ligne créée rejoint les empreintes')
+
+    def test_reconciliation_perimee_ou_forcee_tire_tout(self):
+        self._sync([_ligne(reference='ref-a')])
+
+        _resultat, connues = self._sync([], complet=True)
+        self.assertTrue(all(c is None for c in connues))
+
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.f15_reconciliation_jours', '-1')
+        _resultat, connues = self._sync([])
+        self.assertTrue(all(c is None for c in connues))
+
+    def test_reconciliation_recalcule_depuis_la_base(self):
+        """Une prestation supprimée à la main sort de l'empreinte à la
+        réconciliation : elle sera ré-insérée, comme en sync complète."""
+        self._sync([_ligne(reference='ref-a')])
+        self.Refacturation.search([('reference', '=', 'ref-a')]).unlink()
+
+        self._sync([], complet=True)
+
+        self.assertEqual(self._empreinte().nb_references, 0)
+
+    def test_lignes_connues_sautees_avant_model_dump(self):
+        connue = MagicMock(reference='ref-connue')
+        nouvelle = MagicMock(reference='ref-nouvelle')
+        nouvelle.model_dump.return_value = _ligne(reference='ref-nouvelle')
+        client = MagicMock()
+        client.prestations.side_effect = lambda **kwargs: flux_electricore([connue, nouvelle])
+
+        lignes = self.Refacturation._tirer_prestations(
+            client, ['RSC_SYNC_BASE'], connues={refacturation_module.empreinte_reference('ref-connue')}
+        )
+
+        self.assertEqual([ligne['reference'] for ligne in lignes], ['ref-nouvelle'])
+        connue.model_dump.assert_not_called()
+
+
+@tagged('souscriptions', 'souscriptions_sync_prestations', 'post_install', '-at_install')
+class TestSyncPrestationsConcurrente(SouscriptionsTestCase):
+    """Tirage concurrent des lots F15 (`souscriptions.f15_concurrence`) :
+    lots tirés dans un pool de fils, insérés dans l'ordre par le seul fil
+    principal — même gabarit `(creees, ignorees, erreurs)`."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patcher_client_fabrique(MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for sous, rsc in ((self.souscription_base, 'RSC_SYNC_BASE'), (self.souscription_hphc, 'RSC_SYNC_HPHC')):
+            sous.with_context(rsc_automatisme=True).write({'ref_situation_contractuelle': rsc})
+        self.env['ir.config_parameter'].sudo().set_param('souscriptions.f15_concurrence', '3')
+        self.Refacturation = self.env['souscription.refacturation']
+        self.rscs = self.Refacturation._rscs_a_tirer()
+        self.fils = []
+
+    def _tirer(self, client, lot, connues=None):
+        self.fils.append(threading.get_ident())
+        return [_ligne(reference=f'ref-{rsc}', ref_situation_contractuelle=rsc) for rsc in lot]
+
+    def _sync(self, side_effect):
+        with (
+            patch.object(refacturation_module, 'TAILLE_LOT_RSC', 1),
+            patcher_transport(
+                refacturation_module.SouscriptionRefacturation, '_tirer_prestations', side_effect=side_effect
+            ),
+        ):
+            return self.Refacturation._synchroniser_depuis_electricore_donnees()
+
+    def test_lots_tires_dans_des_fils_inseres_dans_l_ordre(self):
+        creees, _ignorees, erreurs = self._sync(self._tirer)
+
+        self.assertEqual(len(self.fils), len(self.rscs))
+        self.assertNotIn(threading.get_ident(), self.fils, 'hors du fil principal')
+        rangs = [self.rscs.index(ref.removeprefix('ref-')) for ref in creees]
+        self.assertEqual(rangs, sorted(rangs), "insertion dans l'ordre des lots")
+        self.assertLessEqual({'ref-RSC_SYNC_BASE', 'ref-RSC_SYNC_HPHC'}, set(creees))
+        self.assertFalse([e for e in erreurs if 'RSC_SYNC' in e[0]])
+
+    def test_echec_d_un_lot_traduit_lots_precedents_inseres(self):
+        rang_hphc = self.rscs.index('RSC_SYNC_HPHC')
+
+        def tirer(client, lot, connues=None):
+            if lot == ['RSC_SYNC_HPHC']:
+                raise refacturation_module.ContractVersionError('serveur v0 < attendu v1')
+            return self._tirer(client, lot, connues)
+
+        with self.assertRaises(UserError) as cm:
+            self._sync(tirer)
+
+        self.assertIn('v0', str(cm.exception))
+        inseres = set(self.Refacturation.search([]).mapped('reference'))
+        self.assertLessEqual({f'ref-{rsc}' for rsc in self.rscs[:rang_hphc]}, inseres)
+        self.assertNotIn('ref-RSC_SYNC_HPHC', inseres)